@@ -0,0 +1,308 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+from array import array
+
+from ..Types.Subroutine import EntryWorkspace
+from ..Utils.Parsers import splitTarget
+
+##############################################################################
+#CONSTANTS
+##############################################################################
+#kinds of call graph edges
+CALL_EDGE=1      #Call step, in the workspace or any subflow it invokes
+EXCEPTION_EDGE=2 #exception handler map entry
+
+##############################################################################
+#CLASSES
+##############################################################################
+#calls between the workspaces of an app object
+#  workspaces are numbered by their index in workspaces
+#  callees of workspace i are calleeIndices[calleeOffsets[i]:calleeOffsets[i+1]]
+#    with the kind of each edge in edgeKinds at the same position
+#  callers are kept the same way in callerOffsets/callerIndices
+#  targets are resolved by anchor name 1st, then by workspace name
+#  built only from Call steps and exception handler maps, not from the
+#    calledBy and exceptionWorkspaces the "Workspace List" table gives each
+#    workspace: those are missing when the table is, name workspaces by name
+#    only, and are Edify's own summary, which can be out of date
+#    listedDiffs() checks them against the steps instead
+class CallGraph:
+  def __init__(self, workspaces):
+    self.workspaces = workspaces
+    
+    #dict[workspace name or anchor name, index of workspace]
+    self.nameIndex = {ws.name: i for i, ws in enumerate(workspaces)}
+    self.refIndex  = {ws.ref: i for i, ws in enumerate(workspaces) if ws.ref}
+    
+    self.calleeOffsets = array('l', [0])
+    self.calleeIndices = array('l')
+    self.edgeKinds     = array('b')
+    self.callerOffsets = array('l', [0])
+    self.callerIndices = array('l')
+    
+    #list of (index of workspace, target) that name no workspace
+    self.unresolved = []
+    
+    self.__build()
+  #end __init__(self, workspaces)
+  
+  ########################
+  # STATIC/CLASS METHODS #
+  ########################
+  #----------------------------------------------------------------------------
+  @classmethod
+  def fromAppObj(CallGraphObjClass, appObj):
+    return CallGraphObjClass(appObj.subroutines)
+  #end fromAppObj(CallGraphObjClass, appObj)
+  
+  #----------------------------------------------------------------------------
+  #yields steps of flow and of every subflow it invokes (directly or not)
+  #  each subflow only once
+  @staticmethod
+  def iterFlowSteps(flow):
+    seenSubflows = set()
+    toVisit = [flow]
+    #loop thru flows not visited yet
+    while toVisit:
+      flow = toVisit.pop()
+      yield from flow.steps or []
+      
+      #loop thru subflows invoked by flow
+      for subflow in flow.subflows or []:
+        if id(subflow) not in seenSubflows:
+          seenSubflows.add(id(subflow))
+          toVisit.append(subflow)
+      #end loop thru subflows invoked by flow
+    #end loop thru flows not visited yet
+  #end iterFlowSteps(flow)
+  
+  ####################
+  # INSTANCE METHODS #
+  ####################
+  #----------------------------------------------------------------------------
+  def __build(self):
+    callerLsts = [[] for _ in self.workspaces]
+    
+    #loop thru workspaces to add their callees
+    for i, ws in enumerate(self.workspaces):
+      #dict[index of callee, edge kind], 1st kind found wins
+      callees = {}
+      
+      #loop thru Call steps
+      for step in CallGraph.iterFlowSteps(ws):
+        if step.type == 'Call':
+          self.__addCallee(i, step.target, CALL_EDGE, callees)
+      #end loop thru Call steps
+      
+      #loop thru exception handlers
+      for handler in (getattr(ws, 'exceptionHandlerMap', None) or {}).values():
+        self.__addCallee(i, handler, EXCEPTION_EDGE, callees)
+      #end loop thru exception handlers
+      
+      #loop thru callees in the order found
+      for j, kind in callees.items():
+        self.calleeIndices.append(j)
+        self.edgeKinds.append(kind)
+        callerLsts[j].append(i)
+      #end loop thru callees in the order found
+      
+      self.calleeOffsets.append(len(self.calleeIndices))
+    #end loop thru workspaces to add their callees
+    
+    #loop thru callers of each workspace to pack them
+    for callers in callerLsts:
+      self.callerIndices.extend(callers)
+      self.callerOffsets.append(len(self.callerIndices))
+    #end loop thru callers of each workspace to pack them
+  #end __build(self)
+  
+  #----------------------------------------------------------------------------
+  def __addCallee(self, i, target, kind, callees):
+    name, anchor = splitTarget(target)
+    j = self.refIndex.get(anchor)
+    if j is None:
+      j = self.nameIndex.get(name)
+    
+    if j is None:
+      self.unresolved.append((i, target))
+    elif j not in callees:
+      callees[j] = kind
+  #end __addCallee(self, i, target, kind, callees)
+  
+  #----------------------------------------------------------------------------
+  #returns indexes of workspaces workspace i calls or hands exceptions to
+  def callees(self, i):
+    return self.calleeIndices[self.calleeOffsets[i]:self.calleeOffsets[i + 1]]
+  #end callees(self, i)
+  
+  #----------------------------------------------------------------------------
+  #returns indexes of workspaces that call or hand exceptions to workspace i
+  def callers(self, i):
+    return self.callerIndices[self.callerOffsets[i]:self.callerOffsets[i + 1]]
+  #end callers(self, i)
+  
+  #----------------------------------------------------------------------------
+  #returns list of strongly connected components, each a list of indexes
+  #  callees' components come before their callers' (reverse topological)
+  #  iterative Tarjan, so deep call chains don't hit the recursion limit
+  def stronglyConnectedComponents(self):
+    numWs   = len(self.workspaces)
+    order   = [-1] * numWs #visit order of each workspace, -1 if not visited
+    lowLink = [0] * numWs
+    onStack = bytearray(numWs)
+    stack   = []
+    sccs    = []
+    counter = 0
+    
+    #loop thru workspaces to start a search from each unvisited one
+    for root in range(numWs):
+      if order[root] != -1:
+        continue
+      
+      #stack of (workspace, position in its callees to look at next)
+      work = [(root, self.calleeOffsets[root])]
+      order[root] = lowLink[root] = counter
+      counter += 1
+      stack.append(root)
+      onStack[root] = 1
+      
+      #loop thru search
+      while work:
+        i, pos = work[-1]
+        #if callees of i left to look at
+        if pos < self.calleeOffsets[i + 1]:
+          work[-1] = (i, pos + 1)
+          j = self.calleeIndices[pos]
+          if order[j] == -1:
+            order[j] = lowLink[j] = counter
+            counter += 1
+            stack.append(j)
+            onStack[j] = 1
+            work.append((j, self.calleeOffsets[j]))
+          elif onStack[j]:
+            lowLink[i] = min(lowLink[i], order[j])
+          continue
+        #end if callees of i left to look at
+        
+        work.pop()
+        if work:
+          parent = work[-1][0]
+          lowLink[parent] = min(lowLink[parent], lowLink[i])
+        
+        #if i is the root of a component
+        if lowLink[i] == order[i]:
+          scc = []
+          while True:
+            j = stack.pop()
+            onStack[j] = 0
+            scc.append(j)
+            if j == i:
+              break
+          sccs.append(scc)
+        #end if i is the root of a component
+      #end loop thru search
+    #end loop thru workspaces to start a search from each unvisited one
+    
+    return sccs
+  #end stronglyConnectedComponents(self)
+  
+  #----------------------------------------------------------------------------
+  #returns list of components (lists of indexes) that are recursive
+  #  more than one workspace or one workspace that calls itself
+  def recursiveComponents(self):
+    return [
+      scc for scc in self.stronglyConnectedComponents()
+      if len(scc) > 1 or scc[0] in self.callees(scc[0])
+    ]
+  #end recursiveComponents(self)
+  
+  #----------------------------------------------------------------------------
+  #returns list of indexes of all workspaces, callers before callees
+  #  workspaces in the same recursive component are next to each other
+  def topologicalOrder(self):
+    order = []
+    #loop thru components from callers to callees
+    for scc in reversed(self.stronglyConnectedComponents()):
+      order.extend(sorted(scc))
+    #end loop thru components from callers to callees
+    return order
+  #end topologicalOrder(self)
+  
+  #----------------------------------------------------------------------------
+  #returns bytearray where [i] is 1 if workspace i can be reached from roots
+  #  roots defaults to the indexes of entry workspaces
+  def reachable(self, roots=None):
+    if roots is None:
+      roots = [
+        i for i, ws in enumerate(self.workspaces)
+        if isinstance(ws, EntryWorkspace)
+      ]
+    
+    seen = bytearray(len(self.workspaces))
+    toVisit = []
+    #loop thru roots to mark them
+    for i in roots:
+      if not seen[i]:
+        seen[i] = 1
+        toVisit.append(i)
+    #end loop thru roots to mark them
+    
+    #loop thru workspaces reached but not visited yet
+    while toVisit:
+      i = toVisit.pop()
+      for j in self.callees(i):
+        if not seen[j]:
+          seen[j] = 1
+          toVisit.append(j)
+    #end loop thru workspaces reached but not visited yet
+    
+    return seen
+  #end reachable(self, roots)
+  
+  #----------------------------------------------------------------------------
+  #returns list of (workspace, attr, names the steps give but the "Workspace
+  #  List" doesn't, names the list gives but the steps don't) for each
+  #  workspace where the two differ, attr is 'calledBy' (Call edges into it)
+  #  or 'exceptionWorkspaces' (exception edges out of it)
+  #  workspaces that got nothing from the list (None) aren't checked
+  def listedDiffs(self):
+    #dict[attr, list of sets of names, one per workspace]
+    found = {
+      'calledBy': [set() for _ in self.workspaces],
+      'exceptionWorkspaces': [set() for _ in self.workspaces],
+    }
+    #loop thru edges
+    for i, ws in enumerate(self.workspaces):
+      for pos in range(self.calleeOffsets[i], self.calleeOffsets[i + 1]):
+        j = self.calleeIndices[pos]
+        if self.edgeKinds[pos] == CALL_EDGE:
+          found['calledBy'][j].add(ws.name)
+        else:
+          found['exceptionWorkspaces'][i].add(self.workspaces[j].name)
+    #end loop thru edges
+    
+    diffs = []
+    #loop thru workspaces to compare with what the list gives them
+    for i, ws in enumerate(self.workspaces):
+      #loop thru attrs the list gives
+      for attr, names in found.items():
+        listed = getattr(ws, attr, None)
+        if listed is None:
+          continue
+        listed = set(listed)
+        if listed != names[i]:
+          diffs.append((ws, attr, sorted(names[i] - listed), sorted(listed - names[i])))
+      #end loop thru attrs
+    #end loop thru workspaces
+    
+    return diffs
+  #end listedDiffs(self)
+  
+  #----------------------------------------------------------------------------
+  #returns list of workspaces the entry workspace can never get to
+  def unreachableWorkspaces(self, roots=None):
+    seen = self.reachable(roots)
+    return [ws for i, ws in enumerate(self.workspaces) if not seen[i]]
+  #end unreachableWorkspaces(self, roots)
+#end class CallGraph
\ No newline at end of file
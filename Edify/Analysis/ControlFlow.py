@@ -0,0 +1,159 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+from array import array
+
+from ..Utils.Parsers import splitTarget
+
+##############################################################################
+#CONSTANTS
+##############################################################################
+#step types that never fall thru to the next step
+NO_FALL_THRU_TYPES = frozenset(['Goto', 'End'])
+
+##############################################################################
+#CLASSES
+##############################################################################
+#control flow between the steps of one workspace or subflow
+#  steps are numbered by their index in steps
+#  successors of step i are succIndices[succOffsets[i]:succOffsets[i+1]]
+#    (compressed sparse row arrays, so no list per step)
+#  a step goes to
+#    Goto: its target
+#    Choose: the target of each branch then the next step (no branch taken)
+#    End: nowhere
+#    anything else: the next step
+#  built in one pass over the steps and their targets
+class ControlFlowGraph:
+  def __init__(self, steps):
+    self.steps = steps
+    
+    #dict[step ref, index of step in steps]
+    self.refIndex = {step.ref: i for i, step in enumerate(steps)}
+    
+    self.succOffsets = array('l', [0])
+    self.succIndices = array('l')
+    
+    #list of (index of step, target) whose target isn't a step in steps
+    self.unresolved = []
+    
+    #leaders[i] is 1 if step i starts a basic block
+    self.leaders = bytearray(len(steps))
+    if steps:
+      self.leaders[0] = 1
+    
+    self.__build()
+  #end __init__(self, steps)
+  
+  ########################
+  # STATIC/CLASS METHODS #
+  ########################
+  #----------------------------------------------------------------------------
+  #flow is a Subflow or Subroutine
+  @classmethod
+  def fromFlow(CfgObjClass, flow):
+    return CfgObjClass(flow.steps or [])
+  #end fromFlow(CfgObjClass, flow)
+  
+  #----------------------------------------------------------------------------
+  #returns list of "name:href" targets step may jump to
+  @staticmethod
+  def jumpTargets(step):
+    if step.type == 'Goto':
+      return [step.target]
+    elif step.type == 'Choose':
+      return [branch.targetLoc for branch in step.branches or []]
+    return []
+  #end jumpTargets(step)
+  
+  ####################
+  # INSTANCE METHODS #
+  ####################
+  #----------------------------------------------------------------------------
+  def __build(self):
+    numSteps = len(self.steps)
+    #loop thru steps to add their successors
+    for i, step in enumerate(self.steps):
+      targets = ControlFlowGraph.jumpTargets(step)
+      
+      #loop thru targets to resolve them to step indexes
+      for target in targets:
+        _, anchor = splitTarget(target)
+        j = self.refIndex.get(anchor)
+        if j is None:
+          self.unresolved.append((i, target))
+          continue
+        
+        self.succIndices.append(j)
+        self.leaders[j] = 1
+      #end loop thru targets to resolve them to step indexes
+      
+      #if falls thru to the next step
+      if step.type not in NO_FALL_THRU_TYPES and i + 1 < numSteps:
+        self.succIndices.append(i + 1)
+      
+      #step after a jump starts a new block
+      if (targets or step.type in NO_FALL_THRU_TYPES) and i + 1 < numSteps:
+        self.leaders[i + 1] = 1
+      
+      self.succOffsets.append(len(self.succIndices))
+    #end loop thru steps to add their successors
+  #end __build(self)
+  
+  #----------------------------------------------------------------------------
+  #returns indexes of steps step i may go to next
+  def successors(self, i):
+    return self.succIndices[self.succOffsets[i]:self.succOffsets[i + 1]]
+  #end successors(self, i)
+  
+  #----------------------------------------------------------------------------
+  #returns bytearray where [i] is 1 if step i can be reached from step start
+  def reachable(self, start=0):
+    seen = bytearray(len(self.steps))
+    if not self.steps:
+      return seen
+    
+    seen[start] = 1
+    toVisit = [start]
+    #loop thru steps reached but not visited yet
+    while toVisit:
+      i = toVisit.pop()
+      #loop thru successors of step i
+      for j in self.successors(i):
+        if not seen[j]:
+          seen[j] = 1
+          toVisit.append(j)
+      #end loop thru successors of step i
+    #end loop thru steps reached but not visited yet
+    
+    return seen
+  #end reachable(self, start)
+  
+  #----------------------------------------------------------------------------
+  #returns list of steps that can't be reached from the 1st step
+  def deadSteps(self):
+    seen = self.reachable()
+    return [step for i, step in enumerate(self.steps) if not seen[i]]
+  #end deadSteps(self)
+  
+  #----------------------------------------------------------------------------
+  #returns list of (index of 1st step, index past last step) of each
+  #  basic block, in step order
+  #  only the 1st step of a block is jumped to
+  #  only the last step of a block jumps, ends or falls into another block
+  def basicBlocks(self):
+    blocks = []
+    start = 0
+    #loop thru steps after the 1st to split blocks at leaders
+    for i in range(1, len(self.steps)):
+      if self.leaders[i]:
+        blocks.append((start, i))
+        start = i
+    #end loop thru steps after the 1st to split blocks at leaders
+    
+    if self.steps:
+      blocks.append((start, len(self.steps)))
+    
+    return blocks
+  #end basicBlocks(self)
+#end class ControlFlowGraph
\ No newline at end of file
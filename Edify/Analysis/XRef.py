@@ -0,0 +1,183 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+from dataclasses import dataclass
+
+from ..Utils.Parsers import splitTarget
+
+##############################################################################
+#CONSTANTS
+##############################################################################
+#ways a step accesses an object
+READ  = 'read'
+WRITE = 'write'
+USE   = 'use' #listed in the object's "Used by" detail, no step known
+
+##############################################################################
+#CLASSES
+##############################################################################
+#one access of an object
+@dataclass(slots=True)
+class ObjectUse:
+  workspace: str        #name of the workspace or subflow
+  stepId   : str = None #None for USE
+  access   : str = READ
+#end dataclass ObjectUse
+
+##############################################################################
+#inverted index of where each global and local object is accessed
+#  keyed by object ref (the anchor name objects are linked to by)
+#  Assign step: target object written, value or expression objects read
+#  Start step: objects entry params are stored in are written
+#  Call step: objects passed as params are read
+#  Call DLL step: objects passed as args are read
+#  Choose step: objects compared by branches are read
+#  usedBy of each object: workspace noted as USE
+#  subflow steps are indexed under the subflow's name, once per subflow
+class XRef:
+  def __init__(self, appObj):
+    #dict[access, dict[object ref, list of ObjectUse]]
+    self.uses = {READ: {}, WRITE: {}, USE: {}}
+    
+    #dict[object name, list of object refs]
+    #  local objects of different workspaces can share a name
+    self.refsByName = {}
+    
+    self.__build(appObj)
+  #end __init__(self, appObj)
+  
+  ####################
+  # INSTANCE METHODS #
+  ####################
+  #----------------------------------------------------------------------------
+  def __build(self, appObj):
+    self.__addObjs(appObj.globalObjs)
+    
+    seenSubflows = set()
+    #loop thru workspaces
+    for ws in appObj.subroutines:
+      self.__addObjs(ws.localObjs)
+      self.__addSteps(ws.name, ws.steps)
+      
+      toVisit = list(ws.subflows or [])
+      #loop thru subflows invoked by ws not indexed yet
+      while toVisit:
+        subflow = toVisit.pop()
+        if id(subflow) in seenSubflows:
+          continue
+        seenSubflows.add(id(subflow))
+        
+        self.__addSteps(subflow.name, subflow.steps)
+        toVisit.extend(subflow.subflows or [])
+      #end loop thru subflows invoked by ws not indexed yet
+    #end loop thru workspaces
+  #end __build(self, appObj)
+  
+  #----------------------------------------------------------------------------
+  def __addObjs(self, objs):
+    #loop thru objects
+    for obj in objs or []:
+      self.__addName(obj.name, obj.ref)
+      
+      usedBy = obj.usedBy if isinstance(obj.usedBy, list) else [obj.usedBy]
+      #loop thru workspaces the object is used by
+      for wsName in usedBy:
+        if wsName:
+          self.__addUse(obj.ref, ObjectUse(wsName, None, USE))
+      #end loop thru workspaces the object is used by
+    #end loop thru objects
+  #end __addObjs(self, objs)
+  
+  #----------------------------------------------------------------------------
+  def __addSteps(self, wsName, steps):
+    #loop thru steps
+    for step in steps or []:
+      #switch on step type
+      if step.type == 'Assign':
+        self.__addTarget(step.obj, wsName, step.id, WRITE)
+        vals = step.val.values() if isinstance(step.val, dict) else [step.val]
+        self.__addTargets(vals, wsName, step.id, READ)
+      elif step.type == 'Start':
+        self.__addTargets((step.params or {}).values(), wsName, step.id, WRITE)
+      elif step.type == 'Call':
+        self.__addTargets((step.params or {}).values(), wsName, step.id, READ)
+      elif step.type == 'Call DLL':
+        self.__addTargets((step.args or {}).values(), wsName, step.id, READ)
+      elif step.type == 'Choose':
+        #loop thru branches
+        for branch in step.branches or []:
+          self.__addTargets(
+            [branch.sourceObj, branch.targetObj], wsName, step.id, READ
+          )
+        #end loop thru branches
+      #end switch on step type
+    #end loop thru steps
+  #end __addSteps(self, wsName, steps)
+  
+  #----------------------------------------------------------------------------
+  def __addTargets(self, targets, wsName, stepId, access):
+    #loop thru targets
+    for target in targets:
+      self.__addTarget(target, wsName, stepId, access)
+    #end loop thru targets
+  #end __addTargets(self, targets, wsName, stepId, access)
+  
+  #----------------------------------------------------------------------------
+  #indexes a "name:href" target, ignored if it isn't linked to anything
+  def __addTarget(self, target, wsName, stepId, access):
+    name, ref = splitTarget(target)
+    if not ref:
+      return
+    
+    self.__addName(name, ref)
+    self.__addUse(ref, ObjectUse(wsName, stepId, access))
+  #end __addTarget(self, target, wsName, stepId, access)
+  
+  #----------------------------------------------------------------------------
+  def __addName(self, name, ref):
+    refs = self.refsByName.setdefault(name, [])
+    if ref not in refs:
+      refs.append(ref)
+  #end __addName(self, name, ref)
+  
+  #----------------------------------------------------------------------------
+  def __addUse(self, ref, use):
+    self.uses[use.access].setdefault(ref, []).append(use)
+  #end __addUse(self, ref, use)
+  
+  #----------------------------------------------------------------------------
+  #returns list of object refs obj stands for
+  #  obj is an object ref or an object name
+  def refsOf(self, obj):
+    return self.refsByName.get(obj) or [obj]
+  #end refsOf(self, obj)
+  
+  #----------------------------------------------------------------------------
+  #returns list of ObjectUses of object obj (name or ref) with access
+  def lookup(self, obj, access):
+    usesByRef = self.uses[access]
+    refs = self.refsOf(obj)
+    #if only one object has that name or ref, skip copying
+    if len(refs) == 1:
+      return usesByRef.get(refs[0], [])
+    return [use for ref in refs for use in usesByRef.get(ref, [])]
+  #end lookup(self, obj, access)
+  
+  #----------------------------------------------------------------------------
+  #returns list of ObjectUses of steps writing object obj (name or ref)
+  def writers(self, obj):
+    return self.lookup(obj, WRITE)
+  #end writers(self, obj)
+  
+  #----------------------------------------------------------------------------
+  #returns list of ObjectUses of steps reading object obj (name or ref)
+  def readers(self, obj):
+    return self.lookup(obj, READ)
+  #end readers(self, obj)
+  
+  #----------------------------------------------------------------------------
+  #returns list of every ObjectUse of object obj (name or ref)
+  def usesOf(self, obj):
+    return self.writers(obj) + self.readers(obj) + self.lookup(obj, USE)
+  #end usesOf(self, obj)
+#end class XRef
\ No newline at end of file
@@ -0,0 +1 @@
+__all__=['ControlFlow', 'CallGraph', 'XRef']
\ No newline at end of file
@@ -0,0 +1,295 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import json
+
+from ..Types.EdifyObject import EdifyObject
+from ..Types.Param       import Param
+from ..Types.Subflow     import Subflow
+from ..Types.Subroutine  import Subroutine, EntryWorkspace, ExceptionHandler
+
+from ..Utils.Constants     import SCHEMA_VERSION
+from ..Utils.DocumentIndex import ENTRY_WS_HEADER, SUBROUTINE_HEADER, EXCEPTION_HANDLER_HEADER
+from ..Utils.Errors        import EdifyParseError
+
+##############################################################################
+#CONSTANTS
+##############################################################################
+#err codes
+NONE=0
+UNSUPPORTED_SCHEMA=1
+BAD_RECORD=2
+
+#'record' of the first line of an ndjson export
+APP_RECORD = 'app'
+
+#dict[workspace kind, Subroutine class], kinds are the header kinds
+#  from Edify.Utils.DocumentIndex and the 'record' of workspace lines
+WS_CLASSES = {
+  ENTRY_WS_HEADER: EntryWorkspace,
+  SUBROUTINE_HEADER: Subroutine,
+  EXCEPTION_HANDLER_HEADER: ExceptionHandler,
+}
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#writes AppObject appObj to text file object outFile as one json document
+#  see appToDict(appObj)
+def writeJson(appObj, outFile):
+  json.dump(appToDict(appObj), outFile)
+  outFile.write('\n')
+#end writeJson(appObj, outFile)
+
+#-----------------------------------------------------------------------------
+#returns (props, globalObjs, subroutines) read from a json document written by
+#  writeJson(appObj, outFile) to text file object inFile
+def readJson(inFile):
+  appDict = loadRecord(inFile.read(), 'json document')
+  checkSchema(appDict)
+  
+  try:
+    subflowsByRef = Subflow.subflowsFromDicts(appDict['subflows'])
+    subroutines = [
+      wsFromDict(wsDict, subflowsByRef) for wsDict in appDict['subroutines']
+    ]
+    
+    return (
+      propsFromDict(appDict['props']),
+      [EdifyObject.fromDict(obj) for obj in appDict['globalObjs']],
+      subroutines
+    )
+  except (KeyError, TypeError) as e:
+    raise EdifyParseError(f'Bad json document: {e!r}', BAD_RECORD, __name__)
+  #end try build objects from document
+#end readJson(inFile)
+
+#-----------------------------------------------------------------------------
+#returns dict of plain json-able values of AppObject appObj
+#  every subflow is written once in 'subflows'
+#  workspaces and subflows name the subflows they invoke by ref
+def appToDict(appObj):
+  return {
+    'schemaVersion': SCHEMA_VERSION,
+    'props': propsToDict(appObj.props),
+    'globalObjs': [obj.toDict() for obj in appObj.globalObjs],
+    'subroutines': [wsToDict(ws) for ws in appObj.subroutines],
+    'subflows': [
+      subflow.toDict()
+      for subflow in Subflow.reachableSubflows(appObj.subroutines)
+    ],
+  }
+#end appToDict(appObj)
+
+#-----------------------------------------------------------------------------
+#writes AppObject appObj to text file object outFile as ndjson
+#  one line at a time, see iterNdjson(appObj)
+def writeNdjson(appObj, outFile):
+  #loop thru lines to write them as they are made
+  for line in iterNdjson(appObj):
+    outFile.write(line)
+  #end loop thru lines to write them as they are made
+#end writeNdjson(appObj, outFile)
+
+#-----------------------------------------------------------------------------
+#yields AppObject appObj as '\n' terminated lines of json:
+#    {'record': APP_RECORD, 'schemaVersion', 'props', 'globalObjs'}
+#  then one line per workspace in order:
+#    {'record': workspace kind, 'workspace', 'subflows'}
+#  each workspace line carries every subflow it reaches so it can be loaded
+#    on its own, see parseNdjsonLine(line, subflowsByRef)
+def iterNdjson(appObj):
+  yield json.dumps({
+    'record': APP_RECORD,
+    'schemaVersion': SCHEMA_VERSION,
+    'props': propsToDict(appObj.props),
+    'globalObjs': [obj.toDict() for obj in appObj.globalObjs],
+  }) + '\n'
+  
+  #loop thru workspaces
+  for ws in appObj.subroutines:
+    yield json.dumps({
+      'record': wsKind(ws),
+      'workspace': ws.toDict(),
+      'subflows': [
+        subflow.toDict() for subflow in Subflow.reachableSubflows([ws])
+      ],
+    }) + '\n'
+  #end loop thru workspaces
+#end iterNdjson(appObj)
+
+#-----------------------------------------------------------------------------
+#returns (props, globalObjs, subroutines) read from ndjson written by
+#  writeNdjson(appObj, outFile) to text file object inFile
+def readNdjson(inFile):
+  props       = None
+  globalObjs  = []
+  subroutines = []
+  
+  #loop thru parts of the export as they are read
+  for kind, obj in iterNdjsonRecords(inFile):
+    if kind == 'props':
+      props = obj | {'parameters': []}
+    elif kind == 'param':
+      props['parameters'].append(obj)
+    elif kind == 'globalObj':
+      globalObjs.append(obj)
+    else:
+      subroutines.append(obj)
+  #end loop thru parts of the export as they are read
+  
+  return props, globalObjs, subroutines
+#end readNdjson(inFile)
+
+#-----------------------------------------------------------------------------
+#yields (kind, obj) for each part of the ndjson read from text file object
+#  inFile, one line at a time, same as AppObject.iterHtmlStream(...) does:
+#    ('props', dict of meta props), ('param', Param),
+#    ('globalObj', EdifyObject), and for each workspace
+#    (ENTRY_WS_HEADER | SUBROUTINE_HEADER | EXCEPTION_HANDLER_HEADER, Subroutine)
+#  workspaces that invoke the same subflow share one Subflow object
+#  raises EdifyParseError if a line isn't a whole record or the app record
+#    isn't the 1st one
+def iterNdjsonRecords(inFile):
+  subflowsByRef = {}
+  sawApp = False
+  
+  #loop thru lines
+  for lineNum, line in enumerate(inFile, 1):
+    if not line.strip():
+      continue
+    
+    record = loadRecord(line, f'ndjson line {lineNum}')
+    #if app record
+    if record.get('record') == APP_RECORD:
+      checkSchema(record)
+      try:
+        props = propsFromDict(record['props'])
+        globalObjs = [EdifyObject.fromDict(obj) for obj in record['globalObjs']]
+      except (KeyError, TypeError) as e:
+        raise EdifyParseError(
+          f'Bad app record on ndjson line {lineNum}: {e!r}', BAD_RECORD, __name__
+        )
+      sawApp = True
+      
+      yield 'props', {key: val for key, val in props.items() if key != 'parameters'}
+      for param in props['parameters']:
+        yield 'param', param
+      for obj in globalObjs:
+        yield 'globalObj', obj
+      continue
+    #end if app record
+    
+    if not sawApp:
+      raise EdifyParseError(
+        f'Expected the app record before ndjson line {lineNum}', BAD_RECORD, __name__
+      )
+    yield parseNdjsonRecord(record, subflowsByRef, lineNum)
+  #end loop thru lines
+  
+  if not sawApp:
+    raise EdifyParseError('No app record in ndjson', BAD_RECORD, __name__)
+#end iterNdjsonRecords(inFile)
+
+#-----------------------------------------------------------------------------
+#returns (workspace kind, Subroutine) from one workspace line of ndjson
+#  made by iterNdjson(appObj), so lines can be loaded apart (e.g. in workers)
+#  subflowsByRef (dict[ref, Subflow]) is shared with the lines loaded before
+def parseNdjsonLine(line, subflowsByRef=None):
+  return parseNdjsonRecord(loadRecord(line, 'ndjson line'), subflowsByRef)
+#end parseNdjsonLine(line, subflowsByRef)
+
+#-----------------------------------------------------------------------------
+def parseNdjsonRecord(record, subflowsByRef=None, lineNum=None):
+  kind = record.get('record')
+  if kind not in WS_CLASSES:
+    raise EdifyParseError(
+      f'Unexpected ndjson record "{kind}"'
+      + (f' on line {lineNum}' if lineNum else ''),
+      BAD_RECORD, __name__
+    )
+  #end if not a workspace record
+  
+  try:
+    subflowsByRef = Subflow.subflowsFromDicts(record['subflows'], subflowsByRef)
+    return kind, wsFromDict(record['workspace'], subflowsByRef, kind)
+  except (KeyError, TypeError) as e:
+    raise EdifyParseError(
+      f'Bad "{kind}" record'
+      + (f' on ndjson line {lineNum}' if lineNum else '')
+      + f': {e!r}',
+      BAD_RECORD, __name__
+    )
+  #end try build workspace from record
+#end parseNdjsonRecord(record, subflowsByRef, lineNum)
+
+#-----------------------------------------------------------------------------
+#returns json object (dict) in str text
+#  raises EdifyParseError naming where (e.g. 'ndjson line 3') if text is
+#  truncated, isn't json or isn't an object
+def loadRecord(text, where):
+  try:
+    record = json.loads(text)
+  except json.JSONDecodeError as e:
+    raise EdifyParseError(f'Bad json in {where}: {e}', BAD_RECORD, __name__)
+  
+  if not isinstance(record, dict):
+    raise EdifyParseError(f'Expected a json object in {where}', BAD_RECORD, __name__)
+  return record
+#end loadRecord(text, where)
+
+#-----------------------------------------------------------------------------
+#raises EdifyParseError if record was written with a newer schema
+def checkSchema(record):
+  schemaVersion = record.get('schemaVersion')
+  if not isinstance(schemaVersion, int) or schemaVersion > SCHEMA_VERSION:
+    raise EdifyParseError(
+      f'Unsupported export schema version {schemaVersion}. '
+      f'Expected {SCHEMA_VERSION} or older',
+      UNSUPPORTED_SCHEMA, __name__
+    )
+#end checkSchema(record)
+
+#-----------------------------------------------------------------------------
+#returns workspace kind of Subroutine ws, one of the keys of WS_CLASSES
+#  isinstance(...) so unparsed Edify.Types.LazySubroutine proxies match too
+def wsKind(ws):
+  if isinstance(ws, EntryWorkspace):
+    return ENTRY_WS_HEADER
+  elif isinstance(ws, ExceptionHandler):
+    return EXCEPTION_HANDLER_HEADER
+  return SUBROUTINE_HEADER
+#end wsKind(ws)
+
+#-----------------------------------------------------------------------------
+#returns ws.toDict() with its kind added
+def wsToDict(ws):
+  return ws.toDict() | {'kind': wsKind(ws)}
+#end wsToDict(ws)
+
+#-----------------------------------------------------------------------------
+#returns Subroutine, EntryWorkspace or ExceptionHandler from a workspace dict
+#  kind is taken from the dict if not given
+def wsFromDict(wsDict, subflowsByRef, kind=None):
+  kind = kind or wsDict.get('kind', SUBROUTINE_HEADER)
+  return WS_CLASSES[kind].fromDict(wsDict, subflowsByRef)
+#end wsFromDict(wsDict, subflowsByRef, kind)
+
+#-----------------------------------------------------------------------------
+#returns app object props with params as dicts
+def propsToDict(props):
+  propsDict = {key: val for key, val in props.items() if key != 'parameters'}
+  propsDict['parameters'] = [param.toDict() for param in props['parameters']]
+  return propsDict
+#end propsToDict(props)
+
+#-----------------------------------------------------------------------------
+#returns app object props with params as Params again
+def propsFromDict(propsDict):
+  props = {key: val for key, val in propsDict.items() if key != 'parameters'}
+  props['parameters'] = [
+    Param.fromDict(param) for param in propsDict['parameters']
+  ]
+  return props
+#end propsFromDict(propsDict)
\ No newline at end of file
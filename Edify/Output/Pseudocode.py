@@ -0,0 +1,271 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+from ..Types.Subroutine import EntryWorkspace, ExceptionHandler
+from ..Utils.Parsers import splitTarget
+from ..Analysis.ControlFlow import ControlFlowGraph
+
+##############################################################################
+#CONSTANTS
+##############################################################################
+INDENT = '  '
+
+##############################################################################
+#GLOBALS
+##############################################################################
+#dict[step type, function(step) returning pseudocode for the step]
+#  see registerStepEmitter(type, emitStep)
+stepEmitters_={}
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#writes the pseudocode of AppObject appObj to text file object outFile
+#  one line at a time, see iterPseudocode(appObj)
+def writePseudocode(appObj, outFile):
+  #loop thru lines to write them as they are made
+  for line in iterPseudocode(appObj):
+    outFile.write(line)
+  #end loop thru lines to write them as they are made
+#end writePseudocode(appObj, outFile)
+
+#-----------------------------------------------------------------------------
+#yields the pseudocode of AppObject appObj one '\n' terminated line at a time
+#  app object props and params, global objects, then every workspace
+#  followed by the subflows it invokes that weren't written yet
+def iterPseudocode(appObj):
+  yield from iterAppHeader(appObj.props)
+  yield from iterObjects('GLOBAL', appObj.globalObjs)
+  
+  #anchor names of subflows already written
+  writtenSubflows = set()
+  #loop thru workspaces
+  for ws in appObj.subroutines:
+    yield '\n'
+    yield from iterWorkspace(ws)
+    yield from iterSubflows(ws, writtenSubflows)
+  #end loop thru workspaces
+#end iterPseudocode(appObj)
+
+#-----------------------------------------------------------------------------
+#yields lines naming the app object and its params
+def iterAppHeader(props):
+  name = props.get('Name', '')
+  yield f'APPLICATION {name}\n'
+  
+  #loop thru props other than name and params
+  for key, val in props.items():
+    if key in ('Name', 'parameters'):
+      continue
+    yield f'{INDENT}# {key}: {val}\n'
+  #end loop thru props other than name and params
+  
+  #loop thru app object params
+  for param in props.get('parameters') or []:
+    yield f'{INDENT}PARAM {formatParam(param)}\n'
+  #end loop thru app object params
+#end iterAppHeader(props)
+
+#-----------------------------------------------------------------------------
+#yields a line declaring each EdifyObject in objs
+#  scope is 'GLOBAL' or 'LOCAL'
+def iterObjects(scope, objs, indent=''):
+  #loop thru objects
+  for obj in objs or []:
+    line = f'{indent}{scope} {obj.objClass} {obj.name}'
+    if obj.initialValue is not None:
+      line += f' = {obj.initialValue}'
+    if obj.comment:
+      line += f'  # {obj.comment}'
+    yield line + '\n'
+  #end loop thru objects
+#end iterObjects(scope, objs, indent)
+
+#-----------------------------------------------------------------------------
+#yields lines of a workspace (Subroutine or one of its subclasses)
+#  header, params, exception handlers, local objects then steps
+def iterWorkspace(ws):
+  params = ', '.join(formatParam(param) for param in ws.entryParams or [])
+  yield f'{workspaceKeyword(ws)} {ws.name}({params})\n'
+  
+  #loop thru exception code mappings
+  for xcptnCode, handler in (ws.exceptionHandlerMap or {}).items():
+    yield f'{INDENT}ON EXCEPTION {xcptnCode} GOTO {targetName(handler)}\n'
+  #end loop thru exception code mappings
+  
+  yield from iterObjects('LOCAL', ws.localObjs, INDENT)
+  yield from iterSteps(ws.steps)
+  yield f'END {workspaceKeyword(ws)}\n'
+#end iterWorkspace(ws)
+
+#-----------------------------------------------------------------------------
+#yields lines of each subflow invoked by flow (directly or not)
+#  whose anchor name isn't in writtenSubflows, then adds it
+def iterSubflows(flow, writtenSubflows):
+  toVisit = list(reversed(flow.subflows or []))
+  #loop thru subflows not written yet
+  while toVisit:
+    subflow = toVisit.pop()
+    if subflow.ref in writtenSubflows:
+      continue
+    writtenSubflows.add(subflow.ref)
+    
+    yield '\n'
+    yield f'SUBFLOW {subflow.name}\n'
+    yield from iterSteps(subflow.steps)
+    yield 'END SUBFLOW\n'
+    
+    toVisit.extend(reversed(subflow.subflows or []))
+  #end loop thru subflows not written yet
+#end iterSubflows(flow, writtenSubflows)
+
+#-----------------------------------------------------------------------------
+#yields a line for each step, prefixed by its id so gotos can be followed
+#  basic blocks are separated by a blank line
+#  steps that can't be reached from the 1st step are marked unreachable
+def iterSteps(steps):
+  cfg  = ControlFlowGraph(steps or [])
+  live = cfg.reachable()
+  #loop thru steps
+  for i, step in enumerate(cfg.steps):
+    if i and cfg.leaders[i]:
+      yield '\n'
+    
+    emitStep = stepEmitters_.get(step.type, emitOtherStep)
+    line = f'{INDENT}{step.id}: {emitStep(step)}'
+    
+    comments = [step.label] if step.label else []
+    if not live[i]:
+      comments.append('unreachable')
+    if comments:
+      line += '  # ' + '; '.join(comments)
+    
+    yield line + '\n'
+  #end loop thru steps
+#end iterSteps(steps)
+
+#-----------------------------------------------------------------------------
+#returns keyword opening and closing the kind of workspace ws is
+def workspaceKeyword(ws):
+  if isinstance(ws, EntryWorkspace):
+    return 'ENTRY WORKSPACE'
+  elif isinstance(ws, ExceptionHandler):
+    return 'EXCEPTION HANDLER'
+  return 'SUBROUTINE'
+#end workspaceKeyword(ws)
+
+#-----------------------------------------------------------------------------
+def formatParam(param):
+  text = f'{param.ioType} {param.objClass} {param.name}'
+  if param.defaultVal:
+    text += f' = {param.defaultVal}'
+  return text
+#end formatParam(param)
+
+#-----------------------------------------------------------------------------
+#returns name part of a "name:href" target or '?' if there is none
+def targetName(target):
+  name, _ = splitTarget(target)
+  return name if name is not None else '?'
+#end targetName(target)
+
+#-----------------------------------------------------------------------------
+#returns "key = name, ..." of a dict[key, "name:href"]
+def formatArgs(args):
+  return ', '.join(
+    f'{key} = {targetName(val)}' for key, val in (args or {}).items()
+  )
+#end formatArgs(args)
+
+#-----------------------------------------------------------------------------
+#makes iterSteps(...) write steps of type with emitStep(step)
+#  replaces whatever was registered for that type before
+#  see Edify.Types.Step.registerStepType(StepClass) for parsing new types
+def registerStepEmitter(type, emitStep):
+  stepEmitters_[type] = emitStep
+#end registerStepEmitter(type, emitStep)
+
+#-----------------------------------------------------------------------------
+#step emitters, each returns the pseudocode of one step
+#-----------------------------------------------------------------------------
+def emitStartStep(step):
+  return f'START({formatArgs(step.params)})'
+#end emitStartStep(step)
+
+#-----------------------------------------------------------------------------
+def emitAssignStep(step):
+  #if assigned an expression
+  if isinstance(step.val, dict):
+    return f'{targetName(step.obj)} = EXPRESSION({formatArgs(step.val)})'
+  return f'{targetName(step.obj)} = {targetName(step.val)}'
+#end emitAssignStep(step)
+
+#-----------------------------------------------------------------------------
+def emitChooseStep(step):
+  branches = []
+  #loop thru branches in order they are tried
+  for branch in step.branches or []:
+    #if branch compares 2 objects
+    if branch.sourceObj and branch.comparisonOp and branch.targetObj:
+      condition = (
+        f'{targetName(branch.sourceObj)} {targetName(branch.comparisonOp)} '
+        f'{targetName(branch.targetObj)}'
+      )
+    else:
+      condition = branch.condition
+    #end if branch compares 2 objects
+    
+    branches.append(f'IF {condition} GOTO {targetName(branch.targetLoc)}')
+  #end loop thru branches in order they are tried
+  
+  return 'CHOOSE ' + '; ELSE '.join(branches)
+#end emitChooseStep(step)
+
+#-----------------------------------------------------------------------------
+def emitCallStep(step):
+  return f'CALL {targetName(step.target)}({formatArgs(step.params)})'
+#end emitCallStep(step)
+
+#-----------------------------------------------------------------------------
+def emitSubflowStep(step):
+  return f'SUBFLOW {targetName(step.target)}'
+#end emitSubflowStep(step)
+
+#-----------------------------------------------------------------------------
+def emitGotoStep(step):
+  return f'GOTO {targetName(step.target)}'
+#end emitGotoStep(step)
+
+#-----------------------------------------------------------------------------
+def emitEndStep(step):
+  return f'RETURN {step.rtnMode}'
+#end emitEndStep(step)
+
+#-----------------------------------------------------------------------------
+def emitUseSystemFunctionStep(step):
+  return f'SYSTEM FUNCTION {step.funcName}'
+#end emitUseSystemFunctionStep(step)
+
+#-----------------------------------------------------------------------------
+def emitCallDllStep(step):
+  return f'CALL DLL {step.funcName}({formatArgs(step.args)})'
+#end emitCallDllStep(step)
+
+#-----------------------------------------------------------------------------
+#any step type without an emitter, incl. Edify.Types.Step.UnknownStep
+def emitOtherStep(step):
+  details = getattr(step, 'details', None)
+  return f'{step.type.upper()}' + (f' {details!r}' if details else '')
+#end emitOtherStep(step)
+
+#loop thru built in step types to register their emitters
+for stepType, emitStep in {
+  'Start': emitStartStep, 'Assign': emitAssignStep,
+  'Choose': emitChooseStep, 'Call': emitCallStep,
+  'Subflow': emitSubflowStep, 'Goto': emitGotoStep, 'End': emitEndStep,
+  'Use System Function': emitUseSystemFunctionStep,
+  'Call DLL': emitCallDllStep
+}.items():
+  registerStepEmitter(stepType, emitStep)
+#end loop thru built in step types to register their emitters
\ No newline at end of file
@@ -0,0 +1,357 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import marshal
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+from ..Types.EdifyObject import EdifyObject
+from ..Types.Subflow     import Subflow
+
+from ..Utils.Constants import SCHEMA_VERSION
+from ..Utils.Errors    import EdifyParseError
+
+from .Json import propsToDict, propsFromDict, wsKind, wsFromDict
+
+##############################################################################
+#CONSTANTS
+##############################################################################
+#err codes
+NONE=0
+NOT_A_SNAPSHOT=1
+UNSUPPORTED_VERSION=2
+NO_SUCH_WORKSPACE=4
+BAD_RECORD=8
+
+SNAPSHOT_MAGIC = b'EDFYSNAP'
+
+#bump whenever the layout below changes
+SNAPSHOT_VERSION = 2
+
+#marshal's format may change between python versions, so a snapshot is only
+#  read back by the marshal version and python major.minor that wrote it
+MARSHAL_VERSION = marshal.version
+PYTHON_VERSION  = sys.version_info[:2]
+
+#magic, SNAPSHOT_VERSION, SCHEMA_VERSION, MARSHAL_VERSION, PYTHON_VERSION
+#  (major, minor), then (offset, length) of the string table, app record,
+#  subflow index and workspace index
+#  every section is a marshal dump, strings in records are string table indices
+HEADER = struct.Struct('<8sIIIHH' + 'QQ'*4)
+
+#what decoding a truncated or corrupt section raises, from marshal
+#  or from building objects out of what it returned
+CORRUPT_RECORD_ERRORS = (ValueError, EOFError, TypeError, IndexError, KeyError)
+
+##############################################################################
+#CLASSES
+##############################################################################
+#reads a snapshot written by writeSnapshot(...) thru an mmap
+#  only the string table and the indices are loaded when opened
+#  each workspace record is decoded when it is asked for, along with the
+#  subflows it reaches that weren't decoded yet, so workspaces loaded from
+#  one reader share their subflows
+class SnapshotReader:
+  def __init__(self, path):
+    self.path = path
+    self.__file = open(path, 'rb')
+    try:
+      self.__buf = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+      (
+        magic, version, schemaVersion, marshalVersion, pyMajor, pyMinor,
+        strOffset, strLen, appOffset, appLen,
+        sfIndexOffset, sfIndexLen, wsIndexOffset, wsIndexLen
+      ) = HEADER.unpack_from(self.__buf, 0)
+    except (ValueError, struct.error):
+      self.__file.close()
+      raise EdifyParseError(f'"{path}" is not a snapshot', NOT_A_SNAPSHOT, __name__)
+    #end try map and read header
+    
+    if magic != SNAPSHOT_MAGIC:
+      self.close()
+      raise EdifyParseError(f'"{path}" is not a snapshot', NOT_A_SNAPSHOT, __name__)
+    if version != SNAPSHOT_VERSION or schemaVersion > SCHEMA_VERSION:
+      self.close()
+      raise EdifyParseError(
+        f'Snapshot "{path}" has unsupported version {version}.{schemaVersion}',
+        UNSUPPORTED_VERSION, __name__
+      )
+    if marshalVersion != MARSHAL_VERSION or (pyMajor, pyMinor) != PYTHON_VERSION:
+      self.close()
+      raise EdifyParseError(
+        f'Snapshot "{path}" was written by python {pyMajor}.{pyMinor} '
+        f'(marshal {marshalVersion}), rewrite it with this python '
+        f'{PYTHON_VERSION[0]}.{PYTHON_VERSION[1]} (marshal {MARSHAL_VERSION})',
+        UNSUPPORTED_VERSION, __name__
+      )
+    #end if bad magic or version
+    
+    self.__appSection = (appOffset, appLen)
+    try:
+      self.strs = self.__loadSection(strOffset, strLen)
+      
+      #list[ref] and list[offset] of subflow records, offsets has one more
+      #  entry for the end of the last record
+      sfRefIds, self.__sfOffsets = self.__loadSection(sfIndexOffset, sfIndexLen)
+      self.__sfIndex = {self.strs[refId]: i for i, refId in enumerate(sfRefIds)}
+      
+      #same for workspace records, in AppObject.subroutines order
+      wsNameIds, self.__wsOffsets = self.__loadSection(wsIndexOffset, wsIndexLen)
+      self.names = [self.strs[nameId] for nameId in wsNameIds]
+    except CORRUPT_RECORD_ERRORS as e:
+      self.close()
+      self.__raiseBadRecord('index', e)
+    #end try load string table and indices
+    
+    self.__wsIndex = {}
+    #loop thru names backwards so the 1st workspace with a name wins
+    for i in range(len(self.names)-1, -1, -1):
+      self.__wsIndex[self.names[i]] = i
+    
+    #dict[ref, Subflow] of subflows decoded so far
+    self.subflowsByRef = {}
+  #end __init__(self, path)
+  
+  ####################
+  # INSTANCE METHODS #
+  ####################
+  #returns number of workspaces in the snapshot
+  def __len__(self):
+    return len(self.names)
+  #end __len__(self)
+  
+  #----------------------------------------------------------------------------
+  def __enter__(self):
+    return self
+  #end __enter__(self)
+  
+  #----------------------------------------------------------------------------
+  def __exit__(self, *excInfo):
+    self.close()
+  #end __exit__(self, *excInfo)
+  
+  #----------------------------------------------------------------------------
+  #objects already returned stay usable after closing
+  def close(self):
+    if not self.__file.closed:
+      self.__buf.close()
+      self.__file.close()
+  #end close(self)
+  
+  #----------------------------------------------------------------------------
+  #returns (props, globalObjs) of the app object
+  def getApp(self):
+    try:
+      appDict = self.__loadRecord(*self.__appSection)
+      props = propsFromDict(appDict['props'])
+      globalObjs = [EdifyObject.fromDict(obj) for obj in appDict['globalObjs']]
+    except CORRUPT_RECORD_ERRORS as e:
+      self.__raiseBadRecord('app', e)
+    return props, globalObjs
+  #end getApp(self)
+  
+  #----------------------------------------------------------------------------
+  #returns workspace with index or name key
+  #  decoded each time it is asked for, keep it to reuse it
+  def getSubroutine(self, key):
+    i = key if isinstance(key, int) else self.__wsIndex.get(key)
+    if i is None or not -len(self) <= i < len(self):
+      raise EdifyParseError(
+        f'No workspace {key!r} in snapshot "{self.path}"', NO_SUCH_WORKSPACE, __name__
+      )
+    i = i % len(self)
+    
+    try:
+      wsDict = self.__loadRecord(
+        self.__wsOffsets[i], self.__wsOffsets[i+1] - self.__wsOffsets[i]
+      )
+      self.__loadSubflows(wsDict['subflows'])
+      return wsFromDict(wsDict, self.subflowsByRef)
+    except CORRUPT_RECORD_ERRORS as e:
+      self.__raiseBadRecord(f'"{self.names[i]}" workspace', e)
+  #end getSubroutine(self, key)
+  
+  #----------------------------------------------------------------------------
+  #yields every workspace in order, see getSubroutine(key)
+  def iterSubroutines(self):
+    for i in range(len(self)):
+      yield self.getSubroutine(i)
+  #end iterSubroutines(self)
+  
+  #----------------------------------------------------------------------------
+  #decodes the subflows with refs in refLst, and the ones they reach,
+  #  that aren't in subflowsByRef yet
+  def __loadSubflows(self, refLst):
+    flowDicts = []
+    seen = set()
+    
+    toVisit = list(refLst or [])
+    #loop thru refs not visited yet
+    while toVisit:
+      ref = toVisit.pop()
+      if ref in seen or ref in self.subflowsByRef or ref not in self.__sfIndex:
+        continue
+      seen.add(ref)
+      
+      i = self.__sfIndex[ref]
+      flowDict = self.__loadRecord(
+        self.__sfOffsets[i], self.__sfOffsets[i+1] - self.__sfOffsets[i]
+      )
+      flowDicts.append(flowDict)
+      toVisit.extend(flowDict['subflows'] or [])
+    #end loop thru refs not visited yet
+    
+    Subflow.subflowsFromDicts(flowDicts, self.subflowsByRef)
+  #end __loadSubflows(self, refLst)
+  
+  #----------------------------------------------------------------------------
+  def __loadSection(self, offset, length):
+    return marshal.loads(self.__buf[offset:offset+length])
+  #end __loadSection(self, offset, length)
+  
+  #----------------------------------------------------------------------------
+  def __loadRecord(self, offset, length):
+    return decodeStrs(self.__loadSection(offset, length), self.strs)
+  #end __loadRecord(self, offset, length)
+  
+  #----------------------------------------------------------------------------
+  #what names the section that couldn't be decoded,
+  #  e is the exception decoding it raised
+  def __raiseBadRecord(self, what, e):
+    raise EdifyParseError(
+      f'Bad {what} record in snapshot "{self.path}", it may be truncated: {e!r}',
+      BAD_RECORD, __name__
+    ) from e
+  #end __raiseBadRecord(self, what, e)
+#end class SnapshotReader
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#writes props, globalObjs and subroutines of an AppObject to path
+#  the layout is described at HEADER
+#  written to a temp file 1st so readers never see a partial snapshot
+def writeSnapshot(path, props, globalObjs, subroutines):
+  #dict[str, index in string table]
+  strIds = {}
+  
+  appRecord = marshal.dumps(encodeStrs({
+    'props': propsToDict(props),
+    'globalObjs': [obj.toDict() for obj in globalObjs],
+  }, strIds))
+  
+  sfRefIds = []
+  sfRecords = []
+  #loop thru subflows to encode each once
+  for subflow in Subflow.reachableSubflows(subroutines):
+    sfRefIds.append(encodeStrs(subflow.ref, strIds))
+    sfRecords.append(marshal.dumps(encodeStrs(subflow.toDict(), strIds)))
+  #end loop thru subflows to encode each once
+  
+  wsNameIds = []
+  wsRecords = []
+  #loop thru workspaces to encode them
+  for ws in subroutines:
+    wsNameIds.append(encodeStrs(ws.name, strIds))
+    wsRecords.append(marshal.dumps(
+      encodeStrs(ws.toDict() | {'kind': wsKind(ws)}, strIds)
+    ))
+  #end loop thru workspaces to encode them
+  
+  strTable = marshal.dumps(list(strIds))
+  
+  dirName = os.path.dirname(os.path.abspath(path))
+  fd, tmpPath = tempfile.mkstemp(dir=dirName, suffix='.tmp')
+  try:
+    with os.fdopen(fd, 'wb') as outFile:
+      outFile.seek(HEADER.size)
+      strOffset = outFile.tell()
+      outFile.write(strTable)
+      appOffset = outFile.tell()
+      outFile.write(appRecord)
+      
+      sfOffsets = writeRecords(outFile, sfRecords)
+      sfIndex = marshal.dumps((sfRefIds, sfOffsets))
+      sfIndexOffset = outFile.tell()
+      outFile.write(sfIndex)
+      
+      wsOffsets = writeRecords(outFile, wsRecords)
+      wsIndex = marshal.dumps((wsNameIds, wsOffsets))
+      wsIndexOffset = outFile.tell()
+      outFile.write(wsIndex)
+      
+      outFile.seek(0)
+      outFile.write(HEADER.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, SCHEMA_VERSION,
+        MARSHAL_VERSION, *PYTHON_VERSION,
+        strOffset, len(strTable), appOffset, len(appRecord),
+        sfIndexOffset, len(sfIndex), wsIndexOffset, len(wsIndex)
+      ))
+    #end with os.fdopen(fd, 'wb') as outFile
+    os.replace(tmpPath, path)
+  except BaseException:
+    if os.path.exists(tmpPath):
+      os.remove(tmpPath)
+    raise
+  #end try write snapshot
+#end writeSnapshot(path, props, globalObjs, subroutines)
+
+#-----------------------------------------------------------------------------
+#writes each record in records to binary file object outFile
+#  returns list of their offsets plus the offset of the end of the last one
+def writeRecords(outFile, records):
+  offsets = []
+  #loop thru records
+  for record in records:
+    offsets.append(outFile.tell())
+    outFile.write(record)
+  #end loop thru records
+  offsets.append(outFile.tell())
+  
+  return offsets
+#end writeRecords(outFile, records)
+
+#-----------------------------------------------------------------------------
+#returns copy of obj (made of dicts, lists, strs and other scalars)
+#  with every str replaced by its index in the string table strIds
+#  other scalars are wrapped in a 1 tuple so they aren't taken for indices
+def encodeStrs(obj, strIds):
+  if isinstance(obj, str):
+    strId = strIds.get(obj)
+    if strId is None:
+      strId = strIds[obj] = len(strIds)
+    return strId
+  elif isinstance(obj, dict):
+    return {
+      encodeStrs(key, strIds): encodeStrs(val, strIds)
+      for key, val in obj.items()
+    }
+  elif isinstance(obj, list):
+    return [encodeStrs(val, strIds) for val in obj]
+  elif obj is None:
+    return None
+  
+  return (obj,)
+#end encodeStrs(obj, strIds)
+
+#-----------------------------------------------------------------------------
+#undoes encodeStrs(obj, strIds), strs is the string table as a list
+def decodeStrs(obj, strs):
+  if type(obj) is int:
+    return strs[obj]
+  elif type(obj) is dict:
+    return {
+      decodeStrs(key, strs): decodeStrs(val, strs)
+      for key, val in obj.items()
+    }
+  elif type(obj) is list:
+    return [decodeStrs(val, strs) for val in obj]
+  elif type(obj) is tuple:
+    return obj[0]
+  
+  return obj
+#end decodeStrs(obj, strs)
\ No newline at end of file
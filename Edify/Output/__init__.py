@@ -0,0 +1 @@
+__all__=['Pseudocode', 'Json', 'Snapshot']
\ No newline at end of file
@@ -2,12 +2,12 @@
 #IMPORTS
 ##############################################################################
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 
 ##############################################################################
 #CLASS
 ##############################################################################
-@dataclass
+@dataclass(slots=True)
 class Branch:
   id       : int
   condition: str
@@ -15,4 +15,15 @@ class Branch:
   sourceObj   : str = None
   comparisonOp: str = None
   targetObj   : str = None
+  
+  #----------------------------------------------------------------------------
+  @classmethod
+  def fromDict(BranchObjClass, branchDict):
+    return BranchObjClass(**branchDict)
+  #end fromDict(BranchObjClass, branchDict)
+  
+  #----------------------------------------------------------------------------
+  def toDict(self):
+    return asdict(self)
+  #end toDict(self)
 #end dataclass Branch
\ No newline at end of file
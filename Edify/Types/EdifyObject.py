@@ -5,7 +5,7 @@ import sys
 from dataclasses import field
 from typing import Any
 
-from ..Utils.Parsers import parseDetails
+from ..Utils.Parsers import parseDetails, internStr, internStrs
 from ..Utils.Constants import GLOBAL_WS_NAME
 
 import os
@@ -31,6 +31,11 @@ errCode_=NONE
 #CLASSES
 ##############################################################################
 class EdifyObject:
+  __slots__ = (
+    'name', 'ref', 'objClass', 'comment', 'initialValue', 'resource',
+    'usedBy', 'preAlloc', 'autoAlloc', '_sys_alloc_name', '_sys_alloc_timeout'
+  )
+  
   def __init__(
     self, name: str, ref: str, objClass: str,
     comment: str = None, initialValue:str = None, resource:str = 'no',
@@ -68,7 +73,8 @@ class EdifyObject:
       errCode_ = errCode_ & BAD_OBJ_TABLE_FORMAT
       print(
         f'WARNING: "Local Objects" table from workspace "{wsName}" '
-        f'has unexpected number of columns'
+        f'has unexpected number of columns',
+        file=sys.stderr
       )
     #end if unexpected # of cols
     
@@ -85,15 +91,17 @@ class EdifyObject:
     newObj = EdifyObjectClass(
       name = name,
       ref = ref,
-      objClass = detailsDict.get("Object Class", ""),
+      objClass = internStr(detailsDict.get("Object Class", "")),
       comment = detailsDict.get("Comment"),
       initialValue = detailsDict.get("Initial Value"),
-      resource = detailsDict.get("resource"),
-      preAlloc = detailsDict.get("pre-allocate"),
-      autoAlloc = detailsDict.get("auto-allocate"),
+      resource = internStr(detailsDict.get("resource")),
+      preAlloc = internStr(detailsDict.get("pre-allocate")),
+      autoAlloc = internStr(detailsDict.get("auto-allocate")),
       _sys_alloc_name = detailsDict.get("_sys_alloc_name"),
       _sys_alloc_timeout = detailsDict.get("_sys_alloc_timeout"),
-      usedBy = newUsedBy.split(' , ') if splittable(newUsedBy) else newUsedBy
+      usedBy = internStrs(
+        newUsedBy.split(' , ') if splittable(newUsedBy) else newUsedBy
+      )
     ) #end newObj EdifyObjectClass()
     
     return newObj, errCode_
@@ -108,7 +116,8 @@ class EdifyObject:
       errCode_ = errCode_ & BAD_OBJ_TABLE_FORMAT
       print(
         'WARNING: "Global Objects" table has '
-        'unexpected number of columns'
+        'unexpected number of columns',
+        file=sys.stderr
       )
     #end if unexpected # of cols
     
@@ -125,15 +134,17 @@ class EdifyObject:
     newObj = EdifyObjectClass(
       name = name,
       ref   = ref,
-      objClass = detailsDict.get("Object Class", ""),
+      objClass = internStr(detailsDict.get("Object Class", "")),
       comment = detailsDict.get("Comment"),
       initialValue = detailsDict.get("Initial Value"),
-      resource = detailsDict.get("resource"),
-      preAlloc = detailsDict.get("pre-allocate"),
-      autoAlloc = detailsDict.get("auto-allocate"),
+      resource = internStr(detailsDict.get("resource")),
+      preAlloc = internStr(detailsDict.get("pre-allocate")),
+      autoAlloc = internStr(detailsDict.get("auto-allocate")),
       _sys_alloc_name = detailsDict.get("_sys_alloc_name"),
       _sys_alloc_timeout = detailsDict.get("_sys_alloc_timeout"),
-      usedBy = newUsedBy.split(' , ') if splittable(newUsedBy) else newUsedBy
+      usedBy = internStrs(
+        newUsedBy.split(' , ') if splittable(newUsedBy) else newUsedBy
+      )
     ) #end newObj EdifyObjectClass()
     
     return newObj, errCode_
@@ -141,6 +152,7 @@ class EdifyObject:
   
   @staticmethod
   def __warnIfUnxpctdLocalObjDetails(name, detailsDict, wsName):
+    global errCode_
     EXPECTED_KEYS = {
       "Object Class", "Comment", "Initial Value", "resource",
       "pre-allocate", "auto-allocate", "_sys_alloc_name", "_sys_alloc_timeout",
@@ -162,6 +174,7 @@ class EdifyObject:
   
   @staticmethod
   def __warnIfUnxpctdGlobalObjDetails(name, detailsDict):
+    global errCode_
     EXPECTED_KEYS = {
       "Object Class", "Comment", "Initial Value", "resource",
       "pre-allocate", "auto-allocate", "_sys_alloc_name", "_sys_alloc_timeout",
@@ -180,6 +193,17 @@ class EdifyObject:
     #end if unexpectedKeys
   #end __warnIfUnxpctdGlobalObjDetails(name, detailsDict)
   
+  #returns EdifyObject made from a dict made by toDict()
+  @classmethod
+  def fromDict(EdifyObjectClass, objDict):
+    return EdifyObjectClass(**objDict)
+  #end fromDict(EdifyObjectClass, objDict)
+  
+  #returns dict of plain json-able values, one per slot
+  def toDict(self):
+    return {slot: getattr(self, slot) for slot in self.__slots__}
+  #end toDict(self)
+  
   def __repr__(self):
     return (
       f"{self.__class__.__name__}("
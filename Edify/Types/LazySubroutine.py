@@ -0,0 +1,128 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+from Edify.Types.Subroutine import Subroutine
+
+##############################################################################
+#CONSTANTS
+##############################################################################
+#err codes
+NONE=0
+
+##############################################################################
+#GLOBALS
+##############################################################################
+#dict[Subroutine class, its lazy subclass], see lazyClassFor(WsClass)
+lazyClasses_={}
+
+##############################################################################
+#CLASSES
+##############################################################################
+#stands in for a workspace that hasn't been parsed yet
+#  only keeps its h2 header, the DocumentIndex of the report, its name and ref
+#  the 1st time any other attribute (steps, localObjs, ...) is touched it runs
+#    wsClass.fromWsHeader(...) and becomes that wsClass object in place
+#    so references to it held elsewhere see the parsed workspace
+#  use lazyClassFor(WsClass) so isinstance(ws, WsClass) holds before parsing
+#  onErr(err) is called with the err code of fromWsHeader(...) if it isn't NONE,
+#    since the parse may happen long after whoever made the proxy returned
+#  the soup the header is from is kept alive until every one is parsed
+class LazySubroutine(Subroutine):
+  #Subroutine class to parse as, set on the subclasses made by lazyClassFor(...)
+  wsClass = Subroutine
+  
+  def __init__(
+    self, wsHeader, docIndex, exceptionWorkspaces=None, calledBy=None, onErr=None
+  ):
+    #Subroutine.__init__(...) isn't called so the parsed attributes are
+    #  missing and __getattr__(...) catches them
+    self.name = self._Subflow__getName(wsHeader)
+    self.ref  = self._Subflow__getRef(wsHeader)
+    self.exceptionWorkspaces = exceptionWorkspaces
+    self.calledBy = calledBy
+    self._wsHeader = wsHeader
+    self._docIndex = docIndex
+    self._onErr = onErr
+  #end __init__(self, wsHeader, docIndex, exceptionWorkspaces, calledBy, onErr)
+  
+  ########################
+  # STATIC/CLASS METHODS #
+  ########################
+  #----------------------------------------------------------------------------
+  #same signature as Subroutine.fromWsHeader(...) but parses nothing yet
+  @classmethod
+  def fromWsHeader(LazyObjClass, wsHeader, docIndex=None):
+    docIndex = LazyObjClass.getDocIndex(wsHeader, docIndex)
+    return LazyObjClass(wsHeader, docIndex), NONE
+  #end fromWsHeader(LazyObjClass, wsHeader, docIndex)
+  
+  ####################
+  # INSTANCE METHODS #
+  ####################
+  #----------------------------------------------------------------------------
+  #only called for attributes that aren't set, i.e. before being parsed
+  def __getattr__(self, attr):
+    #dunders are looked up by pickle, copy, etc. without wanting a parse
+    if attr.startswith('__') or attr in ('_wsHeader', '_docIndex', '_onErr'):
+      raise AttributeError(attr)
+    
+    self.materialize()
+    return getattr(self, attr)
+  #end __getattr__(self, attr)
+  
+  #----------------------------------------------------------------------------
+  #parses the workspace and turns this into the wsClass object
+  #  exceptionWorkspaces and calledBy given to the proxy are kept
+  #  returns self
+  def materialize(self):
+    ws, err = self.wsClass.fromWsHeader(self._wsHeader, self._docIndex)
+    if err != NONE and self._onErr:
+      self._onErr(err)
+    
+    lazyDict = self.__dict__
+    self.__dict__ = ws.__dict__
+    #loop thru workspace list attrs to keep the ones the proxy was given
+    for attr in ('exceptionWorkspaces', 'calledBy'):
+      if lazyDict.get(attr) is not None:
+        self.__dict__[attr] = lazyDict[attr]
+    #end loop thru workspace list attrs
+    
+    self.__class__ = self.wsClass
+    return self
+  #end materialize(self)
+  
+  #----------------------------------------------------------------------------
+  #parses 1st so it reads the same as the parsed workspace
+  def __repr__(self):
+    return repr(self.materialize())
+  #end __repr__(self)
+#end class LazySubroutine
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#returns subclass of LazySubroutine and WsClass that parses as WsClass
+#  made once per WsClass
+def lazyClassFor(WsClass):
+  LazyClass = lazyClasses_.get(WsClass)
+  if not LazyClass:
+    LazyClass = type(
+      f'Lazy{WsClass.__name__}', (LazySubroutine, WsClass), {'wsClass': WsClass}
+    )
+    lazyClasses_[WsClass] = LazyClass
+  #end if no lazy class yet
+  
+  return LazyClass
+#end lazyClassFor(WsClass)
+
+#-----------------------------------------------------------------------------
+#parses every LazySubroutine in wsLst that isn't parsed yet
+#  so the soup they are from can be freed
+def materializeAll(wsLst):
+  #loop thru workspaces
+  for ws in wsLst:
+    if isinstance(ws, LazySubroutine):
+      ws.materialize()
+  #end loop thru workspaces
+#end materializeAll(wsLst)
\ No newline at end of file
@@ -1,9 +1,11 @@
 ##############################################################################
 #IMPORTS
 ##############################################################################
+import sys
 from typing import Any
 
 from ..Utils.Constants import GLOBAL_WS_NAME
+from ..Utils.Parsers   import internStr
 
 ##############################################################################
 #CONSTANTS
@@ -21,6 +23,8 @@ errCode_=NONE
 #CLASSES
 ##############################################################################
 class Param:
+  __slots__ = ('name', 'label', 'objClass', 'ioType', 'defaultVal')
+  
   def __init__(
     self, name: str, label: str, objClass: str, ioType: str, defaultVal: Any
   ):
@@ -48,15 +52,16 @@ class Param:
       errCode_ = errCode_ & BAD_PARAM_TABLE_FORMAT
       print(
         f'WARNING: "Entry Parameters" table from workspace "{wsName}" '
-        f'has unexpected number of columns'
+        f'has unexpected number of columns',
+        file=sys.stderr
       )
     #end if unexpected # of cols
     
     newParam = Param(
       name       = cols[0].text.strip(),
       label      = cols[1].text.strip(),
-      objClass   = cols[2].text.strip(),
-      ioType     = cols[3].text.strip(),
+      objClass   = internStr(cols[2].text.strip()),
+      ioType     = internStr(cols[3].text.strip()),
       defaultVal = cols[4].text.strip(),
     )
     
@@ -72,21 +77,33 @@ class Param:
       errCode_ = errCode_ & BAD_PARAM_TABLE_FORMAT
       print(
         'WARNING: "Application Object Parameters" table has '
-        'unexpected number of columns'
+        'unexpected number of columns',
+        file=sys.stderr
       )
     #end if unexpected # of cols
     
     newParam = Param(
       name       = cols[0].text.strip(),
       label      = cols[1].text.strip(),
-      objClass   = cols[2].text.strip(),
-      ioType     = cols[3].text.strip(),
+      objClass   = internStr(cols[2].text.strip()),
+      ioType     = internStr(cols[3].text.strip()),
       defaultVal = cols[4].text.strip(),
     )
     
     return newParam, errCode_
   #end __fromGlobalParamTableRow(ParamObjClass, row)
   
+  #returns Param made from a dict made by toDict()
+  @classmethod
+  def fromDict(ParamObjClass, paramDict):
+    return ParamObjClass(**paramDict)
+  #end fromDict(ParamObjClass, paramDict)
+  
+  #returns dict of plain json-able values, one per slot
+  def toDict(self):
+    return {slot: getattr(self, slot) for slot in self.__slots__}
+  #end toDict(self)
+  
   def __repr__(self):
     return (
       f"{self.__class__.__name__}("
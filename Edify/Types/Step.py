@@ -9,6 +9,8 @@ from Edify.Types.Branch import Branch
 from Edify.Types.EdifyObject import EdifyObject
 
 from ..Utils.Constants import ALL_WHITESPACE_STR
+from ..Utils.Parsers   import internStr
+from ..Utils.Errors    import EdifyParseError
 
 ##############################################################################
 #CONSTANTS
@@ -25,12 +27,22 @@ UNEXPECTED_DETAILS=8
 ##############################################################################
 errCode_=NONE
 
+#dict[step type, fromStepTableCols(cols, id, ref, wsName) of its Step class]
+#  see registerStepType(StepClass)
+stepTypes_={}
+
+#dict[step type, its Step class], used by Step.fromDict(stepDict)
+stepClasses_={}
+
 ##############################################################################
 #CLASSES
 ##############################################################################
 ##############################################################################
 #abstract
 class Step:
+  #no per-instance __dict__, there can be hundreds of thousands of steps
+  __slots__ = ('id', 'ref', 'label')
+  
   def __init__(
     self, id: str, ref: str, label: str = None
   ):
@@ -43,6 +55,7 @@ class Step:
   # STATIC/CLASS METHODS #
   ########################
   #----------------------------------------------------------------------------
+  #returns (Step, err code of this row alone)
   @classmethod
   def fromStepTableRow(StepObjClass, row, wsName):
     global errCode_
@@ -52,7 +65,8 @@ class Step:
       errCode_ = errCode_ & BAD_STEP_TABLE_FORMAT
       print(
         f'WARNING: "Steps" table in workspace with name {wsName} '
-        'has unexpected number of columns'
+        'has unexpected number of columns',
+        file=sys.stderr
       )
     #end if unexpected # of cols
     
@@ -60,36 +74,20 @@ class Step:
     ref    = StepObjClass.__getRef(cols[0])
     type   = StepObjClass.__getType(cols[0])
     
-    newStep = None
-    
-    #switch on step type
-    if type == 'Subflow':
-      newStep = SubflowStep.fromStepTableCols(cols, id, ref, wsName)
-    elif type == 'Start':
-      newStep = StartStep.fromStepTableCols(cols, id, ref, wsName)
-    elif type == 'Use System Function':
-      newStep = UseSystemFunctionStep.fromStepTableCols(cols, id, ref, wsName)
-    elif type == 'Call DLL':
-      newStep = CallDllStep.fromStepTableCols(cols, id, ref, wsName)
-    elif type == 'Choose':
-      newStep = ChooseStep.fromStepTableCols(cols, id, ref, wsName)
-    elif type == 'Assign':
-      newStep = AssignStep.fromStepTableCols(cols, id, ref, wsName)
-    elif type == 'Call':
-      newStep = CallStep.fromStepTableCols(cols, id, ref, wsName)
-    elif type == 'Goto':
-      newStep = GotoStep.fromStepTableCols(cols, id, ref, wsName)
-    elif type == 'End':
-      newStep = EndStep.fromStepTableCols(cols, id, ref, wsName)
-    else:
+    fromStepTableCols = stepTypes_.get(type)
+    #if step type not registered
+    if not fromStepTableCols:
       print(
-        f'ERROR: Unexpected step type at {wsName}::{id}... terminating...'
+        f'WARNING: Unexpected step type "{type}" at {wsName}::{id}. '
+        'Keeping it as an UnknownStep',
+        file=sys.stderr
       )
-      errCode_ = errCode_ & UNEXPECTED_STEP_TYPE
-      sys.exit(errCode_)
-    #end switch on step type
+      newStep = UnknownStep.fromStepTableCols(cols, id, ref, wsName, type)
+      return newStep, UNEXPECTED_STEP_TYPE
+    #end if step type not registered
     
-    return newStep, errCode_
+    newStep = fromStepTableCols(cols, id, ref, wsName)
+    return newStep, NONE
   #end fromStepTableRow(row, wsName)
   
   #----------------------------------------------------------------------------
@@ -126,7 +124,8 @@ class Step:
         f"WARNING: {len(colTextLines)} lines in step {wsName}::{id} "
         'is more than the 2 expected lines.\n'
         'Only keeping 1 line that starts with "Label" for Label prop. '
-        'Label prop may not be accurate.'
+        'Label prop may not be accurate.',
+        file=sys.stderr
       )
     #end if no label line elif unexpected
     
@@ -151,9 +150,36 @@ class Step:
     return None
   #end __getTarget(col)
   
+  #----------------------------------------------------------------------------
+  #returns Step made from a dict made by toDict()
+  #  called on Step, dispatches on stepDict['type'] to the registered class
+  #  types with no registered class come back as an UnknownStep
+  @classmethod
+  def fromDict(StepObjClass, stepDict):
+    if StepObjClass is Step:
+      StepClass = stepClasses_.get(stepDict['type'], UnknownStep)
+      return StepClass.fromDict(stepDict)
+    
+    fields = {key: val for key, val in stepDict.items() if key != 'type'}
+    return StepObjClass(**fields)
+  #end fromDict(StepObjClass, stepDict)
+  
   ####################
   # INSTANCE METHODS #
   ####################
+  #----------------------------------------------------------------------------
+  #returns dict of plain json-able values, 'type' then every slot
+  def toDict(self):
+    stepDict = {'type': self.type}
+    #loop thru classes from Step down to get their slots in order
+    for StepClass in reversed(self.__class__.__mro__):
+      for slot in getattr(StepClass, '__slots__', ()):
+        stepDict[slot] = getattr(self, slot)
+    #end loop thru classes from Step down to get their slots in order
+    
+    return stepDict
+  #end toDict(self)
+  
   #----------------------------------------------------------------------------
   def __repr__(self):
     return (
@@ -169,6 +195,7 @@ class Step:
 ##############################################################################
 class SubflowStep(Step):
   type = 'Subflow'
+  __slots__ = ('target',)
   
   def __init__(
     self, id: str, ref: str, target: str, label: str = None,
@@ -195,7 +222,7 @@ class SubflowStep(Step):
   def __getTarget(col):
     name = col.a.text.strip()
     ref = col.a['href']
-    return f"{name}:{ref}"
+    return internStr(f"{name}:{ref}")
   #end __getTarget(col)
   
   ####################
@@ -218,6 +245,7 @@ class SubflowStep(Step):
 ##############################################################################
 class StartStep(Step):
   type = 'Start'
+  __slots__ = ('params',)
   
   def __init__(
     self,
@@ -257,7 +285,8 @@ class StartStep(Step):
         if not warned:
           print(
             f"WARNING: Start step at {wsName}::{id} "
-            "has unexpected details before 'Parameters'"
+            "has unexpected details before 'Parameters'",
+            file=sys.stderr
           )
           warned = True
         #end if not warned
@@ -280,8 +309,9 @@ class StartStep(Step):
         ref=None
         if key != 'Parameters':
           ref = (strng.find_parent('a'))['href']
-        val = strng if not strng.endswith(', ') else ((strng.rpartition(', '))[0])
-        paramDict[key] = val+f":{ref}"
+        #str(...) so the dict doesn't keep the soup alive
+        val = str(strng) if not strng.endswith(', ') else ((strng.rpartition(', '))[0])
+        paramDict[key] = internStr(val+f":{ref}")
         key = ''
         continue
       #end if there's a key waiting for a value, this must be a value
@@ -324,6 +354,7 @@ class StartStep(Step):
 ##############################################################################
 class UseSystemFunctionStep(Step):
   type = 'Use System Function'
+  __slots__ = ('funcName',)
   
   def __init__(
     self, id: str, ref: str, funcName: str, label: str = None,
@@ -353,7 +384,8 @@ class UseSystemFunctionStep(Step):
     if not funcName.startswith('Function Name'):
       print(
         "WARNING: could not find function name in first line of step detail "
-        f"for step {wsName}::{id}."
+        f"for step {wsName}::{id}.",
+        file=sys.stderr
       )
       return None
     #end if didn't find function name
@@ -382,6 +414,7 @@ class UseSystemFunctionStep(Step):
 ##############################################################################
 class CallDllStep(Step):
   type = 'Call DLL'
+  __slots__ = ('funcName', 'prototype', 'args')
   
   def __init__(
     self, id: str, ref: str,
@@ -422,7 +455,8 @@ class CallDllStep(Step):
     if not funcNameLine:
       print(
         "WARNING: could not find function name in step detail "
-        f"for step {wsName}::{id}."
+        f"for step {wsName}::{id}.",
+        file=sys.stderr
       )
       return None
     #end if not found function name
@@ -471,7 +505,8 @@ class CallDllStep(Step):
     if not prototypeLine:
       print(
         "WARNING: could not find prototype in step detail "
-        f"for step {wsName}::{id}."
+        f"for step {wsName}::{id}.",
+        file=sys.stderr
       )
       return None
     #end if not found prototype
@@ -496,7 +531,8 @@ class CallDllStep(Step):
     if not argFont:
       print(
         "WARNING: could not find args in step detail "
-        f"for step {wsName}::{id}."
+        f"for step {wsName}::{id}.",
+        file=sys.stderr
       )
       return None
     #end if not found args
@@ -528,7 +564,7 @@ class CallDllStep(Step):
       key = keyTag.text.strip()
       valTag = keyTag.find_next_sibling('font')
       ref  = valTag.a['href']
-      val = valTag.text.strip() + f":{ref}"
+      val = internStr(valTag.text.strip() + f":{ref}")
       argDict[key] = val
     #end loop thru arg tags
     
@@ -557,6 +593,7 @@ class CallDllStep(Step):
 ##############################################################################
 class ChooseStep(Step):
   type = 'Choose'
+  __slots__ = ('branches',)
   
   def __init__(
     self, id: str, ref: str,
@@ -647,7 +684,7 @@ class ChooseStep(Step):
         ref = ChooseStep.__parseRef(tag, wsName, id, branchId)
         
         key = ChooseStep.__shortenKey(key)
-        branchDetailsDict[key] = f"{val}:{ref}"
+        branchDetailsDict[key] = internStr(f"{val}:{ref}")
         key = ''
         val = ''
         ref = None
@@ -673,12 +710,14 @@ class ChooseStep(Step):
         if len(linkLst) > 1:
           print(
             f"WARNING: Branch {branchId} in choose step {wsName}::{id} "
-            "has multiple 'a' tags. Just using ref from first"
+            "has multiple 'a' tags. Just using ref from first",
+            file=sys.stderr
           )
         elif len(linkLst) < 1:
           print(
             f"WARNING: Branch {branchId} in choose step {wsName}::{id} "
-            "has no 'a' tags."
+            "has no 'a' tags.",
+            file=sys.stderr
           )
           
           return ref
@@ -706,9 +745,23 @@ class ChooseStep(Step):
       return key
   #end __shortenKey(key)
   
+  #----------------------------------------------------------------------------
+  @classmethod
+  def fromDict(ChooseStepObjClass, stepDict):
+    branches = [Branch.fromDict(branch) for branch in stepDict['branches'] or []]
+    return super().fromDict(stepDict | {'branches': branches})
+  #end fromDict(ChooseStepObjClass, stepDict)
+  
   ####################
   # INSTANCE METHODS #
   ####################
+  #----------------------------------------------------------------------------
+  def toDict(self):
+    stepDict = super().toDict()
+    stepDict['branches'] = [branch.toDict() for branch in self.branches or []]
+    return stepDict
+  #end toDict(self)
+  
   #----------------------------------------------------------------------------
   def __repr__(self):
     return (
@@ -726,6 +779,7 @@ class ChooseStep(Step):
 ##############################################################################
 class AssignStep(Step):
   type = 'Assign'
+  __slots__ = ('obj', 'val')
   
   def __init__(
     self,
@@ -762,7 +816,7 @@ class AssignStep(Step):
     objLink = (col.find_all('a'))[1]
     name = objLink.text.strip()
     ref  = objLink['href']
-    return f"{name}:{ref}"
+    return internStr(f"{name}:{ref}")
   #end __getObj(col, wsName, id)
   
   #----------------------------------------------------------------------------
@@ -773,12 +827,11 @@ class AssignStep(Step):
     elif col.text.strip().startswith('Value = '):
       return AssignStep.__parseValue(col, wsName, id)
     else:
-      print(
-        f'ERROR: Unexpected details in AssignStep {wsName}::{id}. '
-        'It does not start with "Expression = " or "Value = "\n'
-        'Terminating...'
+      raise EdifyParseError(
+        f'Unexpected details in AssignStep {wsName}::{id}. '
+        'It does not start with "Expression = " or "Value = "',
+        UNEXPECTED_DETAILS, __name__
       )
-      sys.exit(0)
   #end __getVal(col, wsName, id)
   
   #----------------------------------------------------------------------------
@@ -805,7 +858,7 @@ class AssignStep(Step):
         if linkParent:
           ref = linkParent['href']
         
-        detailDict[key] = f"{val}:{ref}"
+        detailDict[key] = internStr(f"{val}:{ref}")
         
         key = ''
         val = ''
@@ -835,21 +888,23 @@ class AssignStep(Step):
       if len(linkLst) > 1:
         print(
           f"WARNING: Assign step {wsName}::{id} "
-          "has multiple 'a' tags. Just using ref from first"
+          "has multiple 'a' tags. Just using ref from first",
+          file=sys.stderr
         )
       elif len(linkLst) < 1:
         print(
           f"WARNING: Assign step {wsName}::{id} "
-          "has no 'a' tags."
+          "has no 'a' tags.",
+          file=sys.stderr
         )
         
-        return f"{name}:{ref}"
+        return internStr(f"{name}:{ref}")
       #end if unxpctd # of links
       
       ref = (linkLst[0])['href']
     #end if valTag is a or has a link, elif
     
-    return f"{name}:{ref}"
+    return internStr(f"{name}:{ref}")
   #end __parseValue(col, wsName, id)
   
   ####################
@@ -873,6 +928,7 @@ class AssignStep(Step):
 ##############################################################################
 class CallStep(Step):
   type = 'Call'
+  __slots__ = ('target', 'params')
   
   def __init__(
     self,
@@ -918,13 +974,14 @@ class CallStep(Step):
       if inTarget:
         name = strng.text
         ref  = strng.find_parent('a')['href']
-        return f"{name}:{ref}"
+        return internStr(f"{name}:{ref}")
     #end loop thru strings in col to look for target
     
     #if didn't find target
     print(
       f'WARNING: Call steps {wsName}::{id} '
-      'does not have a target.'
+      'does not have a target.',
+      file=sys.stderr
     )
     return None
   #end __getTarget(col, wsName, id)
@@ -962,7 +1019,7 @@ class CallStep(Step):
           if linkParent:
             ref = linkParent['href']
           
-          paramDict[key] = f"{val}:{ref}"
+          paramDict[key] = internStr(f"{val}:{ref}")
           
           key = ''
           val = ''
@@ -995,6 +1052,7 @@ class CallStep(Step):
 ##############################################################################
 class GotoStep(Step):
   type = 'Goto'
+  __slots__ = ('target',)
   
   def __init__(
     self,
@@ -1044,16 +1102,15 @@ class GotoStep(Step):
         if linkParent:
           ref = linkParent['href']
         
-        return f"{name}:{ref}"
+        return internStr(f"{name}:{ref}")
       #end if inTarget
     #end loop thru strings in col to look for target
     
     #if didn't find target
-    print(
-      f'ERROR: Goto step {wsName}::{id} '
-      'does not have a target.'
+    raise EdifyParseError(
+      f'Goto step {wsName}::{id} does not have a target.',
+      UNEXPECTED_DETAILS, __name__
     )
-    sys.exit(1)
   #end __getTarget(col, wsName, id)
   
   ####################
@@ -1076,6 +1133,7 @@ class GotoStep(Step):
 ##############################################################################
 class EndStep(Step):
   type = 'End'
+  __slots__ = ('rtnMode',)
   
   def __init__(
     self,
@@ -1124,11 +1182,10 @@ class EndStep(Step):
     #end loop thru strings in col to look for target
     
     #if didn't find target
-    print(
-      f'ERROR: End step {wsName}::{id} '
-      'does not have a return mode.'
+    raise EdifyParseError(
+      f'End step {wsName}::{id} does not have a return mode.',
+      UNEXPECTED_DETAILS, __name__
     )
-    sys.exit(1)
   #end __getRtnMode(col, wsName, id)
   
   ####################
@@ -1146,4 +1203,81 @@ class EndStep(Step):
       + ")"
     )
   #end __repr(self)__
-#end class EndStep(Step)
\ No newline at end of file
+#end class EndStep(Step)
+
+##############################################################################
+#placeholder for a step of a type no Step class is registered for
+#  keeps the type and the text of the step details so nothing is lost
+class UnknownStep(Step):
+  __slots__ = ('type', 'details')
+  
+  def __init__(
+    self, id: str, ref: str, type: str, details: str = None,
+    label: str = None
+  ):
+    super().__init__(id=id, ref=ref, label=label)
+    self.type: str    = type
+    self.details: str = details
+  #end __init__(...)
+  
+  ########################
+  # STATIC/CLASS METHODS #
+  ########################
+  #----------------------------------------------------------------------------
+  @classmethod
+  def fromStepTableCols(UnknownStepObjClass, cols, id, ref, wsName, type):
+    details = cols[1].text.strip() if len(cols) > 1 else None
+    label   = UnknownStepObjClass._Step__getLabel(cols[0], wsName, id)
+    
+    newStep = UnknownStepObjClass(
+      id=id, ref=ref, type=type, details=details, label=label
+    )
+    return newStep
+  #end fromStepTableCols(UnknownStepObjClass, cols, id, ref, wsName, type)
+  
+  #----------------------------------------------------------------------------
+  #keeps the type, it isn't a class attribute here
+  @classmethod
+  def fromDict(UnknownStepObjClass, stepDict):
+    return UnknownStepObjClass(**stepDict)
+  #end fromDict(UnknownStepObjClass, stepDict)
+  
+  ####################
+  # INSTANCE METHODS #
+  ####################
+  #----------------------------------------------------------------------------
+  def __repr__(self):
+    return (
+      f"{self.__class__.__name__}("
+      +   "id="      + (f"{repr(self.id)}")
+      + ", ref="     + (f"{repr(self.ref)}")
+      + ", type="    + (f"{repr(self.type)}")
+      + ", label="   + (f"{repr(self.label)}")
+      + ", details=" + (f"{repr(self.details)}")
+      + ")"
+    )
+  #end __repr(self)__
+#end class UnknownStep(Step)
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#makes Step.fromStepTableRow(...) parse steps of type StepClass.type
+#  with StepClass.fromStepTableCols(cols, id, ref, wsName)
+#  replaces whatever was registered for that type before
+#  returns StepClass so it can be used as a class decorator by plugins
+#    adding step types (e.g. 'Play Prompt', 'Record') outside this file
+def registerStepType(StepClass):
+  stepTypes_[StepClass.type]   = StepClass.fromStepTableCols
+  stepClasses_[StepClass.type] = StepClass
+  return StepClass
+#end registerStepType(StepClass)
+
+#loop thru built in step types to register them
+for StepClass in (
+  SubflowStep, StartStep, UseSystemFunctionStep, CallDllStep, ChooseStep,
+  AssignStep, CallStep, GotoStep, EndStep
+):
+  registerStepType(StepClass)
+#end loop thru built in step types to register them
\ No newline at end of file
@@ -7,8 +7,9 @@ from typing import Any
 
 from Edify.Types.Step import Step, SubflowStep
 
-from ..Utils.Parsers import parseDetails
+from ..Utils.Parsers import parseDetails, internStr
 from ..Utils.Constants import GLOBAL_WS_NAME
+from ..Utils.DocumentIndex import DocumentIndex
 
 import os
 oldPath = sys.path
@@ -23,6 +24,8 @@ sys.path = oldPath
 NONE=0
 BAD_OBJ_TABLE_FORMAT=1
 UNEXPECTED_KEYS=2
+#passed on from Edify.Types.Step for its steps and those of its subflows
+UNEXPECTED_STEP_TYPE=4
 
 ##############################################################################
 #GLOBALS
@@ -37,35 +40,69 @@ class Subflow:
     self,
     name: str,
     steps: list[Step] = field(default_factory=list),
-    subflows: list['Subflow'] = None
+    subflows: list['Subflow'] = None,
+    ref: str = None
   ):
     self.name: str = name
     self.steps: list[step] = steps
     self.subflows: list['Subflow'] = subflows
+    self.ref: str = ref
   #end __init__(...)
   
   ########################
   # STATIC/CLASS METHODS #
   ########################
   #----------------------------------------------------------------------------
+  #docIndex is the Edify.Utils.DocumentIndex of the whole report
+  #  used to find the headers of invoked subflows
+  #  and to share parsed subflows between every workspace that invokes them
+  #returns (Subflow, err code), same as Subroutine.fromWsHeader(...)
   @classmethod
-  def fromWsHeader(ObjClass, wsHeader):
+  def fromWsHeader(ObjClass, wsHeader, docIndex=None):
+    docIndex   = ObjClass.getDocIndex(wsHeader, docIndex)
+    wsTables   = ObjClass.mapWsTables(wsHeader)
     name       = ObjClass.__getName(wsHeader)
-    steps, err = ObjClass.__getSteps(wsHeader, name)
-    subflows   = ObjClass.__getSubflows(wsHeader, steps, name)
+    ref        = ObjClass.__getRef(wsHeader)
+    steps, err = ObjClass.__getSteps(wsTables, name)
     
     newObj = ObjClass(
       name = name,
+      ref = ref,
       steps = steps,
-      subflows = subflows
+      subflows = []
     )
     
-    return newObj
-  #end fromWsHeader(ObjClass, wsHeader)
+    #cache before getting subflows so subflows that invoke each other
+    #  get this same object instead of recursing forever
+    if ref:
+      docIndex.subflows[ref] = newObj
+    newObj.subflows, subflowsErr = ObjClass.__getSubflows(
+      wsHeader, steps, name, docIndex
+    )
+    
+    return newObj, err | subflowsErr
+  #end fromWsHeader(ObjClass, wsHeader, docIndex)
   
   #----------------------------------------------------------------------------
+  #returns docIndex, or a new one for the whole soup wsHeader is in
   @staticmethod
-  def findWsTable(wsHeader, tblCaptionStrtTxt):
+  def getDocIndex(wsHeader, docIndex):
+    if docIndex:
+      return docIndex
+    
+    soup = list(wsHeader.parents)[-1]
+    return DocumentIndex(soup)
+  #end getDocIndex(wsHeader, docIndex)
+  
+  #----------------------------------------------------------------------------
+  #returns dict[captionText, table] of every captioned table in the section
+  #  between wsHeader and the next header
+  #  only the first table with a given caption text is kept
+  #  insertion order is document order
+  @staticmethod
+  def mapWsTables(wsHeader):
+    wsTables = {}
+    
     #loop thru sibling tags until next header
     for tag in wsHeader.next_siblings:
       if tag.name == wsHeader.name:
@@ -73,45 +110,73 @@ class Subflow:
       
       #if tag is searchable
       if callable(getattr(tag, 'find_all', None)):
-        captions = tag.find_all('caption')
-        for caption in captions:
-          if caption.text.strip().startswith(tblCaptionStrtTxt):
-            return caption.find_parent('table')
+        for caption in tag.find_all('caption'):
+          wsTables.setdefault(caption.text.strip(), caption.find_parent('table'))
     #loop thru sibling tags until next header
     
+    return wsTables
+  #end mapWsTables(wsHeader)
+  
+  #----------------------------------------------------------------------------
+  @staticmethod
+  def findWsTable(wsHeader, tblCaptionStrtTxt):
+    wsTables = Subflow.mapWsTables(wsHeader)
+    return Subflow.lookupWsTable(wsTables, tblCaptionStrtTxt)
+  #end findWsTable(wsHeader, tblCaptionStrtTxt)
+  
+  #----------------------------------------------------------------------------
+  #wsTables is the result of mapWsTables(wsHeader)
+  #  use this instead of findWsTable(...) when looking up
+  #  more than one table in the same workspace
+  @staticmethod
+  def lookupWsTable(wsTables, tblCaptionStrtTxt):
+    #loop thru workspace tables to find the right one
+    for captionText, table in wsTables.items():
+      if captionText.startswith(tblCaptionStrtTxt):
+        return table
+    #end loop thru workspace tables to find the right one
+    
     #if didn't find right table
     return None
-  #end __findWsTable(wsHeader, tblName)
+  #end lookupWsTable(wsTables, tblCaptionStrtTxt)
   
   #----------------------------------------------------------------------------
   @staticmethod
   def __getName(wsHeader):
-    return wsHeader.a.text.strip()
+    return internStr(wsHeader.a.text.strip())
   #end __getName(wsHeader)
   
   #----------------------------------------------------------------------------
   @staticmethod
-  def __getSteps(wsHeader, wsName):
+  def __getRef(wsHeader):
+    return wsHeader.a.get('name')
+  #end __getRef(wsHeader)
+  
+  #----------------------------------------------------------------------------
+  @staticmethod
+  def __getSteps(wsTables, wsName):
     stepLst = []
     
-    stepTable = Subflow.findWsTable(wsHeader, 'Steps')
+    stepTable = Subflow.lookupWsTable(wsTables, 'Steps')
     if not stepTable:
-      return stepLst
+      return stepLst, NONE
     
     stepLst, err = Subflow.__parseStepTable(stepTable, wsName)
     
     return stepLst, err
-  #end __getSteps(wsHeader, wsName)
+  #end __getSteps(wsTables, wsName)
   
   #----------------------------------------------------------------------------
   @staticmethod
   def __parseStepTable(table, wsName):
     stepLst = []
+    err = NONE
     
     rows = table.find_all('tr')
     #loop thru global objects
     for row in rows:
-      newObj, err = Step.fromStepTableRow(row, wsName)
+      newObj, rowErr = Step.fromStepTableRow(row, wsName)
+      err = err | rowErr
       stepLst.append(newObj)
     #end loop thru global objects
     
@@ -121,23 +186,46 @@ class Subflow:
   #----------------------------------------------------------------------------
   #depends on already having a list of Step objects
   #  for the workspace with name wsName and header wsHeader
+  #returns (subflowLst, err codes of the subflows parsed for it)
+  #  subflows already parsed for another workspace add no err code
+  #  and their headers aren't looked up again (when streaming, each
+  #  lookup makes a soup of the subflow's section)
   @staticmethod
-  def __getSubflows(wsHeader, steps, wsName):
+  def __getSubflows(wsHeader, steps, wsName, docIndex):
     subflowLst = []
+    err = NONE
     
-    headerLst = Subflow.__findSubflowHeaders(wsHeader, steps, wsName)
+    refLst = Subflow.__getSubflowRefs(wsHeader, steps, wsName)
+    parsed = {ref: docIndex.subflows[ref] for ref in refLst if ref in docIndex.subflows}
+    headerLst = Subflow.__findSubflowHeaders(
+      [ref for ref in refLst if ref not in parsed], wsName, docIndex
+    )
     
+    #loop thru subflow headers not parsed yet
     for header in headerLst:
-      subflowLst.append(Subflow.fromWsHeader(header))
+      #if parsed meanwhile, while parsing an earlier one that invokes it
+      subflow = docIndex.subflows.get(header.a['name'])
+      if not subflow:
+        subflow, subflowErr = Subflow.fromWsHeader(header, docIndex)
+        err = err | subflowErr
+      
+      parsed[header.a['name']] = subflow
+    #end loop thru subflow headers not parsed yet
     
+    #loop thru refs to list the subflows in order of first invocation
+    for ref in refLst:
+      if ref in parsed:
+        subflowLst.append(parsed[ref])
+    #end loop thru refs to list the subflows
     
-    return subflowLst
-  #end __getSubflows(wsHeader, wsName)
+    return subflowLst, err
+  #end __getSubflows(wsHeader, steps, wsName, docIndex)
   
   #----------------------------------------------------------------------------
+  #returns refs in order of first invocation, without duplicates
   @staticmethod
   def __getSubflowRefs(wsHeader, steps, wsName):
-    refSet = set()
+    refLst = []
     
     #loop thru steps looking for subflow invocations
     for step in steps:
@@ -149,57 +237,151 @@ class Subflow:
       #  and then remove the leading pound sign char (#)
       targetRef = ((step.target.rsplit(':', 1))[1])[1:]
       
-      refSet.add(targetRef)
+      if targetRef not in refLst:
+        refLst.append(targetRef)
     #end loop thru steps looking for subflow invocations
     
-    return refSet
+    return refLst
   #end __getSubflowRefs(wsHeader, steps, wsName)
   
   #----------------------------------------------------------------------------
+  #returns h2 headers of the subflows with refs in refLst
   @staticmethod
-  def __findSubflowHeaders(wsHeader, steps, wsName):
+  def __findSubflowHeaders(refLst, wsName, docIndex):
     headerLst = []
     
-    refSet = Subflow.__getSubflowRefs(wsHeader, steps, wsName)
-    if not refSet:
+    if not refLst:
       return headerLst
     
-    #loop thru headers in soup to find any subflow header
-    #  invoked by workspace with header wsHeader and name wsName
-    for header in wsHeader.find_next_siblings('h2'):
-      #if header has an <a> tag
-      if header.a:
-        headerRef = header.a.get('name')
-        #if found header for subflow invoked by this workspace
-        if headerRef in refSet:
-          headerLst.append(header)
-          #if found headers for all invoked subflows
-          if len(headerLst) == len(refSet):
-            break
-          #end if found headers for all invoked subflows          
-        #end if found header for subflow invoked by this workspace
-      #end if header has an <a> tag
-    #end loop thru headers in soup to find any subflow header
+    #loop thru refs to find the header of each subflow
     #  invoked by workspace with header wsHeader and name wsName
+    for ref in refLst:
+      header = docIndex.headersByAnchor.get(ref)
+      if header:
+        headerLst.append(header)
+    #end loop thru refs to find the header of each subflow
     
     #if didn't find Subflow headers for all invoked subflows
-    if not len(headerLst) == len(refSet):
+    if not len(headerLst) == len(refLst):
       print(
         f'WARNING: Could not find headers for all subflows invoked by workspace "{wsName}"...\n'
         'List of subflow headers (headerLst) = \n'
         f'{repr(headerLst)}\n'
         '\n'
-        'list of refs to invoked subflows (refSet) = \n'
-        f'{repr(refSet)}'
+        'list of refs to invoked subflows (refLst) = \n'
+        f'{repr(refLst)}',
+        file=sys.stderr
       )
     #end if didn't find Subflow headers for all invoked subflows
     
     return headerLst
-  #end __findSubflowHeaders(wsHeader, steps, wsName)
+  #end __findSubflowHeaders(refLst, wsName, docIndex)
+  
+  #----------------------------------------------------------------------------
+  #returns Subflow made from a dict made by toDict()
+  #  subflowsByRef is dict[ref, Subflow] of the subflows it may invoke
+  @classmethod
+  def fromDict(ObjClass, flowDict, subflowsByRef=None):
+    return ObjClass(
+      name = flowDict['name'],
+      ref = flowDict['ref'],
+      steps = [Step.fromDict(step) for step in flowDict['steps']],
+      subflows = ObjClass.linkSubflows(flowDict, subflowsByRef or {})
+    )
+  #end fromDict(ObjClass, flowDict, subflowsByRef)
+  
+  #----------------------------------------------------------------------------
+  #adds a Subflow for each dict made by toDict() in flowDicts to
+  #  subflowsByRef (dict[ref, Subflow]) and returns it
+  #  refs already in subflowsByRef are kept, so subflows made for one
+  #    workspace are shared with the next
+  #  all are made before any are linked so subflows that invoke each other
+  #    get the same objects
+  @staticmethod
+  def subflowsFromDicts(flowDicts, subflowsByRef=None):
+    subflowsByRef = {} if subflowsByRef is None else subflowsByRef
+    
+    newFlows = []
+    #loop thru subflow dicts to make the ones not made yet
+    for flowDict in flowDicts:
+      if flowDict['ref'] in subflowsByRef:
+        continue
+      
+      subflow = Subflow.fromDict(flowDict | {'subflows': []})
+      subflowsByRef[subflow.ref] = subflow
+      newFlows.append((subflow, flowDict))
+    #end loop thru subflow dicts to make the ones not made yet
+    
+    #loop thru new subflows to link the subflows they invoke
+    for subflow, flowDict in newFlows:
+      subflow.subflows = Subflow.linkSubflows(flowDict, subflowsByRef)
+    
+    return subflowsByRef
+  #end subflowsFromDicts(flowDicts, subflowsByRef)
+  
+  #----------------------------------------------------------------------------
+  #returns list of the Subflows in subflowsByRef that the flow dict invokes
+  @staticmethod
+  def linkSubflows(flowDict, subflowsByRef):
+    refLst = flowDict['subflows']
+    if refLst is None:
+      return None
+    
+    missing = [ref for ref in refLst if ref not in subflowsByRef]
+    if missing:
+      print(
+        f'WARNING: No definition for subflows {missing} '
+        f'invoked by workspace "{flowDict["name"]}"',
+        file=sys.stderr
+      )
+    
+    return [subflowsByRef[ref] for ref in refLst if ref in subflowsByRef]
+  #end linkSubflows(flowDict, subflowsByRef)
+  
+  #----------------------------------------------------------------------------
+  #returns list of every Subflow invoked by the flows in flowLst
+  #  directly or thru other subflows, each once
+  @staticmethod
+  def reachableSubflows(flowLst):
+    subflowLst = []
+    seen = set()
+    
+    toVisit = list(flowLst)
+    #loop thru flows not visited yet
+    while toVisit:
+      flow = toVisit.pop()
+      #loop thru subflows invoked by flow
+      for subflow in flow.subflows or []:
+        if id(subflow) in seen:
+          continue
+        seen.add(id(subflow))
+        subflowLst.append(subflow)
+        toVisit.append(subflow)
+      #end loop thru subflows invoked by flow
+    #end loop thru flows not visited yet
+    
+    return subflowLst
+  #end reachableSubflows(flowLst)
   
   ####################
   # INSTANCE METHODS #
   ####################
+  #----------------------------------------------------------------------------
+  #returns dict of plain json-able values
+  #  invoked subflows are kept as their refs so shared and recursive
+  #  subflows are only written once, see reachableSubflows(flowLst)
+  def toDict(self):
+    return {
+      'name': self.name,
+      'ref': self.ref,
+      'steps': [step.toDict() for step in self.steps],
+      'subflows': (
+        None if self.subflows is None
+        else [subflow.ref for subflow in self.subflows]
+      ),
+    }
+  #end toDict(self)
+  
   #----------------------------------------------------------------------------
   def __repr__(self):
     return (
@@ -10,6 +10,7 @@ from Edify.Types.Step        import Step
 from Edify.Types.Subflow     import Subflow
 
 from ..Utils.Parsers import parseDetails, parseParamTable, parseObjectsTable, parseXcptnHndlrTbl
+from ..Utils.Parsers import internStr, internStrs
 from ..Utils.Constants import GLOBAL_WS_NAME
 
 import os
@@ -25,6 +26,8 @@ sys.path = oldPath
 NONE=0
 BAD_WORKSPACE_LIST_TABLE_FORMAT=1
 UNEXPECTED_KEYS=2
+#passed on from Edify.Types.Subflow for its steps and those of its subflows
+UNEXPECTED_STEP_TYPE=4
 
 ##############################################################################
 #GLOBALS
@@ -48,9 +51,10 @@ class Subroutine(Subflow):
     exceptionHandlerMap: dict[str, str] = None,
     
     localObjs: list[EdifyObject] = None,    
-    subflows: list[Subflow] = None
+    subflows: list[Subflow] = None,
+    ref: str = None
   ):
-    super().__init__(name=name, steps=steps, subflows=subflows)
+    super().__init__(name=name, steps=steps, subflows=subflows, ref=ref)
     self.exceptionWorkspaces: list[str] = exceptionWorkspaces
     self.calledBy: list[str] = calledBy
     #prob unecessary: self.type: str = type
@@ -67,17 +71,23 @@ class Subroutine(Subflow):
   ########################
   #TODO: merger fromWsHeader(...) with fromWorkspaceLstTableRow(...)
   #----------------------------------------------------------------------------
+  #docIndex is the Edify.Utils.DocumentIndex of the whole report
+  #  used to find the headers of invoked subflows
   @classmethod
-  def fromWsHeader(ObjClass, wsHeader):
+  def fromWsHeader(ObjClass, wsHeader, docIndex=None):
+    docIndex            = ObjClass.getDocIndex(wsHeader, docIndex)
+    wsTables            = ObjClass.mapWsTables(wsHeader)
     name                = ObjClass._Subflow__getName(wsHeader)
-    steps, err          = ObjClass._Subflow__getSteps(wsHeader, name)
-    entryParams, err    = ObjClass.__getParams(wsHeader, name)
-    localObjs, err      = ObjClass.__getLocalObjs(wsHeader, name)
-    subflows            = ObjClass._Subflow__getSubflows(wsHeader, steps, name)
-    exceptionHandlerMap = ObjClass.__getExceptionHandlerMap(wsHeader, name)
+    ref                 = ObjClass._Subflow__getRef(wsHeader)
+    steps, stepsErr     = ObjClass._Subflow__getSteps(wsTables, name)
+    entryParams, err    = ObjClass.__getParams(wsTables, name)
+    localObjs, err      = ObjClass.__getLocalObjs(wsTables, name)
+    subflows, subflowsErr = ObjClass._Subflow__getSubflows(wsHeader, steps, name, docIndex)
+    exceptionHandlerMap = ObjClass.__getExceptionHandlerMap(wsTables, name)
     
     newObj = ObjClass(
       name        = name,
+      ref         = ref,
       steps       = steps,
       entryParams = entryParams.split(' , ') if splittable(entryParams) else entryParams,
       localObjs   = localObjs.split(' , ') if splittable(localObjs) else localObjs,
@@ -85,8 +95,9 @@ class Subroutine(Subflow):
       exceptionHandlerMap = exceptionHandlerMap
     )
     
+    err = err | ((stepsErr | subflowsErr) & UNEXPECTED_STEP_TYPE)
     return newObj, err
-  #end fromWsHeader(wsHeader)
+  #end fromWsHeader(wsHeader, docIndex)
   
   #TODO: merger fromWsHeader(...) with fromWorkspaceLstTableRow(...)
   #----------------------------------------------------------------------------
@@ -99,7 +110,8 @@ class Subroutine(Subflow):
       errCode_ = errCode_ & BAD_WORKSPACE_LIST_TABLE_FORMAT
       print(
         'WARNING: "Workspace List" table has '
-        'unexpected number of columns'
+        'unexpected number of columns',
+        file=sys.stderr
       )
     #end if unexpected # of cols
     
@@ -113,9 +125,13 @@ class Subroutine(Subflow):
     newCalledBy    = detailsDict.get("Called by")
     
     newSubroutine = SubroutineObjClass(
-      name = name,
-      exceptionWorkspaces = newExceptionWs.split(' , ') if splittable(newExceptionWs) else newExceptionWs,
-      calledBy = newCalledBy.split(' , ') if splittable(newCalledBy) else newCalledBy
+      name = internStr(name),
+      exceptionWorkspaces = internStrs(
+        newExceptionWs.split(' , ') if splittable(newExceptionWs) else newExceptionWs
+      ),
+      calledBy = internStrs(
+        newCalledBy.split(' , ') if splittable(newCalledBy) else newCalledBy
+      )
     ) #end newSubroutine SubroutineObjClass()
     
     return newSubroutine, errCode_
@@ -124,6 +140,7 @@ class Subroutine(Subflow):
   #----------------------------------------------------------------------------
   @staticmethod
   def __warnIfUnexpectedWorkspaceDetails(name, detailsDict):
+    global errCode_
     EXPECTED_KEYS = { "Exception Workspaces", "Called by" }
     
     #set difference
@@ -187,12 +204,12 @@ class Subroutine(Subflow):
   
   #----------------------------------------------------------------------------
   @staticmethod
-  def __getParams(wsHeader, wsName):
+  def __getParams(wsTables, wsName):
     paramLst = []
     errCode = NONE
     
     #paramTable = Subroutine.__findParamTable(wsHeader)
-    paramTable = Subroutine.findWsTable(wsHeader, 'Entry Parameters')
+    paramTable = Subroutine.lookupWsTable(wsTables, 'Entry Parameters')
     if not paramTable:
       return paramLst, errCode
     
@@ -200,36 +217,36 @@ class Subroutine(Subflow):
     errCode = errCode & err #forward all errors
     
     return paramLst, errCode
-  #end __getParams(wsHeader, name)
+  #end __getParams(wsTables, wsName)
   
   #----------------------------------------------------------------------------
   @staticmethod
-  def __getLocalObjs(wsHeader, wsName):
+  def __getLocalObjs(wsTables, wsName):
     objLst = []
     err = 0
     
-    localObjTable = Subroutine.findWsTable(wsHeader, 'Local Objects')
+    localObjTable = Subroutine.lookupWsTable(wsTables, 'Local Objects')
     if not localObjTable:
       return objLst, err
     
     objLst, err = parseObjectsTable(localObjTable, wsName)
     
     return objLst, err
-  #end __getLocalObjs(wsHeader)
+  #end __getLocalObjs(wsTables, wsName)
   
   #----------------------------------------------------------------------------
   @staticmethod
-  def __getExceptionHandlerMap(wsHeader, wsName):
+  def __getExceptionHandlerMap(wsTables, wsName):
     handlerMap = {}
     
-    xcptnHndlrTbl = Subroutine.findWsTable(wsHeader, 'Exception Handling Table')
+    xcptnHndlrTbl = Subroutine.lookupWsTable(wsTables, 'Exception Handling Table')
     if not xcptnHndlrTbl:
       return handlerMap
     
     handlerMap = parseXcptnHndlrTbl(xcptnHndlrTbl, wsName)
     
     return handlerMap
-  #end __getExceptionHandlerMap(wsHeader, wsName)
+  #end __getExceptionHandlerMap(wsTables, wsName)
   
   #----------------------------------------------------------------------------
   @staticmethod
@@ -242,9 +259,54 @@ class Subroutine(Subflow):
     return subflowLst, err
   #end __getLocalObjs(wsHeader, wsName)
   
+  #----------------------------------------------------------------------------
+  #returns Subroutine made from a dict made by toDict()
+  #  subflowsByRef is dict[ref, Subflow] of the subflows it may invoke
+  @classmethod
+  def fromDict(ObjClass, wsDict, subflowsByRef=None):
+    entryParams = wsDict['entryParams']
+    localObjs   = wsDict['localObjs']
+    
+    return ObjClass(
+      name = wsDict['name'],
+      ref = wsDict['ref'],
+      steps = [Step.fromDict(step) for step in wsDict['steps']],
+      exceptionWorkspaces = wsDict['exceptionWorkspaces'],
+      calledBy = wsDict['calledBy'],
+      entryParams = (
+        None if entryParams is None
+        else [Param.fromDict(param) for param in entryParams]
+      ),
+      exceptionHandlerMap = wsDict['exceptionHandlerMap'],
+      localObjs = (
+        None if localObjs is None
+        else [EdifyObject.fromDict(obj) for obj in localObjs]
+      ),
+      subflows = ObjClass.linkSubflows(wsDict, subflowsByRef or {})
+    )
+  #end fromDict(ObjClass, wsDict, subflowsByRef)
+  
   ####################
   # INSTANCE METHODS #
   ####################
+  #----------------------------------------------------------------------------
+  #returns dict of plain json-able values, see Subflow.toDict()
+  def toDict(self):
+    return super().toDict() | {
+      'exceptionWorkspaces': self.exceptionWorkspaces,
+      'calledBy': self.calledBy,
+      'entryParams': (
+        None if self.entryParams is None
+        else [param.toDict() for param in self.entryParams]
+      ),
+      'exceptionHandlerMap': self.exceptionHandlerMap,
+      'localObjs': (
+        None if self.localObjs is None
+        else [obj.toDict() for obj in self.localObjs]
+      ),
+    }
+  #end toDict(self)
+  
   #----------------------------------------------------------------------------
   def __repr__(self):
     return (
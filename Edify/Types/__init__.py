@@ -1 +1 @@
-__all__=['EdifyObject', 'Subflow', 'Subroutine', 'Step', 'Param', 'Branch']
\ No newline at end of file
+__all__=['EdifyObject', 'Subflow', 'Subroutine', 'LazySubroutine', 'Step', 'Param', 'Branch']
\ No newline at end of file
@@ -1,20 +1,22 @@
 ##############################################################################
 #CONSTANTS
 ##############################################################################
-ALL_WHITESPACE_STR = ''
-d = 0
-c = None
-#loop thru dec char values
-while True:
-  try:
-    c = chr(d)
-  except ValueError:
-    break
-  
-  if c.isspace():
-    ALL_WHITESPACE_STR += c
-  
-  d += 1
-#end loop thru dec char values
+#every char for which str.isspace() is True
+#  frozen here so importing doesn't have to scan every unicode code point
+#  regenerate with:
+#    ''.join(chr(d) for d in range(sys.maxunicode+1) if chr(d).isspace())
+ALL_WHITESPACE_STR = (
+  '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0'
+  '\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009'
+  '\u200a\u2028\u2029\u202f\u205f\u3000'
+)
 
-GLOBAL_WS_NAME = 'Global'
\ No newline at end of file
+GLOBAL_WS_NAME = 'Global'
+
+#bump whenever parsed objects change shape
+#  so reports cached by Edify.Utils.ParseCache are parsed again
+PARSER_VERSION = '4'
+
+#bump whenever the dicts made by the toDict() methods change shape
+#  so readers of Edify.Output.Json exports can tell what they are reading
+SCHEMA_VERSION = 1
\ No newline at end of file
@@ -0,0 +1,123 @@
+##############################################################################
+#CONSTANTS
+##############################################################################
+#h2 header kinds
+PROPS_HEADER='props'
+ENTRY_WS_HEADER='entryWorkspace'
+SUBROUTINE_HEADER='subroutine'
+EXCEPTION_HANDLER_HEADER='exceptionHandler'
+
+#kinds of header that start a workspace
+WS_HEADER_KINDS = {ENTRY_WS_HEADER, SUBROUTINE_HEADER, EXCEPTION_HANDLER_HEADER}
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#returns kind of h2 header with stripped text headerText
+#  or None if it isn't one the application object parses directly
+#  (e.g. subflow headers)
+def headerKind(headerText):
+  if headerText == 'Application Object Properties':
+    return PROPS_HEADER
+  elif headerText.startswith('Entry Workspace'):
+    return ENTRY_WS_HEADER
+  elif headerText.startswith('Subroutine'):
+    return SUBROUTINE_HEADER
+  elif headerText.startswith('Exception Handler'):
+    return EXCEPTION_HANDLER_HEADER
+  else:
+    return None
+#end headerKind(headerText)
+
+##############################################################################
+#CLASSES
+##############################################################################
+#index of the h2 headers and table captions in an application object report
+#  built in a single walk of the soup so the AppObject.parse*(...) methods
+#  don't each have to call soup.find_all(...) to find what they need
+#  if soup is None the index starts out empty
+class DocumentIndex:
+  def __init__(self, soup=None):
+    self.propsHeader   = None
+    self.entryWsHeader = None
+    self.subroutineHeaders: list       = []
+    self.exceptionHandlerHeaders: list = []
+    
+    #every h2 header in document order
+    self.headers: list = []
+    
+    #dict[anchorName, h2 header]
+    #  from the name prop of the first <a> tag in each header
+    self.headersByAnchor: dict = {}
+    
+    #dict[anchorName, Subflow]
+    #  filled in by Subflow.fromWsHeader(...) as subflows are parsed
+    #  so every workspace invoking a subflow shares one Subflow object
+    self.subflows: dict = {}
+    
+    #dict[captionText, caption]
+    #  only the first caption with a given text is kept
+    #  insertion order is document order
+    self.captions: dict = {}
+    
+    if soup is not None:
+      self.__indexSoup(soup)
+  #end __init__(self, soup)
+  
+  #----------------------------------------------------------------------------
+  def __indexSoup(self, soup):
+    #loop thru headers and captions in document order
+    for tag in soup.find_all(['h2', 'caption']):
+      text = tag.text.strip()
+      
+      #if caption
+      if tag.name == 'caption':
+        self.captions.setdefault(text, tag)
+        continue
+      #end if caption
+      
+      #else h2 header
+      self.headers.append(tag)
+      if tag.a and tag.a.get('name'):
+        self.headersByAnchor.setdefault(tag.a['name'], tag)
+      
+      #switch on header kind
+      kind = headerKind(text)
+      if kind == PROPS_HEADER:
+        if not self.propsHeader:
+          self.propsHeader = tag
+      elif kind == ENTRY_WS_HEADER:
+        if not self.entryWsHeader:
+          self.entryWsHeader = tag
+      elif kind == SUBROUTINE_HEADER:
+        self.subroutineHeaders.append(tag)
+      elif kind == EXCEPTION_HANDLER_HEADER:
+        self.exceptionHandlerHeaders.append(tag)
+      #end switch on header kind
+    #end loop thru headers and captions in document order
+  #end __indexSoup(self, soup)
+  
+  #----------------------------------------------------------------------------
+  #returns table with caption text captionText
+  def getCaptionTable(self, captionText):
+    caption = self.captions.get(captionText)
+    if not caption:
+      return None
+    
+    return caption.find_parent('table')
+  #end getCaptionTable(self, captionText)
+  
+  #----------------------------------------------------------------------------
+  #returns first table whose caption text contains subText
+  def findCaptionTable(self, subText):
+    #loop thru captions to find table
+    for captionText, caption in self.captions.items():
+      if subText in captionText:
+        return caption.find_parent('table')
+    #end loop thru captions to find table
+    
+    #if didn't find right table
+    return None
+  #end findCaptionTable(self, subText)
+#end class DocumentIndex
\ No newline at end of file
@@ -0,0 +1,15 @@
+##############################################################################
+#CLASSES
+##############################################################################
+#raised instead of calling sys.exit(...) when a report can't be parsed
+#  so whoever is parsing (e.g. a batch worker) decides whether to exit
+#  errCode is the err code the parser would have exited with
+#  module is the __name__ of the module whose err codes errCode is one of
+#    since each module numbers its own, see pseudify.errCodeOf(e)
+class EdifyParseError(Exception):
+  def __init__(self, msg, errCode=1, module=None):
+    super().__init__(msg)
+    self.errCode: int = errCode
+    self.module: str  = module
+  #end __init__(self, msg, errCode, module)
+#end class EdifyParseError
\ No newline at end of file
@@ -0,0 +1,224 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import hashlib
+import os
+import pickle
+import tempfile
+import zlib
+
+from ..Utils.Constants import PARSER_VERSION
+
+##############################################################################
+#CONSTANTS
+##############################################################################
+#default bound on the total size of the files in a cache dir
+DEFAULT_MAX_BYTES = 256 << 20
+
+CACHE_FILE_EXT = '.edc'
+
+##############################################################################
+#CLASSES
+##############################################################################
+#size bounded on-disk cache of parsed reports
+#  entries are keyed by the sha256 of PARSER_VERSION, the tree builder name
+#  and the report html, so a changed report or parser is simply a miss
+#  entries are zlib compressed pickles, one file per report
+#  the least recently used entries (by file mtime) are evicted once the
+#  files in cacheDir add up to more than maxBytes
+class ParseCache:
+  def __init__(self, cacheDir, maxBytes=DEFAULT_MAX_BYTES):
+    self.cacheDir = cacheDir
+    self.maxBytes = maxBytes
+    
+    os.makedirs(cacheDir, exist_ok=True)
+  #end __init__(self, cacheDir, maxBytes)
+  
+  ########################
+  # STATIC/CLASS METHODS #
+  ########################
+  #returns hex key of report html parsed with tree builder parser
+  @staticmethod
+  def keyFor(html, parser):
+    digest = hashlib.sha256()
+    digest.update(f'{PARSER_VERSION}\0{parser}\0'.encode())
+    digest.update(html.encode('utf-8', 'surrogatepass'))
+    return digest.hexdigest()
+  #end keyFor(html, parser)
+  
+  ####################
+  # INSTANCE METHODS #
+  ####################
+  #returns object stored under key or None if there is no usable entry
+  def get(self, key):
+    path = self.__pathFor(key)
+    try:
+      with open(path, 'rb') as inFile:
+        obj = pickle.loads(zlib.decompress(inFile.read()))
+    except FileNotFoundError:
+      return None
+    except Exception:
+      #entry is truncated or was written by incompatible code
+      self.__remove(path)
+      return None
+    #end try load entry
+    
+    #mark entry as recently used
+    try:
+      os.utime(path)
+    except OSError:
+      pass
+    
+    return obj
+  #end get(self, key)
+  
+  #----------------------------------------------------------------------------
+  #stores obj under key then evicts entries over maxBytes unless not evict
+  #  written to a temp file 1st so readers never see a partial entry
+  def put(self, key, obj, evict=True):
+    data = zlib.compress(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    
+    fd, tmpPath = tempfile.mkstemp(dir=self.cacheDir, suffix='.tmp')
+    try:
+      with os.fdopen(fd, 'wb') as outFile:
+        outFile.write(data)
+      os.replace(tmpPath, self.__pathFor(key))
+    except OSError:
+      self.__remove(tmpPath)
+      raise
+    #end try write entry
+    
+    if evict:
+      self.evict()
+  #end put(self, key, obj, evict)
+  
+  #----------------------------------------------------------------------------
+  #removes least recently used entries until all fit in maxBytes
+  def evict(self):
+    entries = []
+    totalBytes = 0
+    #loop thru entries to size them
+    for dirEntry in os.scandir(self.cacheDir):
+      if not dirEntry.name.endswith(CACHE_FILE_EXT):
+        continue
+      try:
+        stat = dirEntry.stat()
+      except OSError:
+        continue
+      entries.append((stat.st_mtime, stat.st_size, dirEntry.path))
+      totalBytes += stat.st_size
+    #end loop thru entries to size them
+    
+    entries.sort()
+    #loop thru entries oldest first
+    for _, size, path in entries:
+      if totalBytes <= self.maxBytes:
+        break
+      self.__remove(path)
+      totalBytes -= size
+    #end loop thru entries oldest first
+  #end evict(self)
+  
+  #----------------------------------------------------------------------------
+  def __pathFor(self, key):
+    return os.path.join(self.cacheDir, key + CACHE_FILE_EXT)
+  #end __pathFor(self, key)
+  
+  #----------------------------------------------------------------------------
+  @staticmethod
+  def __remove(path):
+    try:
+      os.remove(path)
+    except OSError:
+      pass
+  #end __remove(path)
+#end class ParseCache
+
+##############################################################################
+#ParseCache of single workspaces, keyed by the html of their section
+#  (h2 header thru next h2 header) so an edited workspace is a miss
+#  a workspace is stored with the fingerprints of the sections of every
+#  subflow it invokes (directly or not) and is only reused while those match
+#  call fingerprintSubflows(...) with the report's subflow sections 1st
+#  names of the workspaces parsed instead of reused are kept in rebuilt
+#  entries are put without evicting, call evict() once done
+class WorkspaceCache(ParseCache):
+  def __init__(self, cacheDir, maxBytes=DEFAULT_MAX_BYTES, parser=None):
+    super().__init__(cacheDir, maxBytes)
+    
+    self.parser  = parser
+    self.rebuilt = []
+    
+    #dict[anchor name, fingerprint] of subflow sections of the report
+    #  see fingerprintSubflows(subflowSectionHtml)
+    self.__fingerprints = {}
+  #end __init__(self, cacheDir, maxBytes, parser)
+  
+  ########################
+  # STATIC/CLASS METHODS #
+  ########################
+  #returns hex sha256 of the html of a section
+  @staticmethod
+  def fingerprint(html):
+    return hashlib.sha256(html.encode('utf-8', 'surrogatepass')).hexdigest()
+  #end fingerprint(html)
+  
+  ####################
+  # INSTANCE METHODS #
+  ####################
+  #fingerprints the sections that may be invoked as subflows in the report
+  #  being parsed, subflowSectionHtml is dict[anchor name, html] of them
+  #  done once before any workspace is looked up, from html that parsing
+  #  the report doesn't change
+  def fingerprintSubflows(self, subflowSectionHtml):
+    self.__fingerprints = {
+      anchor: WorkspaceCache.fingerprint(html)
+      for anchor, html in subflowSectionHtml.items()
+    }
+  #end fingerprintSubflows(self, subflowSectionHtml)
+  
+  #----------------------------------------------------------------------------
+  #returns (workspace, err code it was parsed with) cached for sectionHtml
+  #  or (None, 0) if it must be parsed
+  def getWorkspace(self, sectionHtml):
+    entry = self.get(ParseCache.keyFor(sectionHtml, self.parser))
+    if not entry:
+      return None, 0
+    
+    ws, subflowFingerprints, errCode = entry
+    #loop thru sections of subflows the workspace was parsed with
+    for anchor, fingerprint in subflowFingerprints.items():
+      if self.__fingerprints.get(anchor) != fingerprint:
+        return None, 0
+    #end loop thru sections of subflows the workspace was parsed with
+    
+    return ws, errCode
+  #end getWorkspace(self, sectionHtml)
+  
+  #----------------------------------------------------------------------------
+  #stores workspace ws just parsed from sectionHtml with err code errCode
+  #  so a workspace with errors fails the same way when it is reused
+  #  see getWorkspace(...)
+  #  a subflow without a section in the report is stored as None
+  #    so the workspace is reused while the section is still missing
+  def putWorkspace(self, sectionHtml, ws, errCode=0):
+    self.rebuilt.append(ws.name)
+    
+    subflowFingerprints = {}
+    toVisit = list(ws.subflows or [])
+    #loop thru subflows invoked by ws and by its subflows
+    while toVisit:
+      subflow = toVisit.pop()
+      if not subflow.ref or subflow.ref in subflowFingerprints:
+        continue
+      
+      subflowFingerprints[subflow.ref] = self.__fingerprints.get(subflow.ref)
+      toVisit.extend(subflow.subflows or [])
+    #end loop thru subflows invoked by ws and by its subflows
+    
+    self.put(
+      ParseCache.keyFor(sectionHtml, self.parser),
+      (ws, subflowFingerprints, errCode), evict=False
+    )
+  #end putWorkspace(self, sectionHtml, ws, errCode)
+#end class WorkspaceCache
\ No newline at end of file
@@ -1,4 +1,4 @@
-__all__=['parseDetails']
+__all__=['parseDetails', 'internStr', 'internStrs', 'internReport', 'resetInterning', 'splitTarget']
 ##############################################################################
 #IMPORTS
 ##############################################################################
@@ -15,12 +15,114 @@ __all__=['parseDetails']
 
 # sys.exit(0)
 
-#import ..Utils.Constants
-#from ..Utils.Constants import ALL_WHITESPACE_STR
+import sys
+
+from ..Utils.Constants import ALL_WHITESPACE_STR
+from ..Utils.Errors    import EdifyParseError
+
+##############################################################################
+#CONSTANTS
+##############################################################################
+#err codes
+NONE=0
+BAD_XCPTN_HNDLR_TABLE_FORMAT=1
+
+#this looks weird because we want to ensure
+#  default whitespace stripping in addition to ',' and ':'
+DETAIL_KEY_STRIP_CHARS = ALL_WHITESPACE_STR + ':,'
+DETAIL_VAL_STRIP_CHARS = ALL_WHITESPACE_STR + ','
+
+##############################################################################
+#GLOBALS
+##############################################################################
+#dict[str, the one copy of it kept], see internStr(s)
+#  only holds the strs of the report being parsed, see resetInterning()
+internedStrs_ = {}
+#num of strs internStr(s) replaced with a kept copy
+#  and num of bytes those replaced strs took
+internHits_       = 0
+internBytesSaved_ = 0
 
 ##############################################################################
 #FUNCTIONS
 ##############################################################################
+#-----------------------------------------------------------------------------
+#returns the one copy kept of str s so equal strs share storage
+#  refs, object classes, workspace names and "name:href" targets repeat
+#  thousands of times in a report
+#  unlike sys.intern(...), takes bs4 strings and keeps a plain str copy
+#  so the soup isn't kept alive, and counts what it saves for internReport()
+def internStr(s):
+  global internHits_, internBytesSaved_
+  if s is None:
+    return None
+  
+  interned = internedStrs_.get(s)
+  #if 1st time seeing s
+  if interned is None:
+    interned = str(s) if type(s) is not str else s
+    internedStrs_[interned] = interned
+    return interned
+  #end if 1st time seeing s
+  
+  if interned is not s:
+    internHits_       += 1
+    internBytesSaved_ += sys.getsizeof(s)
+  
+  return interned
+#end internStr(s)
+
+#-----------------------------------------------------------------------------
+#returns list of interned strs in strs
+#  or strs interned if it's not a list (a lone str or None)
+def internStrs(strs):
+  if not isinstance(strs, list):
+    return internStr(strs)
+  return [internStr(s) for s in strs]
+#end internStrs(strs)
+
+#-----------------------------------------------------------------------------
+#forgets the strs kept by internStr(s) and zeroes what internReport() counts
+#  called at the start of each report, so a process that parses many
+#  reports (batch worker, resident main(argv) caller) doesn't keep the
+#  strs of every report it ever parsed
+def resetInterning():
+  global internedStrs_, internHits_, internBytesSaved_
+  internedStrs_     = {}
+  internHits_       = 0
+  internBytesSaved_ = 0
+#end resetInterning()
+
+#-----------------------------------------------------------------------------
+#returns str summing up what internStr(s) saved on the report parsed last
+#  the table lives until the next resetInterning(), so its size is taken off
+#  the saving, its keys aren't since they are the copies parsed objects hold
+def internReport():
+  tableBytes = sys.getsizeof(internedStrs_)
+  return (
+    f'interned {len(internedStrs_)} distinct strings, '
+    f'shared {internHits_} repeats, saving ~{internBytesSaved_ - tableBytes} bytes '
+    f'({internBytesSaved_} shared - {tableBytes} for the table)'
+  )
+#end internReport()
+
+#-----------------------------------------------------------------------------
+#returns (name, anchor name) of a "name:href" target string built by the
+#  step parsers, e.g. 'Sub0:#Sub0' -> ('Sub0', 'Sub0')
+#  anchor name is None if the target had no link
+def splitTarget(target):
+  if target is None:
+    return None, None
+  
+  name, _, href = target.rpartition(':')
+  #if no ':' at all, the whole target is the name
+  if not _:
+    return target, None
+  
+  anchor = href[1:] if href.startswith('#') else None
+  return name, anchor
+#end splitTarget(target)
+
 #-----------------------------------------------------------------------------
 def parseDetails(detailCol):
   detailsDict = {}
@@ -58,12 +160,8 @@ def parseDetails(detailCol):
 
 #-----------------------------------------------------------------------------
 def __addDetailToDict(detailsDict, key, val):
-  from ..Utils.Constants import ALL_WHITESPACE_STR
-  
-  #this looks weird because we want to ensure
-  #  default whitespace stripping in addition to ',' and ':'
-  key = key.strip(ALL_WHITESPACE_STR + ':,')
-  val = val.strip(ALL_WHITESPACE_STR + ',')
+  key = key.strip(DETAIL_KEY_STRIP_CHARS)
+  val = val.strip(DETAIL_VAL_STRIP_CHARS)
   return detailsDict | {key: val}
 #end __addDetailToDict(detailsDict, key, val)
 
@@ -113,11 +211,11 @@ def parseXcptnHndlrTbl(table, wsName):
   for row in rows:
     #if unexpected num of cols
     if (len(row.find_all('td')) != 1) or (len(row.find_all('th')) != 1):
-      print(
-        'ERROR: unexpected number of columns in "Exception Handling Table" '
-        f'for workspace with name: "{wsName}". Terminating...'
+      raise EdifyParseError(
+        'unexpected number of columns in "Exception Handling Table" '
+        f'for workspace with name: "{wsName}".',
+        BAD_XCPTN_HNDLR_TABLE_FORMAT, __name__
       )
-      sys.exit(0)
     #end if unexpected num of cols
     
     codeCol = row.th
@@ -127,7 +225,7 @@ def parseXcptnHndlrTbl(table, wsName):
     name      = nameCol.a.text.strip()
     ref       = (nameCol.a)['href']
     
-    handlerMap[xcptnCode] = f"{name}:{ref}"
+    handlerMap[internStr(xcptnCode)] = internStr(f"{name}:{ref}")
   #end loop thru exception code mappings
   
   return handlerMap
@@ -0,0 +1,313 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import os
+import tempfile
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+
+##############################################################################
+#CONSTANTS
+##############################################################################
+#num of chars read from a report per feed
+CHUNK_SIZE = 1 << 16
+
+##############################################################################
+#CLASSES
+##############################################################################
+#raw html of one section of a report
+#  a section is an h2 header and everything up to the next h2 header
+#  the first section of a report is everything before the first h2 header
+@dataclass
+class Section:
+  html      : str
+  headerText: str = None #stripped text of the h2 header
+  anchor    : str = None #name prop of the first <a> tag in the h2 header
+  #stripped text of every <caption> in the section, in order
+  captions  : list = field(default_factory=list)
+#end dataclass Section
+
+##############################################################################
+#splits a report into Sections as it is fed
+#  re-serializes parser events into each section's html
+#  so the report is never held as a whole soup tree
+class SectionSplitter(HTMLParser):
+  def __init__(self):
+    #keep entities as they are in the report
+    super().__init__(convert_charrefs=False)
+    
+    self.__html       = []
+    self.__headerText = None
+    self.__anchor     = None
+    self.__inHeader   = False
+    self.__captions   = []
+    self.__inCaption  = False
+    
+    #Sections completed since last popSections()
+    self.__done = []
+  #end __init__(self)
+  
+  #----------------------------------------------------------------------------
+  #returns list of Sections completed since last call
+  def popSections(self):
+    done = self.__done
+    self.__done = []
+    return done
+  #end popSections(self)
+  
+  #----------------------------------------------------------------------------
+  def close(self):
+    super().close()
+    self.__endSection()
+  #end close(self)
+  
+  #----------------------------------------------------------------------------
+  def __endSection(self):
+    html = ''.join(self.__html)
+    #if anything to keep
+    if html:
+      headerText = self.__headerText
+      self.__done.append(Section(
+        html = html,
+        headerText = headerText.strip() if headerText is not None else None,
+        anchor = self.__anchor,
+        captions = [caption.strip() for caption in self.__captions]
+      ))
+    #end if anything to keep
+    
+    self.__html       = []
+    self.__headerText = None
+    self.__anchor     = None
+    self.__captions   = []
+  #end __endSection(self)
+  
+  #----------------------------------------------------------------------------
+  def handle_starttag(self, tag, attrs):
+    #if start of new section
+    if tag == 'h2':
+      self.__endSection()
+      self.__headerText = ''
+      self.__inHeader   = True
+    #end if start of new section
+    
+    if tag == 'caption':
+      self.__captions.append('')
+      self.__inCaption = True
+    
+    #if first link in header
+    if tag == 'a' and self.__inHeader and self.__anchor is None:
+      self.__anchor = dict(attrs).get('name')
+    
+    self.__html.append(self.get_starttag_text())
+  #end handle_starttag(self, tag, attrs)
+  
+  #----------------------------------------------------------------------------
+  def handle_startendtag(self, tag, attrs):
+    self.__html.append(self.get_starttag_text())
+  #end handle_startendtag(self, tag, attrs)
+  
+  #----------------------------------------------------------------------------
+  def handle_endtag(self, tag):
+    if tag == 'h2':
+      self.__inHeader = False
+    elif tag == 'caption':
+      self.__inCaption = False
+    
+    self.__html.append(f'</{tag}>')
+  #end handle_endtag(self, tag)
+  
+  #----------------------------------------------------------------------------
+  def handle_data(self, data):
+    if self.__inHeader:
+      self.__headerText += data
+    if self.__inCaption:
+      self.__captions[-1] += data
+    
+    self.__html.append(data)
+  #end handle_data(self, data)
+  
+  #----------------------------------------------------------------------------
+  def handle_entityref(self, name):
+    self.__html.append(f'&{name};')
+  #end handle_entityref(self, name)
+  
+  #----------------------------------------------------------------------------
+  def handle_charref(self, name):
+    self.__html.append(f'&#{name};')
+  #end handle_charref(self, name)
+  
+  #----------------------------------------------------------------------------
+  def handle_comment(self, data):
+    self.__html.append(f'<!--{data}-->')
+  #end handle_comment(self, data)
+  
+  #----------------------------------------------------------------------------
+  def handle_decl(self, decl):
+    self.__html.append(f'<!{decl}>')
+  #end handle_decl(self, decl)
+  
+  #----------------------------------------------------------------------------
+  def handle_pi(self, data):
+    self.__html.append(f'<?{data}>')
+  #end handle_pi(self, data)
+  
+  #----------------------------------------------------------------------------
+  def unknown_decl(self, data):
+    self.__html.append(f'<![{data}]>')
+  #end unknown_decl(self, data)
+#end class SectionSplitter
+
+##############################################################################
+#dict-like map of anchorName to the html of a Section
+#  the html is kept in a temp file, not in memory, and read back each time
+#    it is asked for
+#  only the file's path and the offsets in it are pickled, so a copy handed
+#    to a worker process reads the same file thru its own file object
+#  the process that made it removes the file on close()
+class SectionStore(Mapping):
+  def __init__(self):
+    fd, self.path = tempfile.mkstemp(suffix='.sections')
+    self.__file  = os.fdopen(fd, 'w+b')
+    self.__owner = True
+    
+    #dict[anchorName, (offset, length)] of the utf-8 html in the file
+    self.__spans = {}
+  #end __init__(self)
+  
+  ####################
+  # INSTANCE METHODS #
+  ####################
+  #adds html of the section with anchor name anchor
+  #  the 1st section with an anchor name wins
+  def add(self, anchor, html):
+    if anchor in self.__spans:
+      return
+    
+    data = html.encode('utf-8', 'surrogatepass')
+    self.__file.seek(0, os.SEEK_END)
+    self.__spans[anchor] = (self.__file.tell(), len(data))
+    self.__file.write(data)
+    #so worker processes reading the path see it
+    self.__file.flush()
+  #end add(self, anchor, html)
+  
+  #----------------------------------------------------------------------------
+  def __getitem__(self, anchor):
+    offset, length = self.__spans[anchor]
+    if self.__file is None:
+      self.__file = open(self.path, 'rb')
+    
+    self.__file.seek(offset)
+    return self.__file.read(length).decode('utf-8', 'surrogatepass')
+  #end __getitem__(self, anchor)
+  
+  #----------------------------------------------------------------------------
+  def __iter__(self):
+    return iter(self.__spans)
+  #end __iter__(self)
+  
+  #----------------------------------------------------------------------------
+  def __len__(self):
+    return len(self.__spans)
+  #end __len__(self)
+  
+  #----------------------------------------------------------------------------
+  def __getstate__(self):
+    return {'path': self.path, 'spans': self.__spans}
+  #end __getstate__(self)
+  
+  #----------------------------------------------------------------------------
+  def __setstate__(self, state):
+    self.path    = state['path']
+    self.__spans = state['spans']
+    self.__file  = None
+    self.__owner = False
+  #end __setstate__(self, state)
+  
+  #----------------------------------------------------------------------------
+  #returns a copy that reads the file thru a file object of its own
+  #  for forked worker processes, which would otherwise share the offset of
+  #  this one's
+  def reader(self):
+    copy = SectionStore.__new__(SectionStore)
+    copy.__setstate__(self.__getstate__())
+    return copy
+  #end reader(self)
+  
+  #----------------------------------------------------------------------------
+  def close(self):
+    if self.__file is not None:
+      self.__file.close()
+      self.__file = None
+    
+    if self.__owner:
+      try:
+        os.remove(self.path)
+      except OSError:
+        pass
+    #end if made the file
+  #end close(self)
+#end class SectionStore
+
+##############################################################################
+#looks up h2 headers by anchorName in the raw html of Sections
+#  a section is made into a soup each time its header is asked for and the
+#    soup isn't kept, so only the sections being parsed are soups at a time
+#    (Edify.Types.Subflow asks once per subflow, see DocumentIndex.subflows)
+#  sectionHtml (a SectionStore) keeps the html of every section added so it
+#    can be fingerprinted (see Edify.Utils.ParseCache.WorkspaceCache) and
+#    handed to worker processes
+#  toSoup(html) must return a soup of the html
+#  meant to replace DocumentIndex.headersByAnchor when streaming
+class SectionHeaderMap:
+  def __init__(self, toSoup, sectionHtml=None):
+    self.__toSoup = toSoup
+    self.sectionHtml = SectionStore() if sectionHtml is None else sectionHtml
+  #end __init__(self, toSoup, sectionHtml)
+  
+  ####################
+  # INSTANCE METHODS #
+  ####################
+  def addSection(self, section):
+    self.sectionHtml.add(section.anchor, section.html)
+  #end addSection(self, section)
+  
+  #----------------------------------------------------------------------------
+  def get(self, anchor, default=None):
+    html = self.sectionHtml.get(anchor)
+    if html is None:
+      return default
+    
+    return self.__toSoup(html).h2
+  #end get(self, anchor, default)
+  
+  #----------------------------------------------------------------------------
+  #removes the temp file of sectionHtml
+  def close(self):
+    self.sectionHtml.close()
+  #end close(self)
+#end class SectionHeaderMap
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#yields Sections of the report read from text file object inFile
+#  only one chunk and the section being built are held at a time
+def iterSections(inFile, chunkSize=CHUNK_SIZE):
+  splitter = SectionSplitter()
+  
+  #loop thru chunks of report
+  while True:
+    chunk = inFile.read(chunkSize)
+    if not chunk:
+      break
+    
+    splitter.feed(chunk)
+    yield from splitter.popSections()
+  #end loop thru chunks of report
+  
+  splitter.close()
+  yield from splitter.popSections()
+#end iterSections(inFile, chunkSize)
\ No newline at end of file
@@ -1 +1 @@
-__all__=['Parsers', 'Constants']
\ No newline at end of file
+__all__=['Parsers', 'Constants', 'DocumentIndex', 'Streaming', 'Errors', 'ParseCache']
\ No newline at end of file
@@ -1 +1 @@
-__all__=['Types', 'Utils']
\ No newline at end of file
+__all__=['Types', 'Utils', 'Output', 'Analysis']
\ No newline at end of file
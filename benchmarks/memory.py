@@ -0,0 +1,152 @@
+#measures bytes per step of the Edify.Types model on a synthetic document
+#  the steps of a sample report (see tests/SampleReports.py) are repeated
+#  with their own ids and refs until there are --steps of them
+#  "before" is the same steps copied into classes that keep their attributes
+#  in a per-instance __dict__, the way the model was before it used slots
+#  only the objects are counted, the strings they hold are shared by both
+#  run from the repo root:
+#    python benchmarks/memory.py [--steps N]
+
+##############################################################################
+#IMPORTS
+##############################################################################
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, os.path.join(REPO_DIR, 'tests'))
+
+import pseudify
+import SampleReports
+from Edify.Types.Step import Step
+
+##############################################################################
+#CONSTANTS
+##############################################################################
+DEFAULT_NUM_STEPS = 100000
+
+#steps per synthetic workspace, only used to make refs
+STEPS_PER_WS = 100
+
+##############################################################################
+#GLOBALS
+##############################################################################
+#dict[slotted class, class with a __dict__ standing in for it]
+dictClasses_={}
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#returns list of numSteps step dicts (see Step.toDict()) of a synthetic
+#  document, made from the steps of a sample report
+def syntheticStepDicts(numSteps):
+  appObj = pseudify.AppObject.fromHtml(
+    pseudify.closeParagraphs(SampleReports.report(nSubs=2))
+  )
+  templates = [
+    step.toDict()
+    for ws in appObj.subroutines
+    for step in ws.steps
+  ]
+  
+  stepDicts = []
+  #loop thru steps to give each its own id and ref
+  for i in range(numSteps):
+    stepDicts.append(templates[i % len(templates)] | {
+      'id': str(i % STEPS_PER_WS + 1),
+      'ref': f'ws{i // STEPS_PER_WS}_s{i % STEPS_PER_WS + 1}',
+    })
+  #end loop thru steps to give each its own id and ref
+  
+  return stepDicts
+#end syntheticStepDicts(numSteps)
+
+#-----------------------------------------------------------------------------
+#returns copy of the model object obj with every model object in it
+#  an instance of a class keeping its attributes in a __dict__
+#  values that aren't model objects are shared, not copied
+def withInstanceDicts(obj):
+  if isinstance(obj, list):
+    if obj and hasattr(type(obj[0]), '__slots__'):
+      return [withInstanceDicts(val) for val in obj]
+    return obj
+  #end if list
+  
+  if not hasattr(type(obj), '__slots__'):
+    return obj
+  
+  SlottedClass = type(obj)
+  DictClass = dictClasses_.get(SlottedClass)
+  if DictClass is None:
+    DictClass = dictClasses_[SlottedClass] = type(SlottedClass.__name__, (), {})
+  
+  copy = DictClass()
+  #steps kept their type in the instance before
+  if isinstance(obj, Step):
+    copy.type = obj.type
+  #loop thru classes from the base down to copy their slots
+  for ModelClass in reversed(SlottedClass.__mro__):
+    for slot in ModelClass.__dict__.get('__slots__', ()):
+      setattr(copy, slot, withInstanceDicts(getattr(obj, slot)))
+  #end loop thru classes from the base down to copy their slots
+  
+  return copy
+#end withInstanceDicts(obj)
+
+#-----------------------------------------------------------------------------
+#returns (bytes still allocated after calling build(), what it returned)
+def measure(build):
+  gc.collect()
+  tracemalloc.start()
+  try:
+    built = build()
+    gc.collect()
+    numBytes = tracemalloc.get_traced_memory()[0]
+  finally:
+    tracemalloc.stop()
+  
+  return numBytes, built
+#end measure(build)
+
+#-----------------------------------------------------------------------------
+#returns (bytes per step before, bytes per step with slots) for numSteps steps
+def bytesPerStep(numSteps=DEFAULT_NUM_STEPS):
+  stepDicts = syntheticStepDicts(numSteps)
+  
+  slottedBytes, steps = measure(
+    lambda: [Step.fromDict(stepDict) for stepDict in stepDicts]
+  )
+  dictBytes, _ = measure(
+    lambda: [withInstanceDicts(step) for step in steps]
+  )
+  
+  return dictBytes / numSteps, slottedBytes / numSteps
+#end bytesPerStep(numSteps)
+
+#-----------------------------------------------------------------------------
+def main(argv=None):
+  argParser = argparse.ArgumentParser(
+    description='Measure bytes per step of the Edify.Types model.'
+  )
+  argParser.add_argument('--steps', type=int, default=DEFAULT_NUM_STEPS)
+  args = argParser.parse_args(argv)
+  
+  before, after = bytesPerStep(args.steps)
+  print(f'{args.steps} steps')
+  print(f'  per-instance __dict__: {before:7.1f} bytes/step')
+  print(f'  __slots__:             {after:7.1f} bytes/step')
+  print(f'  saved:                 {1 - after / before:7.1%}')
+  return 0
+#end main(argv)
+
+##############################################################################
+#MAIN
+##############################################################################
+if __name__ == '__main__':
+  sys.exit(main())
+#end if __name__ == '__main__'
\ No newline at end of file
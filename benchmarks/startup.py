@@ -0,0 +1,81 @@
+#times the import statement of Edify in fresh interpreters
+#  interpreter startup itself isn't counted, only what the imports add to it
+#  exits 1 if the median import time is over the budget
+#  run from the repo root:
+#    python benchmarks/startup.py [--runs N] [--budget-ms MS]
+
+##############################################################################
+#IMPORTS
+##############################################################################
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+##############################################################################
+#CONSTANTS
+##############################################################################
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#what a short lived pseudify job imports from Edify before parsing
+IMPORT_STMT = (
+  'import Edify, Edify.Utils.Constants, Edify.Utils.Parsers, '
+  'Edify.Utils.DocumentIndex'
+)
+
+#ms the imports may add to interpreter startup
+DEFAULT_BUDGET_MS = 50
+DEFAULT_RUNS = 10
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#returns median ms of running code in runs fresh interpreters from the repo root
+def timeInterpreter(code, runs=DEFAULT_RUNS):
+  timer = (
+    'import time; start = time.perf_counter(); '
+    f'{code}; '
+    'print((time.perf_counter() - start) * 1000)'
+  )
+  
+  times = []
+  #loop thru runs
+  for _ in range(runs):
+    out = subprocess.run(
+      [sys.executable, '-c', timer], cwd=REPO_DIR,
+      capture_output=True, text=True, check=True
+    ).stdout
+    times.append(float(out))
+  #end loop thru runs
+  
+  return statistics.median(times)
+#end timeInterpreter(code, runs)
+
+#-----------------------------------------------------------------------------
+#returns median ms importing Edify takes in a fresh interpreter
+def importMs(runs=DEFAULT_RUNS):
+  return timeInterpreter(IMPORT_STMT, runs)
+#end importMs(runs)
+
+#-----------------------------------------------------------------------------
+def main(argv=None):
+  argParser = argparse.ArgumentParser(
+    description='Time importing Edify in fresh interpreters.'
+  )
+  argParser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+  argParser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS)
+  args = argParser.parse_args(argv)
+  
+  ms = importMs(args.runs)
+  print(f'import Edify: {ms:.1f} ms median of {args.runs} (budget {args.budget_ms:g} ms)')
+  return int(ms > args.budget_ms)
+#end main(argv)
+
+##############################################################################
+#MAIN
+##############################################################################
+if __name__ == '__main__':
+  sys.exit(main())
+#end if __name__ == '__main__'
\ No newline at end of file
@@ -4,25 +4,41 @@
 #IMPORTS
 ##############################################################################
 import sys
-from bs4 import BeautifulSoup
+import argparse
+import glob
+import importlib.util
+import shutil
+import tempfile
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from bs4 import BeautifulSoup, Tag
 from dataclasses import dataclass, field
 from typing import Any, List, TypeAlias
 
 import Edify.Types as Types
+import Edify.Utils as Utils
 from Edify.Types.EdifyObject import EdifyObject
 from Edify.Types.Param       import Param
 from Edify.Types.Step        import Step
 from Edify.Types.Subflow     import Subflow
 from Edify.Types.Subroutine  import Subroutine, EntryWorkspace, ExceptionHandler
+from Edify.Types.LazySubroutine import lazyClassFor
 
-from Edify.Utils.Parsers   import parseDetails, parseParamTable, parseObjectsTable
+from Edify.Utils.Parsers   import parseDetails, parseParamTable, parseObjectsTable, internReport
+from Edify.Utils.Parsers   import splitTarget, resetInterning
 from Edify.Utils.Constants import GLOBAL_WS_NAME
+from Edify.Utils.DocumentIndex import DocumentIndex, headerKind, PROPS_HEADER, WS_HEADER_KINDS
+from Edify.Utils.DocumentIndex import ENTRY_WS_HEADER, SUBROUTINE_HEADER, EXCEPTION_HANDLER_HEADER
+from Edify.Utils.Streaming     import iterSections, SectionHeaderMap
+from Edify.Utils.Errors        import EdifyParseError
+from Edify.Utils.ParseCache    import ParseCache, WorkspaceCache, DEFAULT_MAX_BYTES
+
+from Edify.Output.Pseudocode import writePseudocode
+from Edify.Output.Json       import writeJson, readJson, writeNdjson, readNdjson
+from Edify.Output.Snapshot   import writeSnapshot, SnapshotReader
 
 import os
-oldPath = sys.path
-sys.path.append(r'..')
-from pyUtils.io import promptForFile
-sys.path = oldPath
 
 ##############################################################################
 #CONSTANTS
@@ -41,12 +57,44 @@ UNEXPECTED_OBJ_KEYS=256
 UNEXPECTED_PARAM_KEYS=512
 BAD_WORKSPACE_LIST_TABLE_FORMAT=1024
 META_PARAMETER_PROP=2048
+UNEXPECTED_ERROR=4096
+UNEXPECTED_STEP_TYPE=8192
+BAD_STEP_DETAILS=16384
+BAD_XCPTN_HNDLR_TABLE_FORMAT=32768
+BAD_EXPORT=65536
+
+#dict[(module name, its err code), err code of this module]
+#  for the EdifyParseErrors other modules raise, see errCodeOf(e)
+#  an err code of None stands for every code of that module
+FOREIGN_ERR_CODES = {
+  ('Edify.Types.Step', Types.Step.UNEXPECTED_DETAILS): BAD_STEP_DETAILS,
+  ('Edify.Utils.Parsers', Utils.Parsers.BAD_XCPTN_HNDLR_TABLE_FORMAT): BAD_XCPTN_HNDLR_TABLE_FORMAT,
+  ('Edify.Output.Json', None): BAD_EXPORT,
+  ('Edify.Output.Snapshot', None): BAD_EXPORT,
+}
+
+#BeautifulSoup tree builders, fastest first
+#  html.parser is built in to python so it is always available
+HTML_PARSERS = ['lxml', 'html.parser', 'html5lib']
+
+#what to write a parsed report as, see writeAppObj(appObj, outFile, outFormat)
+OUTPUT_FORMATS = ['summary', 'repr', 'pseudocode', 'json', 'ndjson']
+
+#caption text of the tables read from sections that aren't workspaces
+#  (app object params, global objects, workspace list)
+#  sections with none of them, like those of subflows, aren't made into soups
+#  when streaming, see __parseSection(...)
+APP_TABLE_CAPTIONS = ('Application Object Parameters', 'Global Objects', 'Workspace List')
 
 ##############################################################################
 #GLOBALS
 ##############################################################################
 errCode_=NONE
 
+#set up by initWsWorker(...) in workspace worker processes
+wsWorkerParser_=None
+wsWorkerIndex_=None
+
 ##############################################################################
 #CLASSES
 ##############################################################################
@@ -58,64 +106,451 @@ class AppObject:
     self.props       = props
     self.globalObjs  = globalObjs
     self.subroutines = subroutines
+    
+    self.reindex()
   #end __init_(self, html)
   
   ########################
   # STATIC/CLASS METHODS #
   ########################
+  #parser is the name of the BeautifulSoup tree builder to use
+  #  see resolveHtmlParser(parser)
+  #if cacheDir, the parsed report is kept there and an unchanged report is
+  #  loaded from it without parsing, see Edify.Utils.ParseCache
+  #if lazy, workspaces are Edify.Types.LazySubroutine proxies that are only
+  #  parsed when their steps, objects, etc. are first touched
+  #  the soup is kept for them and the result isn't put in the cache
+  @classmethod
+  def fromHtml(
+    AppObjObjClass, html, parser=None,
+    cacheDir=None, cacheMaxBytes=DEFAULT_MAX_BYTES, lazy=False
+  ):
+    global errCode_
+    parser = resolveHtmlParser(parser)
+    
+    if cacheDir:
+      cache    = ParseCache(cacheDir, cacheMaxBytes)
+      cacheKey = ParseCache.keyFor(html, parser)
+      cached   = cache.get(cacheKey)
+      if cached:
+        props, globalObjs, subroutines, reportErrCode = cached
+        errCode_ = errCode_ | reportErrCode
+        return AppObjObjClass(
+          props=props,
+          globalObjs=globalObjs,
+          subroutines=subroutines
+        )
+    #end if cacheDir
+    
+    resetInterning()
+    soup = BeautifulSoup(html, parser)
+    docIndex = DocumentIndex(soup)
+    
+    #err codes of this report alone are cached along with it
+    outerErrCode, errCode_ = errCode_, NONE
+    try:
+      props       = AppObjObjClass.parseProps(soup, docIndex)
+      globalObjs  = AppObjObjClass.parseGlobalObjects(soup, docIndex)
+      subroutines = AppObjObjClass.parseSubroutines(soup, docIndex, lazy)
+    finally:
+      reportErrCode = errCode_
+      errCode_ = outerErrCode | reportErrCode
+    #end try parse report
+    
+    if lazy:
+      return AppObjObjClass(
+        props=props,
+        globalObjs=globalObjs,
+        subroutines=subroutines
+      )
+    #end if lazy
+    
+    #parsed objects only hold plain python values, nothing from the soup
+    releaseSoup(soup)
+    
+    if cacheDir:
+      try:
+        cache.put(cacheKey, (props, globalObjs, subroutines, reportErrCode))
+      except OSError as e:
+        print(f'WARNING: could not cache parsed report: {e}', file=sys.stderr)
+    
+    return AppObjObjClass(
+      props=props,
+      globalObjs=globalObjs,
+      subroutines=subroutines
+    )
+  #end fromHtml(AppObjObjClass, html, parser, cacheDir, cacheMaxBytes, lazy)
+  
+  #same as fromHtmlStream(...) but workspaces whose sections are unchanged
+  #  since they were last parsed into cacheDir are loaded from it
+  #  returns (AppObject, list of names of workspaces that were parsed)
+  @classmethod
+  def fromHtmlIncremental(
+    AppObjObjClass, inFile, cacheDir, parser=None,
+    cacheMaxBytes=DEFAULT_MAX_BYTES
+  ):
+    wsCache = WorkspaceCache(cacheDir, cacheMaxBytes, resolveHtmlParser(parser))
+    appObj  = AppObjObjClass.fromHtmlStream(inFile, parser, wsCache=wsCache)
+    wsCache.evict()
+    
+    return appObj, wsCache.rebuilt
+  #end fromHtmlIncremental(AppObjObjClass, inFile, cacheDir, parser, cacheMaxBytes)
+  
+  #same as fromHtml(...) but reads the report from text file object inFile
+  #  one section at a time, see iterHtmlStream(...)
+  @classmethod
+  def fromHtmlStream(
+    AppObjObjClass, inFile, parser=None, wsJobs=None, wsCache=None
+  ):
+    metaProps  = None
+    params     = []
+    globalObjs = []
+    listedLst  = []
+    
+    #dict[header kind, list of workspaces]
+    wsLsts = {
+      ENTRY_WS_HEADER: [], SUBROUTINE_HEADER: [], EXCEPTION_HANDLER_HEADER: []
+    }
+    
+    #loop thru parts of the report as they are parsed
+    for kind, obj in AppObjObjClass.iterHtmlStream(
+      inFile, parser, wsJobs, wsCache
+    ):
+      if kind == 'props':
+        metaProps = obj if metaProps is None else metaProps
+      elif kind == 'param':
+        params.append(obj)
+      elif kind == 'globalObj':
+        globalObjs.append(obj)
+      elif kind == 'workspaceLstRow':
+        listedLst.append(obj)
+      else:
+        wsLsts[kind].append(obj)
+    #end loop thru parts of the report as they are parsed
+    
+    if metaProps is None:
+      AppObject.__raisePropsNotFound()
+    AppObject.__warnIfParamsConflict(metaProps)
+    
+    AppObject.__warnIfWorkspacesNotFound(
+      wsLsts[ENTRY_WS_HEADER], wsLsts[SUBROUTINE_HEADER],
+      wsLsts[EXCEPTION_HANDLER_HEADER]
+    )
+    
+    subroutines = (
+      wsLsts[ENTRY_WS_HEADER][:1]
+      + wsLsts[SUBROUTINE_HEADER]
+      + wsLsts[EXCEPTION_HANDLER_HEADER]
+    )
+    if wsJobs or wsCache:
+      AppObject.__shareSubflows(subroutines)
+    #after the cache, so cached workspaces get the rows of this report
+    AppObject.__mergeWorkspaceLst(subroutines, listedLst)
+    
+    return AppObjObjClass(
+      props=metaProps | {'parameters': params},
+      globalObjs=globalObjs,
+      subroutines=subroutines
+    )
+  #end fromHtmlStream(AppObjObjClass, inFile, parser, wsJobs, wsCache)
+  
+  #yields (kind, obj) for each part of the report read from text file object
+  #  inFile as soon as the section (h2 header thru next h2 header) holding it
+  #  has been parsed:
+  #    ('props', dict of meta props), ('param', Param),
+  #    ('globalObj', EdifyObject),
+  #    ('workspaceLstRow', Subroutine with only the "Workspace List" details),
+  #    and for each workspace
+  #    (ENTRY_WS_HEADER | SUBROUTINE_HEADER | EXCEPTION_HANDLER_HEADER, Subroutine)
+  #  the rows aren't merged into the workspaces, fromHtmlStream(...) does that
+  #  only one section is held as a soup at a time
+  #  the report is read twice, the 1st time only keeps the html of sections
+  #    that may be invoked as subflows, so inFile is spooled to a temp file
+  #    if it can't seek
+  #  if wsJobs, workspace sections are parsed in that many worker processes
+  #    and still yielded in report order
+  #  if wsCache, workspaces are looked up in that
+  #    Edify.Utils.ParseCache.WorkspaceCache before being parsed
+  #    wsCache isn't used with wsJobs
   @classmethod
-  def fromHtml(AppObjObjClass, html):
-    soup = BeautifulSoup(html, "html.parser")
+  def iterHtmlStream(
+    AppObjObjClass, inFile, parser=None, wsJobs=None, wsCache=None
+  ):
+    parser = resolveHtmlParser(parser)
+    inFile = spoolIfUnseekable(inFile)
+    resetInterning()
+    start  = inFile.tell()
+    
+    #stands in for the DocumentIndex of the whole report
+    #  the html of possible subflows is kept in a temp file until done
+    streamIndex = newStreamIndex(parser)
+    try:
+      #loop thru sections to keep possible subflows
+      for section in iterSections(inFile):
+        if section.anchor and not headerKind(section.headerText or ''):
+          streamIndex.headersByAnchor.addSection(section)
+      #end loop thru sections to keep possible subflows
+      
+      inFile.seek(start)
+      
+      if wsCache and not wsJobs:
+        wsCache.fingerprintSubflows(streamIndex.headersByAnchor.sectionHtml)
+      
+      if wsJobs:
+        yield from AppObject.__parseSectionsParallel(
+          iterSections(inFile), streamIndex, parser, wsJobs
+        )
+        return
+      #end if wsJobs
+      
+      #loop thru sections to parse them
+      for section in iterSections(inFile):
+        yield from AppObject.__parseSection(section, streamIndex, parser, wsCache)
+      #end loop thru sections to parse them
+    finally:
+      streamIndex.headersByAnchor.close()
+    #end try parse sections
+  #end iterHtmlStream(AppObjObjClass, inFile, parser, wsJobs, wsCache)
+  
+  #returns list of (kind, obj) parsed from Section section
+  #  see iterHtmlStream(...)
+  @staticmethod
+  def __parseSection(section, docIndex, parser, wsCache=None):
+    global errCode_
+    kind = headerKind(section.headerText or '')
+    
+    if kind in WS_HEADER_KINDS and wsCache:
+      ws, wsErrCode = wsCache.getWorkspace(section.html)
+      if ws:
+        errCode_ = errCode_ | wsErrCode
+      else:
+        ws, wsErrCode = AppObject.parseWorkspaceHtml(
+          kind, section.html, parser, docIndex
+        )
+        wsCache.putWorkspace(section.html, ws, wsErrCode)
+      return [(kind, ws)]
+    #end if workspace may be cached
+    
+    #if nothing in the section for the app object, e.g. a subflow
+    #  its captions were read by the splitter, so no soup is needed to tell
+    if kind not in WS_HEADER_KINDS and kind != PROPS_HEADER and not any(
+      appCaption in caption
+      for caption in section.captions for appCaption in APP_TABLE_CAPTIONS
+    ):
+      return []
+    #end if nothing in the section for the app object
+    
+    soup = makeSoup(section.html, parser)
+    
+    if kind in WS_HEADER_KINDS:
+      return [(kind, AppObject.parseWorkspace(kind, soup.h2, docIndex))]
+    
+    parsed = []
+    sectionIndex = DocumentIndex(soup)
+    
+    if kind == PROPS_HEADER:
+      parsed.append(
+        ('props', AppObject.__parseMetaPropsTable(sectionIndex.propsHeader))
+      )
+    
+    for param in AppObject.__getAppObjParams(sectionIndex):
+      parsed.append(('param', param))
+    
+    for obj in AppObject.__getGlobalObjects(sectionIndex):
+      parsed.append(('globalObj', obj))
+    
+    for listed in AppObject.__getWorkspaces(sectionIndex):
+      parsed.append(('workspaceLstRow', listed))
+    
+    return parsed
+  #end __parseSection(section, docIndex, parser, wsCache)
+  
+  #yields (kind, obj) parsed from sections in order
+  #  workspace sections are handed to a pool of wsJobs worker processes
+  #  other sections are parsed here while the workers run
+  @staticmethod
+  def __parseSectionsParallel(sections, streamIndex, parser, wsJobs):
+    #futures of workspace sections and lists of parsed (kind, obj)
+    #  in report order
+    pending = deque()
+    
+    with ProcessPoolExecutor(
+      max_workers=wsJobs, initializer=initWsWorker,
+      initargs=(parser, streamIndex.headersByAnchor.sectionHtml)
+    ) as pool:
+      #loop thru sections to parse them
+      for section in sections:
+        kind = headerKind(section.headerText or '')
+        if kind in WS_HEADER_KINDS:
+          pending.append(pool.submit(parseWsSection, kind, section.html))
+        else:
+          pending.append(AppObject.__parseSection(section, streamIndex, parser))
+        
+        #yield what is done at the front
+        #  but don't let more than a couple sections per worker pile up
+        while pending and (
+          not isinstance(pending[0], Future) or pending[0].done()
+          or len(pending) > 2 * wsJobs
+        ):
+          yield from AppObject.__takeParsed(pending.popleft())
+        #end yield what is done at the front
+      #end loop thru sections to parse them
+      
+      #loop thru whatever is left in order
+      while pending:
+        yield from AppObject.__takeParsed(pending.popleft())
+      #end loop thru whatever is left in order
+    #end with ProcessPoolExecutor(...)
+  #end __parseSectionsParallel(sections, streamIndex, parser, wsJobs)
+  
+  #returns list of (kind, obj) of a section queued by
+  #  __parseSectionsParallel(...), either the list itself or the Future of
+  #  parseWsSection(kind, html) whose err code is added to errCode_ here
+  @staticmethod
+  def __takeParsed(parsed):
+    global errCode_
+    if not isinstance(parsed, Future):
+      return parsed
     
-    props       = AppObjObjClass.parseProps(soup)
-    globalObjs  = AppObjObjClass.parseGlobalObjects(soup)
-    subroutines = AppObjObjClass.parseSubroutines(soup)
+    parsed, err = parsed.result()
+    errCode_ = errCode_ | err
+    return parsed
+  #end __takeParsed(parsed)
+  
+  #workers each parse their own copy of every subflow they need
+  #  so point every workspace at one Subflow object per ref again
+  @staticmethod
+  def __shareSubflows(wsLst):
+    sharedSubflows = {}
     
+    toVisit = list(wsLst)
+    #loop thru workspaces and subflows not visited yet
+    while toVisit:
+      flow = toVisit.pop()
+      #loop thru subflows invoked by flow
+      for i, subflow in enumerate(flow.subflows or []):
+        shared = sharedSubflows.get(subflow.ref)
+        if shared:
+          flow.subflows[i] = shared
+        elif subflow.ref:
+          sharedSubflows[subflow.ref] = subflow
+          toVisit.append(subflow)
+      #end loop thru subflows invoked by flow
+    #end loop thru workspaces and subflows not visited yet
+  #end __shareSubflows(wsLst)
+  
+  #loads AppObject from text file object inFile written with outFormat 'json'
+  #  see Edify.Output.Json
+  @classmethod
+  def fromJson(AppObjObjClass, inFile):
+    props, globalObjs, subroutines = readJson(inFile)
+    return AppObjObjClass(
+      props=props,
+      globalObjs=globalObjs,
+      subroutines=subroutines
+    )
+  #end fromJson(AppObjObjClass, inFile)
+  
+  #loads AppObject from text file object inFile written with outFormat 'ndjson'
+  #  one workspace line at a time, see Edify.Output.Json
+  @classmethod
+  def fromNdjson(AppObjObjClass, inFile):
+    props, globalObjs, subroutines = readNdjson(inFile)
     return AppObjObjClass(
       props=props,
       globalObjs=globalObjs,
       subroutines=subroutines
     )
-  #end fromHtml(AppObjObjClass, html)
+  #end fromNdjson(AppObjObjClass, inFile)
+  
+  #loads AppObject from snapshot at path written by dump(path)
+  #  to load only some workspaces use Edify.Output.Snapshot.SnapshotReader
+  @classmethod
+  def load(AppObjObjClass, path):
+    with SnapshotReader(path) as reader:
+      props, globalObjs = reader.getApp()
+      return AppObjObjClass(
+        props=props,
+        globalObjs=globalObjs,
+        subroutines=list(reader.iterSubroutines())
+      )
+  #end load(AppObjObjClass, path)
+  
+  #returns what key names in byName or byRef, see getSubroutine(key)
+  @staticmethod
+  def __lookup(key, byName, byRef):
+    name, anchor = splitTarget(key)
+    if name is None:
+      return None
+    
+    if anchor and anchor in byRef:
+      return byRef[anchor]
+    
+    found = byName.get(name)
+    if found is None:
+      found = byRef.get(name.lstrip('#'))
+    return found
+  #end __lookup(key, byName, byRef)
+  
+  #parses workspace with h2 header wsHeader
+  #  kind is the header kind from Edify.Utils.DocumentIndex.headerKind(...)
+  @staticmethod
+  def parseWorkspace(kind, wsHeader, docIndex):
+    if kind == ENTRY_WS_HEADER:
+      return AppObject.__parseEntryWorkspace(wsHeader, docIndex)
+    elif kind == SUBROUTINE_HEADER:
+      return AppObject.__parseSubroutine(wsHeader, docIndex)
+    elif kind == EXCEPTION_HANDLER_HEADER:
+      return AppObject.__parseExceptionHandler(wsHeader, docIndex)
+  #end parseWorkspace(kind, wsHeader, docIndex)
+  
+  #returns (workspace, err code of this module for that workspace alone)
+  #  parsed from the html of its section
+  #  the err code is also added to errCode_
+  @staticmethod
+  def parseWorkspaceHtml(kind, html, parser, docIndex):
+    global errCode_
+    outerErrCode, errCode_ = errCode_, NONE
+    try:
+      soup = makeSoup(html, parser)
+      return AppObject.parseWorkspace(kind, soup.h2, docIndex), errCode_
+    finally:
+      errCode_ = outerErrCode | errCode_
+  #end parseWorkspaceHtml(kind, html, parser, docIndex)
   
   #returns dectionary of application object properties
+  #  docIndex is built from soup if not given
   @staticmethod
-  def parseProps(soup):
-    metaProps = AppObject.__getMetaProps(soup)
+  def parseProps(soup, docIndex=None):
+    docIndex = docIndex or DocumentIndex(soup)
+    
+    metaProps = AppObject.__getMetaProps(docIndex)
     AppObject.__warnIfParamsConflict(metaProps)
     
-    params = AppObject.__getAppObjParams(soup)
+    params = AppObject.__getAppObjParams(docIndex)
     
     return metaProps | {'parameters': params}
-  #end parseProps(soup)
+  #end parseProps(soup, docIndex)
   
   #returns dictionary of app obj meta properties
   @staticmethod
-  def __getMetaProps(soup):
-    propsHeader = AppObject.__findPropsHeader(soup)
+  def __getMetaProps(docIndex):
+    propsHeader = docIndex.propsHeader
     if not propsHeader:
-      errCode_ = errCode_ & PROPS_NOT_FOUND
-      cleanNExit(
-        'could not find "Application Object Properties" header...'
-        'terminating...'
-      )
-    #end if not propsHeader
+      AppObject.__raisePropsNotFound()
     
     return AppObject.__parseMetaPropsTable(propsHeader)
-  #end __getMetaProps(soup)
+  #end __getMetaProps(docIndex)
   
   @staticmethod
-  def __findPropsHeader(soup):
-    headers = soup.find_all('h2')
-    #loop thru headers to find app obj props
-    for header in headers:
-      if header.text.strip() == 'Application Object Properties':
-        return header
-    #end loop thru headers to find app obj props
-    
-    #if didn't find the right header
-    return None
-  #end __findPropsHeader(soup)
+  def __raisePropsNotFound():
+    global errCode_
+    errCode_ = errCode_ | PROPS_NOT_FOUND
+    raise EdifyParseError(
+      'could not find "Application Object Properties" header...',
+      PROPS_NOT_FOUND, __name__
+    )
+  #end __raisePropsNotFound()
   
   @staticmethod
   def __parseMetaPropsTable(propsHeader):
@@ -144,115 +579,116 @@ class AppObject:
   #  with "application object parameters"
   @staticmethod
   def __warnIfParamsConflict(metaProps):
+    global errCode_
     #if 'parameters' props conflict
     if 'parameters' in metaProps:
-      errCode_ = errCode_ & META_PARAMETER_PROP
+      errCode_ = errCode_ | META_PARAMETER_PROP
       print(
         'WARNING: application object has meta-property named "parameters". '
-        'Cannot safely merge with "Application Object Parameters" table.'
+        'Cannot safely merge with "Application Object Parameters" table.',
+        file=sys.stderr
       )
     #end if 'parameters' conflict
   #end __warnIfParamsConflict(metaProps)
   
   #returns list of app obj params
   @staticmethod
-  def __getAppObjParams(soup):
+  def __getAppObjParams(docIndex):
     paramLst = []
     
-    paramTable = AppObject.__findAppObjParamTable(soup)
+    paramTable = docIndex.getCaptionTable('Application Object Parameters')
     if not paramTable:
       return paramLst
     
     paramLst, errCode = parseParamTable(paramTable, GLOBAL_WS_NAME)    
     return paramLst
-  #end __getAppObjParams(soup)
+  #end __getAppObjParams(docIndex)
   
-  @staticmethod
-  def __findAppObjParamTable(soup):
-    captions = soup.find_all('caption')
-    #loop thru captions to find app obj param table
-    for caption in captions:
-      if caption.text.strip() == 'Application Object Parameters':
-        return caption.find_parent('table')
-    #end loop thru captions to find app obj param table
-    
-    #if didn't find right table
-    return None
-  #end __findAppObjParamTable(soup)
-  
-  #contents of this method could be replaced by __getGlobalObjects(soup)
+  #contents of this method could be replaced by __getGlobalObjects(docIndex)
   #  but not done to keep consistent with props
   @staticmethod
-  def parseGlobalObjects(soup):
-    objLst = AppObject.__getGlobalObjects(soup)
+  def parseGlobalObjects(soup, docIndex=None):
+    docIndex = docIndex or DocumentIndex(soup)
+    
+    objLst = AppObject.__getGlobalObjects(docIndex)
     
     return objLst
-  #end parseGlobalObjects(soup)
+  #end parseGlobalObjects(soup, docIndex)
   
-  #contents of this method could be in parseGlobalObjects(soup)
+  #contents of this method could be in parseGlobalObjects(soup, docIndex)
   #  but put here to keep consistent with props
   @staticmethod
-  def __getGlobalObjects(soup):
+  def __getGlobalObjects(docIndex):
     objLst = []
     
-    globalObjTable = AppObject.__findGlobalObjTable(soup)
+    globalObjTable = docIndex.findCaptionTable('Global Objects')
     if not globalObjTable:
       return objLst
     
     objLst, err = parseObjectsTable(globalObjTable, GLOBAL_WS_NAME)
     return objLst
-  #end __getGlobalObjects(soup)
+  #end __getGlobalObjects(docIndex)
   
+  #returns list of workspaces parsed from their headers
+  #  with calledBy and exceptionWorkspaces from the "Workspace List" table
   @staticmethod
-  def __findGlobalObjTable(soup):
-    captions = soup.find_all('caption')
-    #loop thru captions to find global obj table
-    for caption in captions:
-      if 'Global Objects' in caption.text:
-        return caption.find_parent('table')
-    #end loop thru captions to find global obj table
-    
-    #if didn't find right table
-    return None
-  #end __findGlobalObjTable(soup)
-  
-  #TODO: merge lists
-  @staticmethod
-  def parseSubroutines(soup):
-    wsLst = AppObject.__getWorkspaces(soup)
+  def parseSubroutines(soup, docIndex=None, lazy=False):
+    docIndex = docIndex or DocumentIndex(soup)
     
-    wsLst = AppObject.__getSubroutines(soup)
+    listedLst = AppObject.__getWorkspaces(docIndex)
+    wsLst     = AppObject.__getSubroutines(docIndex, lazy)
+    AppObject.__mergeWorkspaceLst(wsLst, listedLst)
     
     return wsLst
-  #end parseSubroutines(soup)
+  #end parseSubroutines(soup, docIndex, lazy)
+  
+  #copies calledBy and exceptionWorkspaces of the "Workspace List" rows in
+  #  listedLst onto the workspaces in wsLst with the same name
+  #  hash join: one dict of the rows by name, then one lookup per workspace
+  #  warns about rows that no workspace header was found for
+  @staticmethod
+  def __mergeWorkspaceLst(wsLst, listedLst):
+    listedByName = {}
+    #loop thru rows, the 1st row with a name wins
+    for listed in listedLst:
+      listedByName.setdefault(listed.name, listed)
+    #end loop thru rows
+    
+    #loop thru workspaces to fill in their rows
+    for ws in wsLst:
+      listed = listedByName.pop(ws.name, None)
+      if listed is None:
+        continue
+      
+      ws.exceptionWorkspaces = listed.exceptionWorkspaces
+      ws.calledBy            = listed.calledBy
+    #end loop thru workspaces to fill in their rows
+    
+    #if rows left over
+    if listedByName:
+      print(
+        'WARNING: "Workspace List" table names workspaces with no header: '
+        f'{list(listedByName)}',
+        file=sys.stderr
+      )
+    #end if rows left over
+  #end __mergeWorkspaceLst(wsLst, listedLst)
   
   @staticmethod
-  def __getWorkspaces(soup):
+  def __getWorkspaces(docIndex):
     wsLst = []
     
-    wsLstTable = AppObject.__findWorkspaceLstTable(soup)
+    wsLstTable = docIndex.findCaptionTable('Workspace List')
     if not wsLstTable:
       return wsLst
     
     wsLst = AppObject.__parseWorkspaceLstTable(wsLstTable)
     return wsLst
-  #end __getWorkspaces(soup)
-  
-  @staticmethod
-  def __findWorkspaceLstTable(soup):
-    captions = soup.find_all('caption')
-    #loop thru captions to find global obj table
-    for caption in captions:
-      if 'Workspace List' in caption.text:
-        return caption.find_parent('table')
-    #end loop thru captions to find global obj table
-    
-    #if didn't find right table
-    return None
-  #end __findWorkspaceLstTable(soup)
+  #end __getWorkspaces(docIndex)
   
   @staticmethod
   def __parseWorkspaceLstTable(table):
+    global errCode_
     subroutineLst = []
     
     rows = table.find_all('tr')
@@ -263,9 +699,9 @@ class AppObject:
       if err == Types.Subroutine.NONE:
         pass
       elif err == Types.Subroutine.BAD_WORKSPACE_LIST_TABLE_FORMAT:
-        errCode_ = errCode_ & BAD_WORKSPACE_LIST_TABLE_FORMAT
+        errCode_ = errCode_ | BAD_WORKSPACE_LIST_TABLE_FORMAT
       elif err == Types.Subroutine.UNEXPECTED_KEYS:
-        errCode_ = errCode_ & UNEXPECTED_OBJ_KEYS
+        errCode_ = errCode_ | UNEXPECTED_OBJ_KEYS
       
       subroutineLst.append(newSubroutine)
     #end loop thru rows of "Workspace List" table
@@ -273,130 +709,274 @@ class AppObject:
     return subroutineLst
   #end __parseWorkspaceLstTable(table)
   
+  #if lazy, returns Edify.Types.LazySubroutine proxies instead
   @staticmethod
-  def __getSubroutines(soup):
+  def __getSubroutines(docIndex, lazy=False):
     subroutineLst = []
     
-    entryWorkspaceHeader = AppObject.__findEntryWorkspaceHeader(soup)
-    if not entryWorkspaceHeader:
-      errCode_ = errCode_ & ENTRY_WORKSPACE_NOT_FOUND
-      cleanNExit(
-        'could not find "Entry Workspace" header...'
-        'terminating...'
-      )
-    #end if not entryWorkspaceHeader
-    
-    subroutineHeaderLst = AppObject.__findSubroutineHeaders(soup)
-    if not subroutineHeaderLst:
-      errCode_ = errCode_ & SUBROUTINES_NOT_FOUND
-      print(
-        'WARNING: could not find ANY "Subroutine" headers...',
-        file=sys.stderr
-      )
-    #end if not subroutineHeaderLst
-    
-    exceptionHandlerHeaderLst = AppObject.__findExceptionHandlerHeaders(soup)
-    if not subroutineHeaderLst:
-      errCode_ = errCode_ & EXCEPTION_HANDLERS_NOT_FOUND
-      print(
-        'WARNING: could not find ANY "Exception Handler" headers...',
-        file=sys.stderr
-      )
-    #end if not subroutineHeaderLst
+    entryWorkspaceHeader      = docIndex.entryWsHeader
+    subroutineHeaderLst       = docIndex.subroutineHeaders
+    exceptionHandlerHeaderLst = docIndex.exceptionHandlerHeaders
+    AppObject.__warnIfWorkspacesNotFound(
+      entryWorkspaceHeader, subroutineHeaderLst, exceptionHandlerHeaderLst
+    )
     
+    #if lazy, only wrap the headers
+    if lazy:
+      #loop thru headers with the class to parse each as
+      for WsClass, headerLst in (
+        (EntryWorkspace,   [entryWorkspaceHeader]),
+        (Subroutine,       subroutineHeaderLst),
+        (ExceptionHandler, exceptionHandlerHeaderLst)
+      ):
+        LazyClass = lazyClassFor(WsClass)
+        for header in headerLst:
+          subroutineLst.append(
+            LazyClass(header, docIndex, onErr=AppObject.__addWsErrCode)
+          )
+      #end loop thru headers with the class to parse each as
+      
+      return subroutineLst
+    #end if lazy
     
     #parse subroutines and add to list
     
-    subroutineLst.append(AppObject.__parseEntryWorkspace(entryWorkspaceHeader))
+    subroutineLst.append(
+      AppObject.__parseEntryWorkspace(entryWorkspaceHeader, docIndex)
+    )
     
     #loop thru "Subroutine" headers
     for header in subroutineHeaderLst:
-      subroutineLst.append(AppObject.__parseSubroutine(header))
+      subroutineLst.append(AppObject.__parseSubroutine(header, docIndex))
     #end loop thru "Subroutine" headers
     
     #loop thru "Exception Handler" headers
     for header in exceptionHandlerHeaderLst:
-      subroutineLst.append(AppObject.__parseExceptionHandler(header))
+      subroutineLst.append(AppObject.__parseExceptionHandler(header, docIndex))
     #end loop thru "Exception Handler" headers
     
     return subroutineLst
-  #end __getSubroutines(soup)
+  #end __getSubroutines(docIndex, lazy)
   
+  #raises EdifyParseError if no entry workspace
+  #  warns if no subroutines or exception handlers
+  #  args can be headers or parsed workspaces
   @staticmethod
-  def __findEntryWorkspaceHeader(soup):
-    headers = soup.find_all('h2')
-    #loop thru headers to find app obj props
-    for header in headers:
-      if header.text.strip().startswith('Entry Workspace'):
-        return header
-    #end loop thru headers to find app obj props
-    
-    #if didn't find the right header
-    return None
-  #end __findEntryWorkspaceHeader(soup)
-  
-  @staticmethod
-  def __findSubroutineHeaders(soup):
-    subroutineHeaderLst = []
-    
-    headers = soup.find_all('h2')
-    #loop thru headers to find app obj props
-    for header in headers:
-      headerText = header.text.strip()
-      if headerText.startswith('Subroutine'):
-        subroutineHeaderLst.append(header)
-    #end loop thru headers to find app obj props
+  def __warnIfWorkspacesNotFound(entryWs, subroutineLst, exceptionHandlerLst):
+    global errCode_
     
-    return subroutineHeaderLst
-  #end __findSubroutineHeaders(soup)
-  
-  @staticmethod
-  def __findExceptionHandlerHeaders(soup):
-    exceptionHandlerHeaderLst = []
+    if not entryWs:
+      errCode_ = errCode_ | ENTRY_WORKSPACE_NOT_FOUND
+      raise EdifyParseError(
+        'could not find "Entry Workspace" header...',
+        ENTRY_WORKSPACE_NOT_FOUND, __name__
+      )
+    #end if not entryWs
     
-    headers = soup.find_all('h2')
-    #loop thru headers to find app obj props
-    for header in headers:
-      if header.text.strip().startswith('Exception Handler'):
-        exceptionHandlerHeaderLst.append(header)
-    #end loop thru headers to find app obj props
+    if not subroutineLst:
+      errCode_ = errCode_ | SUBROUTINES_NOT_FOUND
+      print(
+        'WARNING: could not find ANY "Subroutine" headers...',
+        file=sys.stderr
+      )
+    #end if not subroutineLst
     
-    return exceptionHandlerHeaderLst
-  #end __findExceptionHandlerHeaders(soup)
+    if not exceptionHandlerLst:
+      errCode_ = errCode_ | EXCEPTION_HANDLERS_NOT_FOUND
+      print(
+        'WARNING: could not find ANY "Exception Handler" headers...',
+        file=sys.stderr
+      )
+    #end if not exceptionHandlerLst
+  #end __warnIfWorkspacesNotFound(entryWs, subroutineLst, exceptionHandlerLst)
   
   #TODO: determind if this function is needed
   #  seems like EntryWorkspace.fromWsHeader() is serving the purpose this funciton would usually serve
   @staticmethod
-  def __parseEntryWorkspace(wsHeader):
+  def __parseEntryWorkspace(wsHeader, docIndex):
     global errCode_
-    newEntryWorkspace, err = EntryWorkspace.fromWsHeader(wsHeader)
-    errCode_ = errCode_ & err
+    newEntryWorkspace, err = EntryWorkspace.fromWsHeader(wsHeader, docIndex)
+    errCode_ = errCode_ | AppObject.__wsErrCode(err)
     return newEntryWorkspace
-  #end __parseEntryWorkspace(wsHeader)
+  #end __parseEntryWorkspace(wsHeader, docIndex)
   
   #TODO: determind if this function is needed
   #  seems like Subroutine.fromWsHeader() is serving the purpose this funciton would usually serve
   @staticmethod
-  def __parseSubroutine(subroutineHeader):
+  def __parseSubroutine(subroutineHeader, docIndex):
     global errCode_
-    newSubroutine, err = Subroutine.fromWsHeader(subroutineHeader)
-    errCode_ = errCode_ & err
+    newSubroutine, err = Subroutine.fromWsHeader(subroutineHeader, docIndex)
+    errCode_ = errCode_ | AppObject.__wsErrCode(err)
     return newSubroutine
-  #end __parseEntryWorkspace(subroutineHeader)
+  #end __parseEntryWorkspace(subroutineHeader, docIndex)
   
   #TODO: determind if this function is needed
   #  seems like ExceptionHandler.fromWsHeader() is serving the purpose this funciton would usually serve
   @staticmethod
-  def __parseExceptionHandler(exceptionHandlerHeader):
+  def __parseExceptionHandler(exceptionHandlerHeader, docIndex):
     global errCode_
-    newExceptionHandler, err = ExceptionHandler.fromWsHeader(exceptionHandlerHeader)
-    errCode_ = errCode_ & err
+    newExceptionHandler, err = ExceptionHandler.fromWsHeader(
+      exceptionHandlerHeader, docIndex
+    )
+    errCode_ = errCode_ | AppObject.__wsErrCode(err)
     return newExceptionHandler
-  #end __parseEntryWorkspace(exceptionHandlerHeader)
+  #end __parseEntryWorkspace(exceptionHandlerHeader, docIndex)
+  
+  #adds err code err of Subroutine.fromWsHeader(...) to errCode_
+  #  for lazy workspaces, which are parsed after fromHtml(...) returned
+  @staticmethod
+  def __addWsErrCode(err):
+    global errCode_
+    errCode_ = errCode_ | AppObject.__wsErrCode(err)
+  #end __addWsErrCode(err)
+  
+  #returns err code of this module for err code err of
+  #  Subroutine.fromWsHeader(...)
+  #  only unknown step types are passed on so far, the rest is only warned about
+  @staticmethod
+  def __wsErrCode(err):
+    if err & Types.Subroutine.UNEXPECTED_STEP_TYPE:
+      return UNEXPECTED_STEP_TYPE
+    return NONE
+  #end __wsErrCode(err)
   
   ####################
   # INSTANCE METHODS #
   ####################
+  #----------------------------------------------------------------------------
+  #(re)builds the name and ref lookup tables of subroutines and globalObjs
+  #  call again after changing those lists
+  #  where names or refs repeat, the 1st one wins
+  #  tables over steps and subflows are built on 1st use instead
+  #    since they'd parse every Edify.Types.LazySubroutine
+  def reindex(self):
+    self.subroutinesByName = {}
+    self.subroutinesByRef  = {}
+    #loop thru workspaces
+    for ws in self.subroutines:
+      self.subroutinesByName.setdefault(ws.name, ws)
+      if ws.ref:
+        self.subroutinesByRef.setdefault(ws.ref, ws)
+    #end loop thru workspaces
+    
+    self.globalObjsByName = {}
+    self.globalObjsByRef  = {}
+    #loop thru global objects
+    for obj in self.globalObjs:
+      self.globalObjsByName.setdefault(obj.name, obj)
+      if obj.ref:
+        self.globalObjsByRef.setdefault(obj.ref, obj)
+    #end loop thru global objects
+    
+    #dict[anchor name, workspace, subflow, object or step]
+    #  see resolveRef(target)
+    self.__refIndex = None
+    #dict[workspace name, dict[step ref, Step]], see getStep(wsName, ref)
+    self.__stepIndex = {}
+  #end reindex(self)
+  
+  #----------------------------------------------------------------------------
+  #returns workspace named by key or None
+  #  key is a name, an anchor name, or a "name:#anchor" target of a step
+  def getSubroutine(self, key):
+    return AppObject.__lookup(key, self.subroutinesByName, self.subroutinesByRef)
+  #end getSubroutine(self, key)
+  
+  #----------------------------------------------------------------------------
+  #returns global EdifyObject named by key or None, key as for getSubroutine(...)
+  def getGlobalObj(self, key):
+    return AppObject.__lookup(key, self.globalObjsByName, self.globalObjsByRef)
+  #end getGlobalObj(self, key)
+  
+  #----------------------------------------------------------------------------
+  #returns Step with anchor name ref in workspace or subflow named wsName
+  #  or None
+  #  the steps of a flow are indexed the 1st time one of them is looked up
+  def getStep(self, wsName, ref):
+    stepsByRef = self.__stepIndex.get(wsName)
+    if stepsByRef is None:
+      flow = self.getSubroutine(wsName) or self.__flowsByName().get(wsName)
+      if not flow:
+        return None
+      stepsByRef = {step.ref: step for step in flow.steps}
+      self.__stepIndex[wsName] = stepsByRef
+    #end if flow not indexed yet
+    
+    return stepsByRef.get(ref.lstrip('#'))
+  #end getStep(self, wsName, ref)
+  
+  #----------------------------------------------------------------------------
+  #returns workspace, subflow, global or local EdifyObject, or Step
+  #  with the anchor name in target, or None
+  #  target is a "name:#anchor" string as kept by steps, "#anchor" or "anchor"
+  #    targets without an anchor are looked up by name as a workspace
+  #    then as a global object
+  #  the 1st call indexes every anchor in the app, after that each is a dict
+  #    lookup so resolving every reference in the app is linear overall
+  def resolveRef(self, target):
+    name, anchor = splitTarget(target)
+    if name is None:
+      return None
+    
+    if self.__refIndex is None:
+      self.__refIndex = self.__buildRefIndex()
+    
+    #if no anchor, the target may still be an anchor by itself
+    if not anchor:
+      found = self.__refIndex.get(name.lstrip('#'))
+      if found is not None:
+        return found
+      return self.getSubroutine(name) or self.getGlobalObj(name)
+    #end if no anchor
+    
+    return self.__refIndex.get(anchor)
+  #end resolveRef(self, target)
+  
+  #----------------------------------------------------------------------------
+  #returns dict[anchor name, obj] for resolveRef(target), one pass over the app
+  def __buildRefIndex(self):
+    #global objects and workspaces 1st so they win over anything in them
+    refIndex = dict(self.globalObjsByRef)
+    #loop thru workspaces
+    for ws in self.subroutines:
+      if ws.ref:
+        refIndex.setdefault(ws.ref, ws)
+    #end loop thru workspaces
+    
+    #loop thru workspaces and the subflows they reach to add what's in them
+    for flow in self.subroutines + Subflow.reachableSubflows(self.subroutines):
+      if flow.ref:
+        refIndex.setdefault(flow.ref, flow)
+      for obj in getattr(flow, 'localObjs', None) or []:
+        if obj.ref:
+          refIndex.setdefault(obj.ref, obj)
+      for step in flow.steps:
+        if step.ref:
+          refIndex.setdefault(step.ref, step)
+    #end loop thru workspaces and the subflows they reach
+    
+    return refIndex
+  #end __buildRefIndex(self)
+  
+  #----------------------------------------------------------------------------
+  #returns dict[name, Subflow] of every subflow the workspaces reach
+  def __flowsByName(self):
+    flowsByName = {}
+    #loop thru subflows
+    for subflow in Subflow.reachableSubflows(self.subroutines):
+      flowsByName.setdefault(subflow.name, subflow)
+    #end loop thru subflows
+    
+    return flowsByName
+  #end __flowsByName(self)
+  
+  #----------------------------------------------------------------------------
+  #writes this to path as a binary snapshot, see Edify.Output.Snapshot
+  #  reload it with load(path) without parsing the report again
+  def dump(self, path):
+    writeSnapshot(path, self.props, self.globalObjs, self.subroutines)
+  #end dump(self, path)
+  
   # #----------------------------------------------------------------------------
   # def __repr__(self):
     # return (
@@ -429,54 +1009,540 @@ class AppObject:
 #FUNCTIONS
 ##############################################################################
 #-----------------------------------------------------------------------------
-def cleanNExit(msg=None, file=sys.stderr):
-  if msg:
-    print(msg, file=file)
+#returns name of BeautifulSoup tree builder to use
+#  if parser is None, returns the fastest installed one
+#  if parser isn't installed, warns and falls back to "html.parser"
+def resolveHtmlParser(parser=None):
+  candidates = HTML_PARSERS if parser is None else [parser]
+  
+  #loop thru candidate parsers to find an installed one
+  for candidate in candidates:
+    if candidate == 'html.parser' or importlib.util.find_spec(candidate):
+      return candidate
+  #end loop thru candidate parsers to find an installed one
+  
+  print(
+    f'WARNING: html parser "{parser}" is not installed. '
+    'Falling back to "html.parser"...',
+    file=sys.stderr
+  )
+  return 'html.parser'
+#end resolveHtmlParser(parser)
+
+#-----------------------------------------------------------------------------
+#returns soup of the html of part of a report
+def makeSoup(html, parser):
+  return BeautifulSoup(closeParagraphs(html), parser)
+#end makeSoup(html, parser)
+
+#-----------------------------------------------------------------------------
+#breaks the parent/child links of every element of soup, and the links
+#  from soup back to itself (its current tag, tag stack and builder)
+#  so the tree is freed as soon as the last reference to soup is dropped
+#  instead of waiting for a full pass of the cyclic garbage collector
+#  soup and any tag or string from it can't be used afterwards
+def releaseSoup(soup):
+  #loop thru top level elements
+  for element in list(soup.contents):
+    #older bs4 strings can't be decomposed
+    if isinstance(element, Tag):
+      element.decompose()
+    else:
+      element.extract()
+  #end loop thru top level elements
+  
+  soup.currentTag = None
+  soup.tagStack = []
+  if soup.builder is not None:
+    soup.builder.soup = None
+#end releaseSoup(soup)
+
+#-----------------------------------------------------------------------------
+#returns empty DocumentIndex to parse Sections of a report with
+#  headers of subflow sections are looked up in a SectionHeaderMap
+#  over sectionHtml, a new Edify.Utils.Streaming.SectionStore if not given
+def newStreamIndex(parser, sectionHtml=None):
+  streamIndex = DocumentIndex()
+  streamIndex.headersByAnchor = SectionHeaderMap(
+    lambda html: makeSoup(html, parser), sectionHtml
+  )
+  return streamIndex
+#end newStreamIndex(parser, sectionHtml)
+
+#-----------------------------------------------------------------------------
+#sets up a workspace worker process for parseWsSection(...)
+#  subflowSectionHtml is the Edify.Utils.Streaming.SectionStore of sections
+#  that may be invoked as subflows, read thru a file object of this worker's
+def initWsWorker(parser, subflowSectionHtml):
+  global wsWorkerParser_, wsWorkerIndex_
+  wsWorkerParser_ = parser
+  wsWorkerIndex_  = newStreamIndex(parser, subflowSectionHtml.reader())
+  resetInterning()
+#end initWsWorker(parser, subflowSectionHtml)
+
+#-----------------------------------------------------------------------------
+#runs in a workspace worker process
+#  returns ([(kind, workspace)], err code) parsed from the html of a
+#  workspace section, the err code is added to errCode_ of the main process
+def parseWsSection(kind, html):
+  ws, err = AppObject.parseWorkspaceHtml(
+    kind, html, wsWorkerParser_, wsWorkerIndex_
+  )
+  return [(kind, ws)], err
+#end parseWsSection(kind, html)
+
+#-----------------------------------------------------------------------------
+#returns AppObject parsed from report at filePath
+#  filePath '-' reads the report from stdin
+#  see parseReport(...) for the rest
+def parseFile(
+  filePath, parser=None, stream=False, wsJobs=None,
+  cacheDir=None, cacheMaxBytes=DEFAULT_MAX_BYTES, incremental=False
+):
+  if filePath == '-':
+    return parseReport(
+      sys.stdin, '<stdin>', parser, stream, wsJobs,
+      cacheDir, cacheMaxBytes, incremental
+    )
+  
+  with open(filePath, 'r') as inFile:
+    return parseReport(
+      inFile, filePath, parser, stream, wsJobs,
+      cacheDir, cacheMaxBytes, incremental
+    )
+#end parseFile(filePath, parser, stream, wsJobs, cacheDir, cacheMaxBytes, incremental)
+
+#-----------------------------------------------------------------------------
+#returns AppObject parsed from report read from text file object inFile
+#  name is only used in messages
+#  wsJobs implies stream, see AppObject.iterHtmlStream(...)
+#  cacheDir is only used when not streaming, see AppObject.fromHtml(...)
+#    unless incremental, see AppObject.fromHtmlIncremental(...)
+#    which prints the names of the workspaces it had to parse to stderr
+def parseReport(
+  inFile, name, parser=None, stream=False, wsJobs=None,
+  cacheDir=None, cacheMaxBytes=DEFAULT_MAX_BYTES, incremental=False
+):
+  if incremental and cacheDir:
+    appObj, rebuiltLst = AppObject.fromHtmlIncremental(
+      inFile, cacheDir, parser=parser, cacheMaxBytes=cacheMaxBytes
+    )
+    print(
+      f'{name}: rebuilt {len(rebuiltLst)} of '
+      f'{len(appObj.subroutines)} workspaces',
+      file=sys.stderr
+    )
+    #loop thru rebuilt workspaces
+    for wsName in rebuiltLst:
+      print(f'  {wsName}', file=sys.stderr)
+    
+    return appObj
+  #end if incremental
+  
+  if stream or wsJobs:
+    return AppObject.fromHtmlStream(inFile, parser=parser, wsJobs=wsJobs)
+  
+  html = closeParagraphs(inFile.read())
+  return AppObject.fromHtml(
+    html, parser=parser, cacheDir=cacheDir, cacheMaxBytes=cacheMaxBytes
+  )
+#end parseReport(inFile, name, parser, stream, wsJobs, cacheDir, cacheMaxBytes, incremental)
+
+#-----------------------------------------------------------------------------
+#returns list of report paths matched by the dirs and globs in pathArgs
+#  a dir matches every *.htm* file directly in it
+def findReports(pathArgs):
+  filePaths = []
+  
+  #loop thru dirs and globs
+  for pathArg in pathArgs:
+    if os.path.isdir(pathArg):
+      matches = glob.glob(os.path.join(pathArg, '*.htm*'))
+    else:
+      matches = glob.glob(pathArg, recursive=True)
+    
+    if not matches:
+      print(f'WARNING: no reports found for "{pathArg}"', file=sys.stderr)
+    
+    #loop thru matches to add new files
+    for match in sorted(matches):
+      if os.path.isfile(match) and match not in filePaths:
+        filePaths.append(match)
+    #end loop thru matches to add new files
+  #end loop thru dirs and globs
+  
+  return filePaths
+#end findReports(pathArgs)
+
+#-----------------------------------------------------------------------------
+#writes AppObject appObj to text file object outFile
+#  outFormat is one of OUTPUT_FORMATS
+#  pseudocode and ndjson are written a line at a time
+#    see Edify.Output.Pseudocode and Edify.Output.Json
+def writeAppObj(appObj, outFile, outFormat='repr'):
+  if outFormat == 'pseudocode':
+    writePseudocode(appObj, outFile)
+  elif outFormat == 'json':
+    writeJson(appObj, outFile)
+  elif outFormat == 'ndjson':
+    writeNdjson(appObj, outFile)
+  elif outFormat == 'summary':
+    writeSummary(appObj, outFile)
+  else:
+    outFile.write(repr(appObj))
+#end writeAppObj(appObj, outFile, outFormat)
+
+#-----------------------------------------------------------------------------
+#writes counts and reprs of the parts of AppObject appObj then its repr
+def writeSummary(appObj, outFile):
+  print('Number of Properties:', len(appObj.props), file=outFile)
+  print('Properties:', appObj.props, file=outFile)
+  print(file=outFile)
+  print('Number of Properties.parameters:', len(appObj.props['parameters']), file=outFile)
+  print('Properties.parameters:', appObj.props['parameters'], file=outFile)
+  print(file=outFile)
+  print('Number of Global Objects:', len(appObj.globalObjs), file=outFile)
+  print('Global Objects:', appObj.globalObjs, file=outFile)
+  print('Global Objects[0]:', appObj.globalObjs[0], file=outFile)
+  print(file=outFile)
+  print('Number of Workspaces:', len(appObj.subroutines), file=outFile)
+  print('Workspaces:', appObj.subroutines, file=outFile)
+  print('Workspaces[0]:', appObj.subroutines[0], file=outFile)
+  print(file=outFile)
+  print(file=outFile)
+  print('Application Object:', file=outFile)
+  print(repr(appObj), file=outFile)
+#end writeSummary(appObj, outFile)
+
+#-----------------------------------------------------------------------------
+#parses report at inPath and writes it to outPath
+#  runs in a batch worker process so returns instead of exiting
+#  returns (inPath, errCode, num bytes parsed, err msg or None)
+def pseudifyFile(
+  inPath, outPath, parser=None, stream=False,
+  cacheDir=None, cacheMaxBytes=DEFAULT_MAX_BYTES, incremental=False,
+  outFormat='repr'
+):
+  global errCode_
+  errCode_ = NONE
+  
+  try:
+    appObj = parseFile(
+      inPath, parser=parser, stream=stream,
+      cacheDir=cacheDir, cacheMaxBytes=cacheMaxBytes, incremental=incremental
+    )
+    with open(outPath, 'w') as outFile:
+      writeAppObj(appObj, outFile, outFormat)
+  except EdifyParseError as e:
+    return inPath, errCode_ | errCodeOf(e), 0, str(e)
+  except Exception as e:
+    return inPath, errCode_ | UNEXPECTED_ERROR, 0, f'{type(e).__name__}: {e}'
+  #end try parse and write
+  
+  return inPath, errCode_, os.path.getsize(inPath), None
+#end pseudifyFile(inPath, outPath, parser, stream, cacheDir, cacheMaxBytes, incremental, outFormat)
+
+#-----------------------------------------------------------------------------
+#pseudifies every report matched by pathArgs into outDir
+#  spread across jobs worker processes (default: one per cpu)
+#  prints throughput to stderr
+#  returns bitwise or of the err codes of all reports
+def runBatch(
+  pathArgs, outDir, jobs=None, parser=None, stream=False,
+  cacheDir=None, cacheMaxBytes=DEFAULT_MAX_BYTES, incremental=False,
+  outFormat='repr'
+):
+  filePaths = findReports(pathArgs)
+  if not filePaths:
+    print('ERROR: no reports to pseudify', file=sys.stderr)
+    return FILE_PATH_EMPTY
+  
+  outPaths = outPathsFor(filePaths, outDir)
+  
+  batchErrCode = NONE
+  numBytes     = 0
+  numFailed    = 0
+  startTime    = time.perf_counter()
+  with ProcessPoolExecutor(max_workers=jobs) as pool:
+    #dict[Future, report path]
+    futures = {}
+    #loop thru reports to hand them to workers
+    for filePath, outPath in zip(filePaths, outPaths):
+      os.makedirs(os.path.dirname(outPath), exist_ok=True)
+      future = pool.submit(
+        pseudifyFile, filePath, outPath, parser, stream,
+        cacheDir, cacheMaxBytes, incremental, outFormat
+      )
+      futures[future] = filePath
+    #end loop thru reports to hand them to workers
+    
+    #loop thru results as workers finish
+    for future in as_completed(futures):
+      #a worker that dies (e.g. killed for memory) breaks the whole pool
+      #  count its report and the ones still queued as failed
+      try:
+        inPath, err, size, msg = future.result()
+      except Exception as e:
+        inPath, err, size = futures[future], UNEXPECTED_ERROR, 0
+        msg = f'{type(e).__name__}: {e}'
+      #end try get result of worker
+      
+      batchErrCode = batchErrCode | err
+      numBytes += size
+      if msg:
+        numFailed += 1
+        print(f'ERROR: {inPath}: {msg}', file=sys.stderr)
+    #end loop thru results as workers finish
+  #end with ProcessPoolExecutor(...)
+  elapsed = time.perf_counter() - startTime
+  
+  numMb = numBytes / (1024 * 1024)
+  print(
+    f'pseudified {len(filePaths) - numFailed}/{len(filePaths)} reports '
+    f'({numMb:.1f} MB) in {elapsed:.2f}s: '
+    f'{len(filePaths) / elapsed:.1f} reports/s, {numMb / elapsed:.1f} MB/s',
+    file=sys.stderr
+  )
+  
+  return batchErrCode
+#end runBatch(pathArgs, outDir, jobs, parser, stream, cacheDir, cacheMaxBytes, incremental, outFormat)
+
+#-----------------------------------------------------------------------------
+#returns list of paths in outDir to write each report in filePaths to
+#  the dirs of the reports under the dir they all share are kept
+#  so a/r.html and b/r.html go to outDir/a/r.txt and outDir/b/r.txt
+#  reports only told apart by their extension keep it, e.g. x.htm.txt
+def outPathsFor(filePaths, outDir):
+  absPaths = [os.path.abspath(filePath) for filePath in filePaths]
+  rootDir  = os.path.commonpath([os.path.dirname(path) for path in absPaths])
+  relPaths = [os.path.relpath(path, rootDir) for path in absPaths]
+  
+  stems = [os.path.splitext(relPath)[0] for relPath in relPaths]
+  numStems = Counter(stems)
+  return [
+    os.path.join(outDir, (stem if numStems[stem] == 1 else relPath) + '.txt')
+    for stem, relPath in zip(stems, relPaths)
+  ]
+#end outPathsFor(filePaths, outDir)
+
+#-----------------------------------------------------------------------------
+#returns inFile, or a temp file holding the rest of inFile if it can't seek
+def spoolIfUnseekable(inFile):
+  if inFile.seekable():
+    return inFile
   
-  sys.exit(errCode_)
-#end cleanNExit(msg, file)
+  spool = tempfile.TemporaryFile('w+', encoding='utf-8')
+  shutil.copyfileobj(inFile, spool)
+  spool.seek(0)
+  return spool
+#end spoolIfUnseekable(inFile)
 
 #-----------------------------------------------------------------------------
 def closeParagraphs(html):
   return html.replace('<p>', '<p></p>')
 #end closeParagraphs(html)
 
+#-----------------------------------------------------------------------------
+#returns err code of this module for EdifyParseError e
+#  e.errCode is one of the err codes of e.module, which may number them
+#  differently, so codes of other modules are mapped the way
+#  AppObject.__wsErrCode(err) maps those of workspaces
+def errCodeOf(e):
+  if e.module == __name__:
+    return e.errCode
+  
+  errCode = FOREIGN_ERR_CODES.get((e.module, e.errCode))
+  if errCode is None:
+    errCode = FOREIGN_ERR_CODES.get((e.module, None), UNEXPECTED_ERROR)
+  return errCode
+#end errCodeOf(e)
+
+#-----------------------------------------------------------------------------
+#returns exit status for err code errCode
+#  exit statuses are only 8 bits, don't let a failure exit with 0
+def exitStatus(errCode):
+  return errCode if errCode & 0xFF else int(bool(errCode))
+#end exitStatus(errCode)
+
+#-----------------------------------------------------------------------------
+#returns path of report picked by the user
+#  pyUtils is only needed when running interactively
+def promptForReport():
+  oldPath = sys.path
+  sys.path.append(r'..')
+  from pyUtils.io import promptForFile
+  sys.path = oldPath
+  
+  return promptForFile()
+#end promptForReport()
+
+#-----------------------------------------------------------------------------
+#argparse type of options that count worker processes
+def positiveInt(text):
+  num = int(text)
+  if num < 1:
+    raise argparse.ArgumentTypeError(f'must be at least 1, not {num}')
+  return num
+#end positiveInt(text)
+
+#-----------------------------------------------------------------------------
+#options shared by pseudifying reports one by one and in batch mode
+def buildCommonArgParser():
+  commonArgParser = argparse.ArgumentParser(add_help=False)
+  commonArgParser.add_argument(
+    '--parser', choices=HTML_PARSERS, default=None,
+    help='BeautifulSoup tree builder. Defaults to the fastest one installed'
+  )
+  commonArgParser.add_argument(
+    '--stream', action='store_true',
+    help='parse the report one section at a time instead of as one soup'
+  )
+  commonArgParser.add_argument(
+    '--cache-dir', default=None,
+    help='keep parsed reports here and reuse them while unchanged'
+  )
+  commonArgParser.add_argument(
+    '--cache-max-mb', type=int, default=DEFAULT_MAX_BYTES >> 20,
+    help='evict least recently used cached reports over this many MiB'
+  )
+  commonArgParser.add_argument(
+    '--incremental', action='store_true',
+    help='with --cache-dir, only parse workspaces changed since the last run'
+  )
+  return commonArgParser
+#end buildCommonArgParser()
+
+#-----------------------------------------------------------------------------
+def buildArgParser():
+  argParser = argparse.ArgumentParser(
+    prog='pseudify.py',
+    description='Parse Edify application object reports',
+    epilog=(
+      'With no reports, reads one from stdin if it is piped '
+      'or else prompts for one. '
+      'Run "pseudify.py batch -h" to pseudify many reports in parallel.'
+    ),
+    parents=[buildCommonArgParser()]
+  )
+  argParser.add_argument(
+    'files', nargs='*', metavar='REPORT',
+    help='report files to parse, "-" for stdin'
+  )
+  argParser.add_argument(
+    '-o', '--output', default='-',
+    help='file to write to. Defaults to stdout'
+  )
+  argParser.add_argument(
+    '--format', choices=OUTPUT_FORMATS, default='summary',
+    help='what to write for each report. Defaults to summary'
+  )
+  argParser.add_argument(
+    '--ws-jobs', type=positiveInt, default=None,
+    help='parse the workspaces of the report in this many worker processes'
+  )
+  argParser.add_argument(
+    '--intern-report', action='store_true',
+    help='print how much memory sharing repeated strings saved on each report to stderr'
+  )
+  return argParser
+#end buildArgParser()
+
+#-----------------------------------------------------------------------------
+def buildBatchArgParser():
+  batchArgParser = argparse.ArgumentParser(
+    prog='pseudify.py batch',
+    description='pseudify every report in dirs or globs with a pool of processes',
+    parents=[buildCommonArgParser()]
+  )
+  batchArgParser.add_argument(
+    'paths', nargs='+', help='dirs of reports or globs matching reports'
+  )
+  batchArgParser.add_argument(
+    '-o', '--out-dir', default='.',
+    help='dir to write <report>.txt files to, under the dirs of the reports'
+  )
+  batchArgParser.add_argument(
+    '--format', choices=OUTPUT_FORMATS, default='repr',
+    help='what to write for each report. Defaults to repr'
+  )
+  batchArgParser.add_argument(
+    '-j', '--jobs', type=positiveInt, default=None,
+    help='num of worker processes. Defaults to num of cpus'
+  )
+  return batchArgParser
+#end buildBatchArgParser()
+
+#-----------------------------------------------------------------------------
+#runs the command line argv (default: sys.argv[1:])
+#  returns the exit status instead of exiting
+#  so it can be called from scripts and resident processes
+def main(argv=None):
+  global errCode_
+  errCode_ = NONE
+  argv = sys.argv[1:] if argv is None else argv
+  
+  #if batch mode
+  if argv and argv[0] == 'batch':
+    args = buildBatchArgParser().parse_args(argv[1:])
+    batchErrCode = runBatch(
+      args.paths, args.out_dir, jobs=args.jobs,
+      parser=args.parser, stream=args.stream,
+      cacheDir=args.cache_dir, cacheMaxBytes=args.cache_max_mb << 20,
+      incremental=args.incremental, outFormat=args.format
+    )
+    return exitStatus(batchErrCode)
+  #end if batch mode
+  
+  args = buildArgParser().parse_args(argv)
+  
+  filePaths = args.files
+  #if no reports given
+  if not filePaths:
+    filePaths = ['-'] if not sys.stdin.isatty() else [promptForReport()]
+  
+  if '' in filePaths:
+    errCode_ = errCode_ | FILE_PATH_EMPTY
+    print('Selected file path cannot be empty... terminating...', file=sys.stderr)
+    return exitStatus(errCode_)
+  #end if filePath empty
+  
+  outFile = sys.stdout if args.output == '-' else open(args.output, 'w')
+  try:
+    #loop thru reports
+    for filePath in filePaths:
+      try:
+        appObj = parseFile(
+          filePath, parser=args.parser, stream=args.stream,
+          wsJobs=args.ws_jobs, cacheDir=args.cache_dir,
+          cacheMaxBytes=args.cache_max_mb << 20, incremental=args.incremental
+        )
+      except EdifyParseError as e:
+        errCode_ = errCode_ | errCodeOf(e)
+        print(f'ERROR: {filePath}: {e} terminating...', file=sys.stderr)
+        return exitStatus(errCode_)
+      #end try load the HTML file
+      
+      writeAppObj(appObj, outFile, args.format)
+      
+      #strings parsed in --ws-jobs workers aren't counted
+      if args.intern_report:
+        print(f'{filePath}: {internReport()}', file=sys.stderr)
+    #end loop thru reports
+  finally:
+    if outFile is not sys.stdout:
+      outFile.close()
+  #end try write reports
+  
+  return exitStatus(errCode_)
+#end main(argv)
+
 ##############################################################################
 #MAIN
 ##############################################################################
-filePath = promptForFile()
-if filePath == "":
-  errCode_ = errCode_ & FILE_PATH_EMPTY
-  cleanNExit('Selected file path cannot be empty... terminating...')
-#end if filePath empty
-
-# Load the HTML file
-with open(filePath, 'r') as inFile:
-  html = inFile.read()
-
-html = closeParagraphs(html)
-appObj = AppObject.fromHtml(html)
-
-# Print the data
-print('Number of Properties:', len(appObj.props))
-print('Properties:', appObj.props)
-print()
-print('Number of Properties.parameters:', len(appObj.props['parameters']))
-print('Properties.parameters:', appObj.props['parameters'])
-print()
-print('Number of Global Objects:', len(appObj.globalObjs))
-print('Global Objects:', appObj.globalObjs)
-print('Global Objects[0]:', appObj.globalObjs[0])
-print()
-print('Number of Workspaces:', len(appObj.subroutines))
-print('Workspaces:', appObj.subroutines)
-print('Workspaces[0]:', appObj.subroutines[0])
-print()
-print()
-print('Application Object:')
-print(repr(appObj))
-
-cleanNExit()
+#guarded so importing this file (e.g. in batch worker processes) runs nothing
+if __name__ == '__main__':
+  sys.exit(main())
+#end if __name__ == '__main__'
 ##############################################################################
 #END MAIN
-##############################################################################
+##############################################################################
\ No newline at end of file
@@ -0,0 +1,144 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import os
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#returns html of one row of a steps table
+#  extra is put between the step number and the step type
+def stepRow(wsRef, stepNum, stepType, details, extra=''):
+  return (
+    f'<tr><td><strong><a name="{wsRef}_s{stepNum}">{stepNum}</a></strong>'
+    f'{extra} {stepType}.<br>\nLabel: lbl{stepNum}</td>'
+    f'<td>{details}</td></tr>\n'
+  )
+#end stepRow(wsRef, stepNum, stepType, details, extra)
+
+#-----------------------------------------------------------------------------
+#returns html of the section of one workspace
+#  kind is the text before the ':' of its h2, e.g. 'Subroutine' or 'Subflow'
+#  callsSub makes step 4 call Sub0, subflowRef makes step 6 invoke a subflow
+#  unknownStep adds a step of a type Edify.Types.Step doesn't know
+def workspace(
+  kind, wsRef, callsSub=False, hasHandler=True, subflowRef=None,
+  unknownStep=False
+):
+  rows = [
+    stepRow(wsRef, 1, 'Start', 'Parameters = &lt;none&gt;'),
+    stepRow(
+      wsRef, 2, 'Assign', '<em>Value = </em><a href="#g1">gOther</a>',
+      extra=' <a href="#g0">gCallerANI</a>'
+    ),
+    stepRow(
+      wsRef, 3, 'Choose',
+      '<strong>Branch #1:</strong> cond one<br>\n'
+      f'<span>Target Location = </span><a href="#{wsRef}_s5">5</a><br>'
+    ),
+  ]
+  
+  if callsSub:
+    rows.append(stepRow(
+      wsRef, 4, 'Call',
+      'Target Workspace: <a href="#Sub0">Sub0</a><br>'
+      'Parameters:<br>p1 = <a href="#g0">gCallerANI</a>'
+    ))
+  else:
+    rows.append(stepRow(wsRef, 4, 'Use System Function', 'Function Name = Foo\nmore'))
+  
+  rows.append(stepRow(wsRef, 5, 'Goto', f'Target Location = <a href="#{wsRef}_s7">7</a>'))
+  if subflowRef:
+    rows.append(stepRow(wsRef, 6, 'Subflow', f'<a href="#{subflowRef}">{subflowRef}</a>'))
+  else:
+    rows.append(stepRow(wsRef, 6, 'Goto', f'Target Location = <a href="#{wsRef}_s1">1</a>'))
+  rows.append(stepRow(wsRef, 7, 'End', '<em>Return Mode = </em>Normal'))
+  if unknownStep:
+    rows.append(stepRow(wsRef, 8, 'Play Prompt', 'Prompt = hello'))
+  
+  html = [
+    f'<h2>{kind}: <a name="{wsRef}">{wsRef}</a></h2>\n',
+    '<center><table><caption>Steps</caption>\n' + ''.join(rows) + '</table></center>\n',
+    '<center><table><caption>Entry Parameters</caption>'
+    '<tr><td>p1</td><td>P1</td><td>String</td><td>in</td><td>x</td></tr>'
+    '</table></center>\n',
+    '<center><table><caption>Local Objects</caption>'
+    f'<tr><td><a name="{wsRef}_l1"><strong>lObj</strong></a></td>'
+    '<td><strong>Object Class: </strong>String<br>'
+    f'<strong>Used by: </strong>{wsRef}</td></tr></table></center>\n',
+  ]
+  if hasHandler:
+    html.append(
+      '<center><table><caption>Exception Handling Table</caption>'
+      '<tr><th>E1</th><td><a href="#XH">XH</a></td></tr></table></center>\n'
+    )
+  
+  return ''.join(html)
+#end workspace(kind, wsRef, callsSub, hasHandler, subflowRef, unknownStep)
+
+#-----------------------------------------------------------------------------
+#returns html of a report shaped like the ones Edify exports
+#  entry workspace Main, nSubs subroutines Sub0.. (the even ones invoke
+#  subflow SF1), exception handler XH and subflows SF1 -> SF2
+#  cycle makes SF2 invoke SF1 back
+#  unknownStep adds a step of an unknown type to Main
+def report(nSubs=3, cycle=False, unknownStep=False):
+  html = [
+    '<html><head><title>r</title></head><body>\n<h1>Report</h1>\n',
+    '<h2>Application Object Properties</h2>\n<center><table>'
+    '<tr><th>Name</th><td>App</td></tr><tr><th>Version</th><td>1</td></tr>'
+    '</table></center>\n',
+    '<center><table><caption>Application Object Parameters</caption>'
+    '<tr><td>ap</td><td>AP</td><td>String</td><td>in</td><td>d</td></tr>'
+    '</table></center>\n',
+    '<h2>Global Objects</h2><center><table><caption>Global Objects</caption>'
+    '<tr><td><a name="g0"><strong>gCallerANI</strong></a></td>'
+    '<td><strong>Object Class: </strong>String<br>'
+    '<strong>Used by: </strong>Main , Sub0</td></tr>'
+    '<tr><td><a name="g1"><strong>gOther</strong></a></td>'
+    '<td><strong>Object Class: </strong>Number<br>'
+    '<strong>Initial Value: </strong>0</td></tr>'
+    '</table></center>\n',
+  ]
+  
+  wsNames = ['Main'] + [f'Sub{i}' for i in range(nSubs)] + ['XH']
+  html.append('<h2>Workspaces</h2><center><table><caption>Workspace List</caption>')
+  #loop thru workspaces to list them
+  for wsName in wsNames:
+    html.append(
+      f'<tr><td><strong>{wsName}</strong></td>'
+      '<td><strong>Exception Workspaces: </strong>XH<br>'
+      '<strong>Called by: </strong>Main</td></tr>'
+    )
+  #end loop thru workspaces to list them
+  html.append('</table></center>\n')
+  
+  html.append(workspace(
+    'Entry Workspace', 'Main', callsSub=nSubs > 0, subflowRef='SF1',
+    unknownStep=unknownStep
+  ))
+  #loop thru subroutines
+  for i in range(nSubs):
+    html.append(workspace(
+      'Subroutine', f'Sub{i}', subflowRef='SF1' if i % 2 == 0 else None
+    ))
+  #end loop thru subroutines
+  html.append(workspace('Exception Handler', 'XH', hasHandler=False))
+  html.append(workspace('Subflow', 'SF1', hasHandler=False, subflowRef='SF2'))
+  html.append(workspace(
+    'Subflow', 'SF2', hasHandler=False, subflowRef='SF1' if cycle else None
+  ))
+  html.append('</body></html>\n')
+  
+  return ''.join(html)
+#end report(nSubs, cycle, unknownStep)
+
+#-----------------------------------------------------------------------------
+#writes report(**kwargs) to dirPath/fileName and returns its path
+def writeReport(dirPath, fileName='report.html', **kwargs):
+  path = os.path.join(str(dirPath), fileName)
+  with open(path, 'w', encoding='utf-8') as outFile:
+    outFile.write(report(**kwargs))
+  return path
+#end writeReport(dirPath, fileName, **kwargs)
\ No newline at end of file
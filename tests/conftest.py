@@ -0,0 +1,31 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import os
+import sys
+
+import pytest
+
+#pseudify.py and the Edify package live in the repo root
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_DIR not in sys.path:
+  sys.path.insert(0, REPO_DIR)
+
+import SampleReports
+
+##############################################################################
+#FIXTURES
+##############################################################################
+#-----------------------------------------------------------------------------
+#path of a small sample report, see SampleReports.report(...)
+@pytest.fixture
+def reportPath(tmp_path):
+  return SampleReports.writeReport(tmp_path)
+#end reportPath(tmp_path)
+
+#-----------------------------------------------------------------------------
+#path of a sample report whose subflows invoke each other
+@pytest.fixture
+def cycleReportPath(tmp_path):
+  return SampleReports.writeReport(tmp_path, 'cycle.html', nSubs=4, cycle=True)
+#end cycleReportPath(tmp_path)
\ No newline at end of file
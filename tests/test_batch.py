@@ -0,0 +1,103 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import os
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import pseudify
+import SampleReports
+
+##############################################################################
+#CLASSES
+##############################################################################
+#stands in for ProcessPoolExecutor when every worker died
+class BrokenPool:
+  def __init__(self, max_workers=None):
+    pass
+  #end __init__(self, max_workers)
+  
+  #----------------------------------------------------------------------------
+  def __enter__(self):
+    return self
+  #end __enter__(self)
+  
+  #----------------------------------------------------------------------------
+  def __exit__(self, *excInfo):
+    return False
+  #end __exit__(self, *excInfo)
+  
+  #----------------------------------------------------------------------------
+  def submit(self, func, *args):
+    future = Future()
+    future.set_exception(BrokenProcessPool('a worker died'))
+    return future
+  #end submit(self, func, *args)
+#end class BrokenPool
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+def testOutPathsKeepStemsInOneDir(tmp_path):
+  outPaths = pseudify.outPathsFor([str(tmp_path / 'r.html'), str(tmp_path / 's.html')], 'out')
+  assert outPaths == [os.path.join('out', 'r.txt'), os.path.join('out', 's.txt')]
+#end testOutPathsKeepStemsInOneDir(tmp_path)
+
+#-----------------------------------------------------------------------------
+def testOutPathsAreUnique(tmp_path):
+  filePaths = [
+    str(tmp_path / 'a' / 'r.html'), str(tmp_path / 'b' / 'r.html'),
+    str(tmp_path / 'a' / 'x.htm'), str(tmp_path / 'a' / 'x.html'),
+  ]
+  outPaths = pseudify.outPathsFor(filePaths, 'out')
+  assert outPaths == [
+    os.path.join('out', 'a', 'r.txt'), os.path.join('out', 'b', 'r.txt'),
+    os.path.join('out', 'a', 'x.htm.txt'), os.path.join('out', 'a', 'x.html.txt'),
+  ]
+#end testOutPathsAreUnique(tmp_path)
+
+#-----------------------------------------------------------------------------
+#same named reports in different dirs must not overwrite each other
+def testBatchWritesEveryReport(tmp_path):
+  for dirName in ('a', 'b'):
+    (tmp_path / dirName).mkdir()
+    SampleReports.writeReport(tmp_path / dirName, 'r.html')
+  outDir = tmp_path / 'out'
+  
+  status = pseudify.main([
+    'batch', str(tmp_path / 'a'), str(tmp_path / 'b'),
+    '-o', str(outDir), '-j', '1'
+  ])
+  
+  assert status == 0
+  assert (outDir / 'a' / 'r.txt').read_text().startswith('AppObject(')
+  assert (outDir / 'b' / 'r.txt').read_text().startswith('AppObject(')
+#end testBatchWritesEveryReport(tmp_path)
+
+#-----------------------------------------------------------------------------
+@pytest.mark.parametrize('jobs', ['0', '-2'])
+def testJobsMustBePositive(tmp_path, capsys, jobs):
+  with pytest.raises(SystemExit) as excInfo:
+    pseudify.main(['batch', str(tmp_path), '-j', jobs])
+  
+  assert excInfo.value.code == 2
+  assert 'must be at least 1' in capsys.readouterr().err
+#end testJobsMustBePositive(tmp_path, capsys, jobs)
+
+#-----------------------------------------------------------------------------
+#a broken pool fails its reports but the batch still ends with a summary
+def testBrokenPoolIsReported(tmp_path, capsys, monkeypatch):
+  SampleReports.writeReport(tmp_path, 'r.html')
+  SampleReports.writeReport(tmp_path, 's.html')
+  monkeypatch.setattr(pseudify, 'ProcessPoolExecutor', BrokenPool)
+  
+  status = pseudify.main(['batch', str(tmp_path), '-o', str(tmp_path / 'out')])
+  
+  err = capsys.readouterr().err
+  assert status != 0
+  assert err.count('BrokenProcessPool') == 2
+  assert 'pseudified 0/2 reports' in err
+#end testBrokenPoolIsReported(tmp_path, capsys, monkeypatch)
\ No newline at end of file
@@ -0,0 +1,64 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import pytest
+
+import pseudify
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#returns (repr of AppObject, names of rebuilt workspaces) of parsing report
+#  at path with the workspace cache in cacheDir
+def parseIncremental(path, cacheDir):
+  with open(path) as inFile:
+    appObj, rebuiltLst = pseudify.AppObject.fromHtmlIncremental(inFile, str(cacheDir))
+  return repr(appObj), rebuiltLst
+#end parseIncremental(path, cacheDir)
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+#workspaces invoking subflows (which invoke each other) must be reused too
+def testUnchangedReportIsNotRebuilt(cycleReportPath, tmp_path):
+  firstRepr, firstRebuilt = parseIncremental(cycleReportPath, tmp_path / 'cache')
+  assert len(firstRebuilt) == 6
+  
+  #loop thru later runs
+  for _ in range(2):
+    laterRepr, laterRebuilt = parseIncremental(cycleReportPath, tmp_path / 'cache')
+    assert laterRebuilt == []
+    assert laterRepr == firstRepr
+  #end loop thru later runs
+#end testUnchangedReportIsNotRebuilt(cycleReportPath, tmp_path)
+
+#-----------------------------------------------------------------------------
+#editing a subflow rebuilds every workspace that reaches it, and only those
+def testEditedSubflowIsRebuilt(cycleReportPath, tmp_path):
+  parseIncremental(cycleReportPath, tmp_path / 'cache')
+  
+  with open(cycleReportPath) as inFile:
+    html = inFile.read()
+  html = html.replace('SF2_s2">2</a></strong>', 'SF2_s2">2</a></strong> edited')
+  with open(cycleReportPath, 'w') as outFile:
+    outFile.write(html)
+  
+  appRepr, rebuilt = parseIncremental(cycleReportPath, tmp_path / 'cache')
+  assert sorted(rebuilt) == ['Main', 'Sub0', 'Sub2']
+  assert appRepr == repr(pseudify.AppObject.fromHtml(pseudify.closeParagraphs(html)))
+#end testEditedSubflowIsRebuilt(cycleReportPath, tmp_path)
+
+#-----------------------------------------------------------------------------
+@pytest.mark.parametrize('stream', [[], ['--stream']], ids=['whole', 'stream'])
+def testCliReportsNothingRebuilt(cycleReportPath, tmp_path, capsys, stream):
+  argv = [
+    cycleReportPath, '--cache-dir', str(tmp_path / 'cache'), '--incremental',
+    '--format', 'repr', '-o', str(tmp_path / 'out.txt')
+  ] + stream
+  
+  assert pseudify.main(argv) == 0
+  assert pseudify.main(argv) == 0
+  assert 'rebuilt 0 of 6 workspaces' in capsys.readouterr().err
+#end testCliReportsNothingRebuilt(cycleReportPath, tmp_path, capsys, stream)
\ No newline at end of file
@@ -0,0 +1,123 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import pseudify
+import SampleReports
+from Edify.Analysis.CallGraph import CallGraph, CALL_EDGE, EXCEPTION_EDGE
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#returns CallGraph of the sample report made with kwargs
+#  with step 4 of subflow SF2 made a Call of workspace sf2Calls if given
+def sampleGraph(sf2Calls=None, **kwargs):
+  html = SampleReports.report(**kwargs)
+  if sf2Calls:
+    html = html.replace(
+      SampleReports.stepRow('SF2', 4, 'Use System Function', 'Function Name = Foo\nmore'),
+      SampleReports.stepRow(
+        'SF2', 4, 'Call',
+        f'Target Workspace: <a href="#{sf2Calls}">{sf2Calls}</a><br>'
+        'Parameters:<br>p1 = <a href="#g0">gCallerANI</a>'
+      )
+    )
+  #end if sf2Calls
+  
+  return CallGraph.fromAppObj(pseudify.AppObject.fromHtml(html))
+#end sampleGraph(sf2Calls, **kwargs)
+
+#-----------------------------------------------------------------------------
+#returns list of names of workspaces with indexes in indexes
+def names(graph, indexes):
+  return [graph.workspaces[i].name for i in indexes]
+#end names(graph, indexes)
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+#workspaces: Main, Sub0, Sub1, Sub2, XH
+#  Main calls Sub0, every one but XH hands exceptions to XH
+def testEdges():
+  graph = sampleGraph()
+  
+  assert names(graph, graph.callees(0)) == ['Sub0', 'XH']
+  assert list(graph.edgeKinds[:2]) == [CALL_EDGE, EXCEPTION_EDGE]
+  assert names(graph, graph.callers(4)) == ['Main', 'Sub0', 'Sub1', 'Sub2']
+  assert names(graph, graph.callers(0)) == []
+  assert graph.unresolved == []
+#end testEdges()
+
+#-----------------------------------------------------------------------------
+def testUnreachableWorkspaces():
+  graph = sampleGraph()
+  
+  assert [ws.name for ws in graph.unreachableWorkspaces()] == ['Sub1', 'Sub2']
+  assert [ws.name for ws in graph.unreachableWorkspaces(roots=[2])] == ['Main', 'Sub0', 'Sub2']
+#end testUnreachableWorkspaces()
+
+#-----------------------------------------------------------------------------
+def testTopologicalOrder():
+  graph = sampleGraph()
+  order = names(graph, graph.topologicalOrder())
+  
+  assert sorted(order) == sorted(ws.name for ws in graph.workspaces)
+  assert order.index('Main') < order.index('Sub0') < order.index('XH')
+  assert order[-1] == 'XH'
+  assert graph.recursiveComponents() == []
+#end testTopologicalOrder()
+
+#-----------------------------------------------------------------------------
+#calls in subflows count as calls of every workspace invoking them
+#  Main, Sub0 and Sub2 invoke SF1, which invokes SF2
+def testSubflowCallsFolded():
+  graph = sampleGraph(sf2Calls='Sub1', nSubs=4, cycle=True)
+  
+  assert names(graph, graph.callers(2)) == ['Main', 'Sub0', 'Sub2']
+  #Sub1 is now reached thru Main's subflows
+  assert [ws.name for ws in graph.unreachableWorkspaces()] == ['Sub2', 'Sub3']
+#end testSubflowCallsFolded()
+
+#-----------------------------------------------------------------------------
+#SF2 calling Main makes Main call itself (thru SF1) and Sub0 call Main back
+#  the subflow cycle SF1 -> SF2 -> SF1 is only walked once
+def testRecursion():
+  graph = sampleGraph(sf2Calls='Main', nSubs=4, cycle=True)
+  
+  recursive = [sorted(names(graph, scc)) for scc in graph.recursiveComponents()]
+  assert recursive == [['Main', 'Sub0']]
+  
+  sccs = [sorted(names(graph, scc)) for scc in graph.stronglyConnectedComponents()]
+  #callees' components 1st
+  assert sccs.index(['XH']) < sccs.index(['Main', 'Sub0']) < sccs.index(['Sub2'])
+  
+  order = names(graph, graph.topologicalOrder())
+  assert abs(order.index('Main') - order.index('Sub0')) == 1
+  assert order.index('Sub2') < order.index('Main')
+#end testRecursion()
+
+#-----------------------------------------------------------------------------
+def testSelfRecursion():
+  graph = sampleGraph(sf2Calls='Sub0', nSubs=4)
+  
+  assert [names(graph, scc) for scc in graph.recursiveComponents()] == [['Sub0']]
+#end testSelfRecursion()
+
+#-----------------------------------------------------------------------------
+#the sample's "Workspace List" says Main calls every workspace and every one
+#  hands exceptions to XH, the steps say otherwise
+def testListedDiffs():
+  graph = sampleGraph()
+  diffs = {(ws.name, attr): (extra, missing) for ws, attr, extra, missing in graph.listedDiffs()}
+  
+  assert ('Sub0', 'calledBy') not in diffs
+  assert diffs[('Sub1', 'calledBy')] == ([], ['Main'])
+  assert diffs[('XH', 'calledBy')] == ([], ['Main'])
+  assert diffs[('XH', 'exceptionWorkspaces')] == ([], ['XH'])
+  assert ('Main', 'exceptionWorkspaces') not in diffs
+  
+  for ws in graph.workspaces:
+    ws.calledBy = ws.exceptionWorkspaces = None
+  assert graph.listedDiffs() == []
+#end testListedDiffs()
\ No newline at end of file
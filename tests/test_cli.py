@@ -0,0 +1,104 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pseudify
+import SampleReports
+
+##############################################################################
+#CONSTANTS
+##############################################################################
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PSEUDIFY_PATH = os.path.join(REPO_DIR, 'pseudify.py')
+
+#props row that makes the parser warn about the app object params
+PARAMS_PROP_ROW = '<tr><th>parameters</th><td>p</td></tr>'
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#writes a report whose parse prints warnings, and returns its path
+def writeNoisyReport(dirPath):
+  reportPath = os.path.join(str(dirPath), 'noisy.html')
+  html = SampleReports.report(unknownStep=True).replace(
+    '<tr><th>Version</th><td>1</td></tr>', PARAMS_PROP_ROW, 1
+  )
+  with open(reportPath, 'w') as outFile:
+    outFile.write(html)
+  
+  return reportPath
+#end writeNoisyReport(dirPath)
+
+#-----------------------------------------------------------------------------
+#runs pseudify.py in a child process with its output piped
+#  returns the CompletedProcess
+def runPseudify(args, stdin=None):
+  return subprocess.run(
+    [sys.executable, PSEUDIFY_PATH] + args,
+    input=stdin, capture_output=True, text=True, cwd=REPO_DIR
+  )
+#end runPseudify(args, stdin)
+
+#-----------------------------------------------------------------------------
+def assertWarned(err):
+  assert 'Unexpected step type "Play Prompt"' in err
+  assert 'meta-property named "parameters"' in err
+#end assertWarned(err)
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+#piped json parses even when the parse warns, the warnings go to stderr
+@pytest.mark.parametrize('modeArgs', [[], ['--stream']], ids=['whole', 'stream'])
+def testJsonPipes(tmp_path, modeArgs):
+  noisyPath = writeNoisyReport(tmp_path)
+  
+  result = runPseudify([noisyPath, '--format', 'json'] + modeArgs)
+  
+  assert result.returncode != 0
+  appObj = json.loads(result.stdout)
+  assert appObj['props']['Name'] == 'App'
+  assert len(appObj['subroutines']) == 5
+  assertWarned(result.stderr)
+#end testJsonPipes(tmp_path, modeArgs)
+
+#-----------------------------------------------------------------------------
+def testJsonPipesFromStdin(tmp_path):
+  with open(writeNoisyReport(tmp_path)) as inFile:
+    result = runPseudify(['-', '--format', 'json'], stdin=inFile.read())
+  
+  assert json.loads(result.stdout)['props']['Name'] == 'App'
+  assertWarned(result.stderr)
+#end testJsonPipesFromStdin(tmp_path)
+
+#-----------------------------------------------------------------------------
+def testNdjsonOneRecordPerLine(tmp_path, capsys):
+  noisyPath = writeNoisyReport(tmp_path)
+  
+  assert pseudify.main([noisyPath, '--format', 'ndjson']) != 0
+  out, err = capsys.readouterr()
+  
+  records = [json.loads(line) for line in out.splitlines()]
+  assert records[0]['props']['Name'] == 'App'
+  assert len(records) > 1
+  assertWarned(err)
+#end testNdjsonOneRecordPerLine(tmp_path, capsys)
+
+#-----------------------------------------------------------------------------
+def testPseudocodeHasNoWarnings(tmp_path, capsys):
+  noisyPath = writeNoisyReport(tmp_path)
+  
+  pseudify.main([noisyPath, '--format', 'pseudocode'])
+  out, err = capsys.readouterr()
+  
+  assert 'WARNING' not in out
+  assertWarned(err)
+#end testPseudocodeHasNoWarnings(tmp_path, capsys)
\ No newline at end of file
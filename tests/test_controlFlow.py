@@ -0,0 +1,75 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import pytest
+
+import pseudify
+import SampleReports
+from Edify.Analysis.ControlFlow import ControlFlowGraph
+
+##############################################################################
+#FIXTURES
+##############################################################################
+#-----------------------------------------------------------------------------
+#cfg of Main of the sample report with an unknown step after its End
+#  1 Start, 2 Assign, 3 Choose (-> 5), 4 Call, 5 Goto 7, 6 Subflow, 7 End, 8
+@pytest.fixture
+def mainCfg():
+  appObj = pseudify.AppObject.fromHtml(SampleReports.report(unknownStep=True))
+  return ControlFlowGraph.fromFlow(appObj.getSubroutine('Main'))
+#end mainCfg()
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+#jump targets and steps after jumps or ends start blocks
+def testBasicBlocks(mainCfg):
+  assert list(mainCfg.leaders) == [1, 0, 0, 1, 1, 1, 1, 1]
+  assert mainCfg.basicBlocks() == [(0, 3), (3, 4), (4, 5), (5, 6), (6, 7), (7, 8)]
+#end testBasicBlocks(mainCfg)
+
+#-----------------------------------------------------------------------------
+def testSuccessors(mainCfg):
+  assert [list(mainCfg.successors(i)) for i in range(8)] == [
+    [1], [2], [4, 3], [4], [6], [6], [], []
+  ]
+  assert mainCfg.unresolved == []
+#end testSuccessors(mainCfg)
+
+#-----------------------------------------------------------------------------
+#the step the goto skips and the step after End are dead
+def testReachable(mainCfg):
+  assert list(mainCfg.reachable()) == [1, 1, 1, 1, 1, 0, 1, 0]
+  assert list(mainCfg.reachable(5)) == [0, 0, 0, 0, 0, 1, 1, 0]
+  assert [step.id for step in mainCfg.deadSteps()] == ['6', '8']
+#end testReachable(mainCfg)
+
+#-----------------------------------------------------------------------------
+#a goto back to the 1st step still leaves the step it stands in dead
+def testGotoBack():
+  appObj = pseudify.AppObject.fromHtml(SampleReports.report())
+  cfg = ControlFlowGraph.fromFlow(appObj.getSubroutine('Sub1'))
+  
+  assert list(cfg.successors(5)) == [0]
+  assert [step.id for step in cfg.deadSteps()] == ['6']
+#end testGotoBack()
+
+#-----------------------------------------------------------------------------
+def testUnresolvedTarget():
+  html = SampleReports.report().replace('href="#Main_s7">7', 'href="#nowhere">7', 1)
+  cfg = ControlFlowGraph.fromFlow(pseudify.AppObject.fromHtml(html).getSubroutine('Main'))
+  
+  assert cfg.unresolved == [(4, '7:#nowhere')]
+  assert list(cfg.successors(4)) == []
+  assert cfg.reachable()[6] == 0
+#end testUnresolvedTarget()
+
+#-----------------------------------------------------------------------------
+def testNoSteps():
+  cfg = ControlFlowGraph([])
+  
+  assert cfg.basicBlocks() == []
+  assert cfg.deadSteps() == []
+  assert len(cfg.reachable()) == 0
+#end testNoSteps()
\ No newline at end of file
@@ -0,0 +1,128 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import json
+
+import pytest
+
+import pseudify
+import SampleReports
+from Edify.Output import Json
+from Edify.Utils.Errors import EdifyParseError
+
+##############################################################################
+#CONSTANTS
+##############################################################################
+#extra command line args of each way of parsing a report
+PARSE_MODES = {
+  'whole': [],
+  'stream': ['--stream'],
+  'wsJobs': ['--ws-jobs', '2'],
+  'cache': ['--cache-dir', '{cacheDir}'],
+  'incremental': ['--cache-dir', '{cacheDir}', '--incremental'],
+}
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+#an unknown step type fails the run, and doesn't fail the next clean report
+#  cached modes run twice so the 2nd run is served from the cache
+@pytest.mark.parametrize('mode', PARSE_MODES)
+def testUnknownStepTypeSetsExitStatus(tmp_path, mode):
+  unknownPath = SampleReports.writeReport(tmp_path, 'unknown.html', unknownStep=True)
+  cleanPath   = SampleReports.writeReport(tmp_path, 'clean.html')
+  modeArgs = [arg.format(cacheDir=tmp_path / 'cache') for arg in PARSE_MODES[mode]]
+  outArgs  = ['--format', 'repr', '-o', str(tmp_path / 'out.txt')]
+  
+  #loop thru runs
+  for _ in range(2):
+    assert pseudify.main([unknownPath] + modeArgs + outArgs) != 0
+    assert pseudify.errCode_ & pseudify.UNEXPECTED_STEP_TYPE
+    
+    assert pseudify.main([cleanPath] + modeArgs + outArgs) == 0
+    assert pseudify.errCode_ == pseudify.NONE
+  #end loop thru runs
+#end testUnknownStepTypeSetsExitStatus(tmp_path, mode)
+
+#-----------------------------------------------------------------------------
+def testBatchReportsUnknownStepType(tmp_path):
+  SampleReports.writeReport(tmp_path, 'unknown.html', unknownStep=True)
+  SampleReports.writeReport(tmp_path, 'clean.html')
+  
+  status = pseudify.main(['batch', str(tmp_path), '-o', str(tmp_path / 'out'), '-j', '1'])
+  assert status != 0
+  
+  _, err, _, _ = pseudify.pseudifyFile(
+    str(tmp_path / 'unknown.html'), str(tmp_path / 'unknown.txt')
+  )
+  assert err & pseudify.UNEXPECTED_STEP_TYPE
+  _, err, _, _ = pseudify.pseudifyFile(
+    str(tmp_path / 'clean.html'), str(tmp_path / 'clean.txt')
+  )
+  assert err == pseudify.NONE
+#end testBatchReportsUnknownStepType(tmp_path)
+#-----------------------------------------------------------------------------
+#errors raised by other modules carry their own err codes, which are mapped
+#  to pseudify's instead of being taken for whatever pseudify code has the
+#  same value
+@pytest.mark.parametrize('old,new,errCode', [
+  (
+    'Target Location = <a href="#Main_s7">7</a>', 'nowhere',
+    pseudify.BAD_STEP_DETAILS
+  ),
+  (
+    '<tr><th>E1</th><td><a href="#XH">XH</a></td></tr>', '<tr><th>E1</th></tr>',
+    pseudify.BAD_XCPTN_HNDLR_TABLE_FORMAT
+  ),
+], ids=['stepDetails', 'xcptnHndlrTable'])
+def testForeignErrCodesMapped(tmp_path, old, new, errCode):
+  reportPath = tmp_path / 'bad.html'
+  reportPath.write_text(SampleReports.report().replace(old, new, 1))
+  
+  _, err, _, msg = pseudify.pseudifyFile(str(reportPath), str(tmp_path / 'bad.txt'))
+  
+  assert msg
+  assert err == errCode
+  assert pseudify.main([str(reportPath), '-o', str(tmp_path / 'out.txt')]) != 0
+  assert pseudify.errCode_ == errCode
+#end testForeignErrCodesMapped(tmp_path, old, new, errCode)
+
+#-----------------------------------------------------------------------------
+def testErrCodeOf():
+  assert pseudify.errCodeOf(EdifyParseError('x', pseudify.PROPS_NOT_FOUND, pseudify.__name__)) \
+    == pseudify.PROPS_NOT_FOUND
+  assert pseudify.errCodeOf(EdifyParseError('x', Json.BAD_RECORD, Json.__name__)) \
+    == pseudify.BAD_EXPORT
+  assert pseudify.errCodeOf(EdifyParseError('x')) == pseudify.UNEXPECTED_ERROR
+#end testErrCodeOf()
+
+#-----------------------------------------------------------------------------
+#warnings that don't stop the parse still show in the exit status
+#  and in the combined status of a batch
+def testWarningsSetErrCode(tmp_path):
+  reportPath = SampleReports.writeReport(tmp_path, 'noSubs.html', nSubs=0)
+  
+  _, err, _, msg = pseudify.pseudifyFile(reportPath, str(tmp_path / 'noSubs.txt'))
+  assert msg is None
+  assert err == pseudify.SUBROUTINES_NOT_FOUND
+  
+  SampleReports.writeReport(tmp_path, 'unknown.html', unknownStep=True)
+  status = pseudify.main(['batch', str(tmp_path), '-o', str(tmp_path / 'out'), '-j', '1'])
+  assert status == pseudify.exitStatus(
+    pseudify.SUBROUTINES_NOT_FOUND | pseudify.UNEXPECTED_STEP_TYPE
+  )
+#end testWarningsSetErrCode(tmp_path)
+#-----------------------------------------------------------------------------
+#the unknown step type warning goes to stderr so piped output still parses
+@pytest.mark.parametrize('outFormat', ['json', 'ndjson'])
+def testUnknownStepWarningOffStdout(tmp_path, capsys, outFormat):
+  unknownPath = SampleReports.writeReport(tmp_path, 'unknown.html', unknownStep=True)
+  
+  assert pseudify.main([unknownPath, '--format', outFormat]) != 0
+  out, err = capsys.readouterr()
+  
+  records = [json.loads(line) for line in out.splitlines()]
+  assert records[0]['props']['Name'] == 'App'
+  assert 'Unexpected step type "Play Prompt"' in err
+#end testUnknownStepWarningOffStdout(tmp_path, capsys, outFormat)
\ No newline at end of file
@@ -0,0 +1,53 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import io
+import sys
+
+import pytest
+
+import pseudify
+import SampleReports
+import Edify.Utils.Parsers as Parsers
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+def parseSample(stream, **kwargs):
+  html = SampleReports.report(**kwargs)
+  if stream:
+    return pseudify.AppObject.fromHtmlStream(io.StringIO(html))
+  return pseudify.AppObject.fromHtml(pseudify.closeParagraphs(html))
+#end parseSample(stream, **kwargs)
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+#the table only holds the strings of the report parsed last
+@pytest.mark.parametrize('stream', [False, True], ids=['whole', 'stream'])
+def testInternTableIsPerReport(stream):
+  parseSample(stream, nSubs=2)
+  aloneSize = len(Parsers.internedStrs_)
+  aloneReport = Parsers.internReport()
+  
+  parseSample(stream, nSubs=8)
+  assert 'Sub7' in Parsers.internedStrs_
+  
+  parseSample(stream, nSubs=2)
+  assert 'Sub7' not in Parsers.internedStrs_
+  assert len(Parsers.internedStrs_) == aloneSize
+  assert Parsers.internReport() == aloneReport
+#end testInternTableIsPerReport(stream)
+#-----------------------------------------------------------------------------
+#the saving reported is net of what the table itself takes
+def testReportCountsTable():
+  parseSample(False, nSubs=2)
+  tableBytes = sys.getsizeof(Parsers.internedStrs_)
+  
+  assert Parsers.internReport().endswith(
+    f'saving ~{Parsers.internBytesSaved_ - tableBytes} bytes '
+    f'({Parsers.internBytesSaved_} shared - {tableBytes} for the table)'
+  )
+#end testReportCountsTable()
\ No newline at end of file
@@ -0,0 +1,103 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import io
+import json
+
+import pytest
+
+import pseudify
+from Edify.Output import Json
+from Edify.Utils.Constants import SCHEMA_VERSION
+from Edify.Utils.Errors    import EdifyParseError
+
+##############################################################################
+#FIXTURES
+##############################################################################
+#-----------------------------------------------------------------------------
+@pytest.fixture
+def appObj(cycleReportPath):
+  return pseudify.parseFile(cycleReportPath)
+#end appObj(cycleReportPath)
+
+#-----------------------------------------------------------------------------
+#list of the lines of appObj written as ndjson
+@pytest.fixture
+def ndjsonLines(appObj):
+  return list(Json.iterNdjson(appObj))
+#end ndjsonLines(appObj)
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+def readNdjsonLines(lines):
+  return pseudify.AppObject.fromNdjson(io.StringIO(''.join(lines)))
+#end readNdjsonLines(lines)
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+@pytest.mark.parametrize('outFormat', ['json', 'ndjson'])
+def testRoundTrip(appObj, outFormat):
+  outFile = io.StringIO()
+  pseudify.writeAppObj(appObj, outFile, outFormat)
+  outFile.seek(0)
+  
+  if outFormat == 'json':
+    loaded = pseudify.AppObject.fromJson(outFile)
+  else:
+    loaded = pseudify.AppObject.fromNdjson(outFile)
+  
+  assert repr(loaded) == repr(appObj)
+  #workspaces invoking the same subflow share it again
+  assert loaded.getSubroutine('Main').subflows[0] is loaded.getSubroutine('Sub0').subflows[0]
+#end testRoundTrip(appObj, outFormat)
+
+#-----------------------------------------------------------------------------
+#each workspace line loads on its own
+def testWorkspaceLineLoadsAlone(appObj, ndjsonLines):
+  kind, ws = Json.parseNdjsonLine(ndjsonLines[1])
+  
+  assert kind == Json.wsKind(appObj.subroutines[0])
+  assert repr(ws) == repr(appObj.subroutines[0])
+#end testWorkspaceLineLoadsAlone(appObj, ndjsonLines)
+
+#-----------------------------------------------------------------------------
+@pytest.mark.parametrize('breakLines', [
+  lambda lines: lines[1:],
+  lambda lines: [lines[0][:len(lines[0]) // 2] + '\n'] + lines[1:],
+  lambda lines: [json.dumps({'record': 'app', 'schemaVersion': SCHEMA_VERSION}) + '\n'] + lines[1:],
+  lambda lines: lines[:1] + [lines[1][:-10] + '\n'],
+  lambda lines: lines[:1] + ['[1, 2]\n'],
+  lambda lines: lines[:1] + [json.dumps({'record': 'Subroutine'}) + '\n'],
+  lambda lines: [],
+], ids=[
+  'noAppLine', 'truncatedAppLine', 'appLineMissingKeys', 'truncatedWsLine',
+  'notAnObject', 'wsLineMissingKeys', 'empty'
+])
+def testBadNdjsonRaisesParseError(ndjsonLines, breakLines):
+  with pytest.raises(EdifyParseError) as excInfo:
+    readNdjsonLines(breakLines(ndjsonLines))
+  assert excInfo.value.errCode == Json.BAD_RECORD
+#end testBadNdjsonRaisesParseError(ndjsonLines, breakLines)
+
+#-----------------------------------------------------------------------------
+def testNewerSchemaIsRejected(ndjsonLines):
+  appRecord = json.loads(ndjsonLines[0]) | {'schemaVersion': SCHEMA_VERSION + 1}
+  
+  with pytest.raises(EdifyParseError) as excInfo:
+    readNdjsonLines([json.dumps(appRecord) + '\n'] + ndjsonLines[1:])
+  assert excInfo.value.errCode == Json.UNSUPPORTED_SCHEMA
+#end testNewerSchemaIsRejected(ndjsonLines)
+
+#-----------------------------------------------------------------------------
+def testTruncatedJsonRaisesParseError(appObj):
+  outFile = io.StringIO()
+  Json.writeJson(appObj, outFile)
+  
+  with pytest.raises(EdifyParseError) as excInfo:
+    pseudify.AppObject.fromJson(io.StringIO(outFile.getvalue()[:-20]))
+  assert excInfo.value.errCode == Json.BAD_RECORD
+#end testTruncatedJsonRaisesParseError(appObj)
\ No newline at end of file
@@ -0,0 +1,105 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import pytest
+
+import pseudify
+import SampleReports
+from Edify.Types.LazySubroutine import LazySubroutine, lazyClassFor, materializeAll
+from Edify.Types.Subroutine     import Subroutine, EntryWorkspace, ExceptionHandler
+
+##############################################################################
+#FIXTURES
+##############################################################################
+#-----------------------------------------------------------------------------
+@pytest.fixture
+def html():
+  return SampleReports.report(nSubs=4, cycle=True)
+#end html()
+
+#-----------------------------------------------------------------------------
+@pytest.fixture
+def lazyAppObj(html):
+  return pseudify.AppObject.fromHtml(html, lazy=True)
+#end lazyAppObj(html)
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+def testNothingParsedUpFront(lazyAppObj):
+  wsLst = lazyAppObj.subroutines
+  
+  assert [type(ws) for ws in wsLst] == (
+    [lazyClassFor(EntryWorkspace)]
+    + [lazyClassFor(Subroutine)] * 4
+    + [lazyClassFor(ExceptionHandler)]
+  )
+  assert isinstance(wsLst[0], EntryWorkspace)
+  assert isinstance(wsLst[-1], ExceptionHandler)
+  #name, ref and the workspace list columns are there without parsing
+  assert [ws.name for ws in wsLst] == ['Main', 'Sub0', 'Sub1', 'Sub2', 'Sub3', 'XH']
+  assert [ws.ref for ws in wsLst] == ['Main', 'Sub0', 'Sub1', 'Sub2', 'Sub3', 'XH']
+  assert all(isinstance(ws, LazySubroutine) for ws in wsLst)
+#end testNothingParsedUpFront(lazyAppObj)
+
+#-----------------------------------------------------------------------------
+def testFirstTouchParsesInPlace(lazyAppObj):
+  ws = lazyAppObj.subroutines[1]
+  calledBy = ws.calledBy
+  exceptionWorkspaces = ws.exceptionWorkspaces
+  
+  assert len(ws.steps) == 7
+  assert type(ws) is Subroutine
+  assert ws.calledBy is calledBy and ws.calledBy
+  assert ws.exceptionWorkspaces is exceptionWorkspaces and ws.exceptionWorkspaces
+  #the others stay unparsed
+  assert isinstance(lazyAppObj.subroutines[2], LazySubroutine)
+#end testFirstTouchParsesInPlace(lazyAppObj)
+
+#-----------------------------------------------------------------------------
+def testSameAsEager(html, lazyAppObj):
+  eager = pseudify.AppObject.fromHtml(html)
+  
+  assert repr(lazyAppObj) == repr(eager)
+  assert [type(ws) for ws in lazyAppObj.subroutines] == [type(ws) for ws in eager.subroutines]
+#end testSameAsEager(html, lazyAppObj)
+
+#-----------------------------------------------------------------------------
+def testMaterializeAll(lazyAppObj):
+  main = lazyAppObj.subroutines[0]
+  main.materialize()
+  
+  materializeAll(lazyAppObj.subroutines)
+  
+  assert not any(isinstance(ws, LazySubroutine) for ws in lazyAppObj.subroutines)
+  assert lazyAppObj.subroutines[0] is main
+#end testMaterializeAll(lazyAppObj)
+
+#-----------------------------------------------------------------------------
+#dunders looked up by copy, pickle, etc. don't parse
+def testDunderLookupsDontParse(lazyAppObj):
+  ws = lazyAppObj.subroutines[0]
+  
+  assert not hasattr(ws, '__getstate_missing__')
+  assert isinstance(ws, LazySubroutine)
+#end testDunderLookupsDontParse(lazyAppObj)
+
+#-----------------------------------------------------------------------------
+def testLazyClassMadeOnce():
+  assert lazyClassFor(Subroutine) is lazyClassFor(Subroutine)
+  assert lazyClassFor(Subroutine) is not lazyClassFor(ExceptionHandler)
+#end testLazyClassMadeOnce()
+#-----------------------------------------------------------------------------
+#err codes of a workspace parsed after fromHtml(...) returned still reach
+#  pseudify.errCode_, so the exit status doesn't depend on being lazy
+def testMaterializeErrCodeReachesPseudify(monkeypatch):
+  monkeypatch.setattr(pseudify, 'errCode_', pseudify.NONE)
+  lazyAppObj = pseudify.AppObject.fromHtml(
+    SampleReports.report(unknownStep=True), lazy=True
+  )
+  assert not pseudify.errCode_ & pseudify.UNEXPECTED_STEP_TYPE
+  
+  assert lazyAppObj.subroutines[0].steps
+  assert pseudify.errCode_ & pseudify.UNEXPECTED_STEP_TYPE
+#end testMaterializeErrCodeReachesPseudify(monkeypatch)
\ No newline at end of file
@@ -0,0 +1,86 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import pytest
+
+import pseudify
+
+##############################################################################
+#FIXTURES
+##############################################################################
+#-----------------------------------------------------------------------------
+@pytest.fixture
+def appObj(cycleReportPath):
+  return pseudify.parseFile(cycleReportPath)
+#end appObj(cycleReportPath)
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+@pytest.mark.parametrize('key', ['Sub2', '#Sub2', 'Sub2:#Sub2', 'stale name:#Sub2'])
+def testGetSubroutine(appObj, key):
+  assert appObj.getSubroutine(key) is appObj.subroutines[3]
+#end testGetSubroutine(appObj, key)
+
+#-----------------------------------------------------------------------------
+@pytest.mark.parametrize('key', ['gOther', 'g1', '#g1', 'gOther:#g1'])
+def testGetGlobalObj(appObj, key):
+  assert appObj.getGlobalObj(key) is appObj.globalObjs[1]
+#end testGetGlobalObj(appObj, key)
+
+#-----------------------------------------------------------------------------
+@pytest.mark.parametrize('key', ['Nope', 'Nope:#nope', None])
+def testMissingKeys(appObj, key):
+  assert appObj.getSubroutine(key) is None
+  assert appObj.getGlobalObj(key) is None
+  assert appObj.resolveRef(key) is None
+#end testMissingKeys(appObj, key)
+
+#-----------------------------------------------------------------------------
+def testGetStep(appObj):
+  main = appObj.getSubroutine('Main')
+  sf2  = main.subflows[0].subflows[0]
+  
+  assert appObj.getStep('Main', 'Main_s4') is main.steps[3]
+  assert appObj.getStep('Main', '#Main_s4') is main.steps[3]
+  #subflows are looked up by name too
+  assert appObj.getStep('SF2', 'SF2_s7') is sf2.steps[6]
+  assert appObj.getStep('Main', 'SF2_s7') is None
+  assert appObj.getStep('Nope', 'Main_s4') is None
+#end testGetStep(appObj)
+
+#-----------------------------------------------------------------------------
+#every kind of anchor a step target can point at
+def testResolveRef(appObj):
+  main = appObj.getSubroutine('Main')
+  sf1  = main.subflows[0]
+  
+  #the targets kept by Main's call, goto and subflow steps
+  assert appObj.resolveRef(main.steps[3].target) is appObj.getSubroutine('Sub0')
+  assert appObj.resolveRef(main.steps[4].target) is main.steps[6]
+  assert appObj.resolveRef(main.steps[5].target) is sf1
+  
+  assert appObj.resolveRef('#g0') is appObj.globalObjs[0]
+  assert appObj.resolveRef('Main_l1') is main.localObjs[0]
+  assert appObj.resolveRef('SF1_s2') is sf1.steps[1]
+  #no anchor falls back to names
+  assert appObj.resolveRef('Sub1') is appObj.getSubroutine('Sub1')
+  assert appObj.resolveRef('gOther') is appObj.globalObjs[1]
+#end testResolveRef(appObj)
+
+#-----------------------------------------------------------------------------
+def testReindex(appObj):
+  dropped = appObj.subroutines.pop(1)
+  appObj.getStep('Sub1', 'Sub1_s1')
+  appObj.resolveRef('Sub0_s1')
+  
+  #tables are stale until reindexed
+  assert appObj.getSubroutine('Sub0') is dropped
+  
+  appObj.reindex()
+  assert appObj.getSubroutine('Sub0') is None
+  assert appObj.resolveRef('Sub0_s1') is None
+  assert appObj.getStep('Sub0', 'Sub0_s1') is None
+  assert appObj.getSubroutine('Sub1') is appObj.subroutines[1]
+#end testReindex(appObj)
\ No newline at end of file
@@ -0,0 +1,53 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import os
+import sys
+
+import pseudify
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+import memory
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#yields every Step, Branch, Param and EdifyObject of AppObject appObj
+def iterModelObjects(appObj):
+  yield from appObj.props['parameters']
+  yield from appObj.globalObjs
+  
+  #loop thru workspaces
+  for ws in appObj.subroutines:
+    yield from ws.entryParams or []
+    yield from ws.localObjs or []
+    #loop thru steps
+    for step in ws.steps:
+      yield step
+      yield from getattr(step, 'branches', None) or []
+    #end loop thru steps
+  #end loop thru workspaces
+#end iterModelObjects(appObj)
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+def testModelHasNoInstanceDicts(reportPath):
+  appObj = pseudify.parseFile(reportPath)
+  
+  objs = list(iterModelObjects(appObj))
+  assert {type(obj).__name__ for obj in objs} >= {
+    'Param', 'EdifyObject', 'Branch', 'StartStep', 'AssignStep',
+    'ChooseStep', 'CallStep', 'GotoStep', 'SubflowStep', 'EndStep'
+  }
+  assert [obj for obj in objs if hasattr(obj, '__dict__')] == []
+#end testModelHasNoInstanceDicts(reportPath)
+
+#-----------------------------------------------------------------------------
+#small run of benchmarks/memory.py
+def testSlotsTakeLessMemory():
+  before, after = memory.bytesPerStep(2000)
+  assert after < before
+#end testSlotsTakeLessMemory()
\ No newline at end of file
@@ -0,0 +1,53 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import io
+
+import pytest
+
+import pseudify
+import SampleReports
+
+##############################################################################
+#CONSTANTS
+##############################################################################
+#kwargs of SampleReports.report(...) for each sample report
+SAMPLE_REPORTS = {
+  'small': {},
+  'noSubroutines': {'nSubs': 0},
+  'cycle': {'nSubs': 6, 'cycle': True},
+}
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+def parseRepr(html, parser, stream=False):
+  appObj = pseudify.parseReport(io.StringIO(html), 'sample', parser, stream)
+  return repr(appObj)
+#end parseRepr(html, parser, stream)
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+#every tree builder has to yield the same AppObject as html.parser
+@pytest.mark.parametrize('stream', [False, True], ids=['whole', 'stream'])
+@pytest.mark.parametrize('sample', SAMPLE_REPORTS)
+@pytest.mark.parametrize('parser', pseudify.HTML_PARSERS)
+def testParsersAgree(parser, sample, stream):
+  if parser != 'html.parser':
+    pytest.importorskip(parser)
+  
+  html = SampleReports.report(**SAMPLE_REPORTS[sample])
+  assert parseRepr(html, parser, stream) == parseRepr(html, 'html.parser')
+#end testParsersAgree(parser, sample, stream)
+
+#-----------------------------------------------------------------------------
+def testMissingParserFallsBack(monkeypatch, capsys):
+  monkeypatch.setattr(pseudify.importlib.util, 'find_spec', lambda name: None)
+  
+  assert pseudify.resolveHtmlParser('lxml') == 'html.parser'
+  assert 'not installed' in capsys.readouterr().err
+  assert pseudify.resolveHtmlParser() == 'html.parser'
+#end testMissingParserFallsBack(monkeypatch, capsys)
\ No newline at end of file
@@ -0,0 +1,112 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import io
+
+import pytest
+
+import pseudify
+import SampleReports
+from Edify.Output.Pseudocode import iterPseudocode, iterSteps, emitOtherStep
+
+##############################################################################
+#FIXTURES
+##############################################################################
+#-----------------------------------------------------------------------------
+#pseudocode of the sample report as a list of lines without '\n'
+@pytest.fixture
+def lines():
+  appObj = pseudify.AppObject.fromHtml(SampleReports.report(unknownStep=True))
+  return ''.join(iterPseudocode(appObj)).splitlines()
+#end lines()
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#returns lines from the one equal to header thru the next END line
+def block(lines, header):
+  start = lines.index(header)
+  end = next(i for i in range(start, len(lines)) if lines[i].startswith('END '))
+  return lines[start:end+1]
+#end block(lines, header)
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+def testAppHeader(lines):
+  assert lines[:5] == [
+    'APPLICATION App',
+    '  # Version: 1',
+    '  PARAM in String ap = d',
+    'GLOBAL String gCallerANI',
+    'GLOBAL Number gOther = 0',
+  ]
+#end testAppHeader(lines)
+
+#-----------------------------------------------------------------------------
+#steps are separated into basic blocks by blank lines
+def testEntryWorkspace(lines):
+  assert block(lines, 'ENTRY WORKSPACE Main(in String p1 = x)') == [
+    'ENTRY WORKSPACE Main(in String p1 = x)',
+    '  ON EXCEPTION E1 GOTO XH',
+    '  LOCAL String lObj',
+    '  1: START()  # lbl1',
+    '  2: gCallerANI = gOther  # lbl2',
+    '  3: CHOOSE IF cond one GOTO 5  # lbl3',
+    '',
+    '  4: CALL Sub0(p1 = gCallerANI)  # lbl4',
+    '',
+    '  5: GOTO 7  # lbl5',
+    '',
+    '  6: SUBFLOW SF1  # lbl6; unreachable',
+    '',
+    '  7: RETURN Normal  # lbl7',
+    '',
+    "  8: PLAY PROMPT 'Prompt = hello'  # lbl8; unreachable",
+    'END ENTRY WORKSPACE',
+  ]
+#end testEntryWorkspace(lines)
+
+#-----------------------------------------------------------------------------
+def testWorkspaceKinds(lines):
+  headers = [line for line in lines if line and not line.startswith(' ')]
+  
+  assert [line for line in headers if line.startswith(('SUBROUTINE', 'EXCEPTION'))] == [
+    'SUBROUTINE Sub0(in String p1 = x)',
+    'SUBROUTINE Sub1(in String p1 = x)',
+    'SUBROUTINE Sub2(in String p1 = x)',
+    'EXCEPTION HANDLER XH(in String p1 = x)',
+  ]
+  assert '  4: SYSTEM FUNCTION Foo  # lbl4' in block(lines, 'SUBROUTINE Sub1(in String p1 = x)')
+#end testWorkspaceKinds(lines)
+
+#-----------------------------------------------------------------------------
+#Main, Sub0 and Sub2 invoke SF1 (which invokes SF2), each is written once
+#  right after the 1st workspace reaching it
+def testSubflowsWrittenOnce(lines):
+  assert lines.count('SUBFLOW SF1') == 1
+  assert lines.count('SUBFLOW SF2') == 1
+  assert lines.index('END ENTRY WORKSPACE') < lines.index('SUBFLOW SF1') \
+    < lines.index('SUBFLOW SF2') < lines.index('SUBROUTINE Sub0(in String p1 = x)')
+  assert block(lines, 'SUBFLOW SF2')[-3:] == ['', '  7: RETURN Normal  # lbl7', 'END SUBFLOW']
+#end testSubflowsWrittenOnce(lines)
+
+#-----------------------------------------------------------------------------
+def testWritePseudocodeFormat():
+  appObj = pseudify.AppObject.fromHtml(SampleReports.report())
+  outFile = io.StringIO()
+  
+  pseudify.writeAppObj(appObj, outFile, 'pseudocode')
+  assert outFile.getvalue() == ''.join(iterPseudocode(appObj))
+#end testWritePseudocodeFormat()
+
+#-----------------------------------------------------------------------------
+def testEmitOtherStep():
+  appObj = pseudify.AppObject.fromHtml(SampleReports.report(unknownStep=True))
+  unknown = appObj.getSubroutine('Main').steps[-1]
+  
+  assert emitOtherStep(unknown) == "PLAY PROMPT 'Prompt = hello'"
+  assert list(iterSteps([])) == []
+#end testEmitOtherStep()
\ No newline at end of file
@@ -0,0 +1,129 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import pytest
+
+import pseudify
+from Edify.Output import Snapshot
+from Edify.Utils.Errors import EdifyParseError
+
+##############################################################################
+#FIXTURES
+##############################################################################
+#-----------------------------------------------------------------------------
+@pytest.fixture
+def appObj(cycleReportPath):
+  return pseudify.parseFile(cycleReportPath)
+#end appObj(cycleReportPath)
+
+#-----------------------------------------------------------------------------
+#path of appObj dumped as a snapshot
+@pytest.fixture
+def snapshotPath(appObj, tmp_path):
+  path = str(tmp_path / 'report.snap')
+  appObj.dump(path)
+  return path
+#end snapshotPath(appObj, tmp_path)
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#rewrites the header of the snapshot at path with field i set to val
+def patchHeader(path, i, val):
+  with open(path, 'r+b') as snapFile:
+    fields = list(Snapshot.HEADER.unpack(snapFile.read(Snapshot.HEADER.size)))
+    fields[i] = val
+    snapFile.seek(0)
+    snapFile.write(Snapshot.HEADER.pack(*fields))
+#end patchHeader(path, i, val)
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+def testRoundTrip(appObj, snapshotPath):
+  loaded = pseudify.AppObject.load(snapshotPath)
+  
+  assert repr(loaded) == repr(appObj)
+  #workspaces invoking the same subflow share it again
+  assert loaded.getSubroutine('Main').subflows[0] is loaded.getSubroutine('Sub0').subflows[0]
+#end testRoundTrip(appObj, snapshotPath)
+
+#-----------------------------------------------------------------------------
+def testReaderLoadsWorkspacesByKey(appObj, snapshotPath):
+  with Snapshot.SnapshotReader(snapshotPath) as reader:
+    assert len(reader) == len(appObj.subroutines)
+    assert reader.names == [ws.name for ws in appObj.subroutines]
+    
+    assert repr(reader.getSubroutine('Sub2')) == repr(appObj.getSubroutine('Sub2'))
+    assert repr(reader.getSubroutine(-1)) == repr(appObj.subroutines[-1])
+    #only the subflows reached so far are decoded
+    assert set(reader.subflowsByRef) == {'SF1', 'SF2'}
+    
+    for key in ('Nope', len(reader), -len(reader)-1):
+      with pytest.raises(EdifyParseError) as excInfo:
+        reader.getSubroutine(key)
+      assert excInfo.value.errCode == Snapshot.NO_SUCH_WORKSPACE
+#end testReaderLoadsWorkspacesByKey(appObj, snapshotPath)
+
+#-----------------------------------------------------------------------------
+@pytest.mark.parametrize('content', [b'', b'not a snapshot', b'X' * 200])
+def testNotASnapshot(tmp_path, content):
+  path = tmp_path / 'bad.snap'
+  path.write_bytes(content)
+  
+  with pytest.raises(EdifyParseError) as excInfo:
+    Snapshot.SnapshotReader(str(path))
+  assert excInfo.value.errCode == Snapshot.NOT_A_SNAPSHOT
+#end testNotASnapshot(tmp_path, content)
+
+#-----------------------------------------------------------------------------
+#header fields: magic, snapshot, schema and marshal versions, python version
+@pytest.mark.parametrize('field,val', [
+  (1, Snapshot.SNAPSHOT_VERSION + 1),
+  (2, 1 << 20),
+  (3, Snapshot.MARSHAL_VERSION + 1),
+  (4, Snapshot.PYTHON_VERSION[0] + 1),
+  (5, Snapshot.PYTHON_VERSION[1] + 1),
+], ids=['snapshot', 'schema', 'marshal', 'pythonMajor', 'pythonMinor'])
+def testOtherVersionIsRejected(snapshotPath, field, val):
+  patchHeader(snapshotPath, field, val)
+  
+  with pytest.raises(EdifyParseError) as excInfo:
+    pseudify.AppObject.load(snapshotPath)
+  assert excInfo.value.errCode == Snapshot.UNSUPPORTED_VERSION
+#end testOtherVersionIsRejected(snapshotPath, field, val)
+#-----------------------------------------------------------------------------
+#a valid header with a cut off body fails like a bad export, not with
+#  whatever marshal raises
+@pytest.mark.parametrize(
+  'keep', [0, 1, 64, -1], ids=['header', 'headerPlus1', 'someBody', 'allButLast']
+)
+def testTruncatedBodyIsRejected(snapshotPath, keep):
+  with open(snapshotPath, 'r+b') as snapFile:
+    size = snapFile.seek(0, 2)
+    snapFile.truncate(Snapshot.HEADER.size + keep if keep >= 0 else size + keep)
+  
+  with pytest.raises(EdifyParseError) as excInfo:
+    pseudify.AppObject.load(snapshotPath)
+  assert excInfo.value.errCode == Snapshot.BAD_RECORD
+  assert pseudify.errCodeOf(excInfo.value) == pseudify.BAD_EXPORT
+#end testTruncatedBodyIsRejected(snapshotPath, keep)
+
+#-----------------------------------------------------------------------------
+#a garbled record is only noticed when it is decoded
+def testCorruptRecordIsRejected(snapshotPath):
+  with open(snapshotPath, 'r+b') as snapFile:
+    fields = Snapshot.HEADER.unpack(snapFile.read(Snapshot.HEADER.size))
+    appOffset, appLen = fields[8:10]
+    snapFile.seek(appOffset)
+    snapFile.write(b'\xff' * appLen)
+  
+  with Snapshot.SnapshotReader(snapshotPath) as reader:
+    with pytest.raises(EdifyParseError) as excInfo:
+      reader.getApp()
+    assert excInfo.value.errCode == Snapshot.BAD_RECORD
+    #the rest of the snapshot still loads
+    assert reader.getSubroutine('Main').name == 'Main'
+#end testCorruptRecordIsRejected(snapshotPath)
\ No newline at end of file
@@ -0,0 +1,122 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import gc
+import io
+import weakref
+
+import pytest
+
+import pseudify
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#yields (path, obj) for obj and everything reachable from it thru
+#  slots, instance dicts, lists, tuples, sets and dicts
+def walk(obj, path='appObj', seen=None):
+  seen = set() if seen is None else seen
+  if id(obj) in seen:
+    return
+  seen.add(id(obj))
+  yield path, obj
+  
+  if isinstance(obj, dict):
+    for key, val in obj.items():
+      yield from walk(key, f'{path}.keys()', seen)
+      yield from walk(val, f'{path}[{key!r}]', seen)
+  elif isinstance(obj, (list, tuple, set)):
+    for i, val in enumerate(obj):
+      yield from walk(val, f'{path}[{i}]', seen)
+  elif not isinstance(obj, (str, int, float, bool, type(None))):
+    #loop thru classes for their slots
+    for ObjClass in type(obj).__mro__:
+      for slot in ObjClass.__dict__.get('__slots__', ()):
+        if hasattr(obj, slot):
+          yield from walk(getattr(obj, slot), f'{path}.{slot}', seen)
+    #end loop thru classes for their slots
+    for attr, val in getattr(obj, '__dict__', {}).items():
+      yield from walk(val, f'{path}.{attr}', seen)
+  #end if kind of obj
+#end walk(obj, path, seen)
+
+#-----------------------------------------------------------------------------
+#returns list of paths of everything from bs4 reachable from obj
+#  NavigableString is a str subclass so it is caught by its module too
+def bs4Paths(obj):
+  return [
+    path for path, val in walk(obj)
+    if type(val).__module__.split('.')[0] == 'bs4'
+  ]
+#end bs4Paths(obj)
+
+##############################################################################
+#FIXTURES
+##############################################################################
+#-----------------------------------------------------------------------------
+#list of weakrefs to every soup made while parsing
+@pytest.fixture
+def soupRefs(monkeypatch):
+  refs = []
+  RealSoup = pseudify.BeautifulSoup
+  
+  def recordingSoup(*args, **kwargs):
+    soup = RealSoup(*args, **kwargs)
+    refs.append(weakref.ref(soup))
+    return soup
+  #end recordingSoup(*args, **kwargs)
+  
+  monkeypatch.setattr(pseudify, 'BeautifulSoup', recordingSoup)
+  return refs
+#end soupRefs(monkeypatch)
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+@pytest.mark.parametrize('stream', [False, True], ids=['whole', 'stream'])
+def testAppObjectHoldsNoBs4(cycleReportPath, stream):
+  appObj = pseudify.parseFile(cycleReportPath, stream=stream)
+  
+  assert len(list(walk(appObj))) > 100
+  assert bs4Paths(appObj) == []
+#end testAppObjectHoldsNoBs4(cycleReportPath, stream)
+
+#-----------------------------------------------------------------------------
+#releaseSoup(...) breaks the tree up, so the soup is freed without waiting
+#  for the cyclic garbage collector
+#  html5lib's own tree builder keeps a cycle thru the soup, that one is only
+#  checked to be collectable
+@pytest.mark.parametrize('parser', pseudify.HTML_PARSERS)
+def testSoupFreedWhenFromHtmlReturns(cycleReportPath, soupRefs, parser):
+  if parser != 'html.parser':
+    pytest.importorskip(parser)
+  with open(cycleReportPath) as inFile:
+    html = pseudify.closeParagraphs(inFile.read())
+  
+  gc.disable()
+  try:
+    appObj = pseudify.AppObject.fromHtml(html, parser)
+    assert len(soupRefs) == 1
+    if parser != 'html5lib':
+      assert soupRefs[0]() is None
+  finally:
+    gc.enable()
+  #end try parse with the cyclic garbage collector off
+  
+  gc.collect()
+  assert soupRefs[0]() is None
+  assert appObj.subroutines
+#end testSoupFreedWhenFromHtmlReturns(cycleReportPath, soupRefs, parser)
+
+#-----------------------------------------------------------------------------
+def testSectionSoupsCollectableAfterStream(cycleReportPath, soupRefs):
+  with open(cycleReportPath) as inFile:
+    appObj = pseudify.AppObject.fromHtmlStream(io.StringIO(inFile.read()))
+  gc.collect()
+  
+  assert soupRefs
+  assert [ref for ref in soupRefs if ref() is not None] == []
+  assert appObj.subroutines
+#end testSectionSoupsCollectableAfterStream(cycleReportPath, soupRefs)
\ No newline at end of file
@@ -0,0 +1,34 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import os
+import sys
+
+import pytest
+
+from Edify.Utils.Constants import ALL_WHITESPACE_STR
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+import startup
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+#wall clock, so only run when asked to, e.g. on a quiet machine
+#  EDIFY_BENCHMARKS=1 python -m pytest tests/test_startup.py
+@pytest.mark.skipif(
+  not os.environ.get('EDIFY_BENCHMARKS'), reason='set EDIFY_BENCHMARKS=1 to run'
+)
+def testImportUnderBudget():
+  assert startup.importMs(runs=3) < startup.DEFAULT_BUDGET_MS
+#end testImportUnderBudget()
+
+#-----------------------------------------------------------------------------
+#the frozen literal has to match what it replaced
+def testWhitespaceTableIsComplete():
+  expected = ''.join(
+    chr(d) for d in range(sys.maxunicode+1) if chr(d).isspace()
+  )
+  assert ALL_WHITESPACE_STR == expected
+#end testWhitespaceTableIsComplete()
\ No newline at end of file
@@ -0,0 +1,83 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import io
+import os
+import pickle
+import tempfile
+
+import pytest
+
+import pseudify
+import SampleReports
+from Edify.Utils.Streaming import SectionStore, iterSections
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+def testSectionStore():
+  store = SectionStore()
+  try:
+    store.add('SF1', '<h2>Subflow: SF1</h2>é')
+    store.add('SF2', '<h2>Subflow: SF2</h2>')
+    store.add('SF1', 'not kept')
+    
+    assert dict(store) == {'SF1': '<h2>Subflow: SF1</h2>é', 'SF2': '<h2>Subflow: SF2</h2>'}
+    assert store.get('SF3') is None
+    #copies read the same file thru their own file object
+    for copy in (store.reader(), pickle.loads(pickle.dumps(store))):
+      assert copy['SF2'] == '<h2>Subflow: SF2</h2>'
+      copy.close()
+      assert os.path.exists(store.path)
+  finally:
+    store.close()
+  #end try use store
+  
+  assert not os.path.exists(store.path)
+#end testSectionStore()
+
+#-----------------------------------------------------------------------------
+def testSplitterReadsCaptions():
+  sections = list(iterSections(io.StringIO(SampleReports.report())))
+  
+  assert sections[0].captions == []
+  assert [section.captions for section in sections if section.anchor == 'SF1'] == [
+    ['Steps', 'Entry Parameters', 'Local Objects']
+  ]
+  assert 'Workspace List' in [
+    caption for section in sections for caption in section.captions
+  ]
+#end testSplitterReadsCaptions()
+
+#-----------------------------------------------------------------------------
+#sections with no tables for the app object aren't made into soups, and each
+#  subflow's section is made into one once, when a workspace invokes it
+def testSubflowSectionsSoupedOnce(monkeypatch):
+  htmlLst = []
+  makeSoup = pseudify.makeSoup
+  monkeypatch.setattr(
+    pseudify, 'makeSoup', lambda html, parser: htmlLst.append(html) or makeSoup(html, parser)
+  )
+  
+  pseudify.AppObject.fromHtmlStream(io.StringIO(SampleReports.report(nSubs=4, cycle=True)))
+  
+  headers = [html[:html.index('</h2>')] for html in htmlLst]
+  #props, global objects, workspace list and 6 workspaces
+  assert len(headers) == 9 + 2
+  assert sum('Subflow: ' in header for header in headers) == 2
+  assert len(set(headers)) == len(headers)
+#end testSubflowSectionsSoupedOnce(monkeypatch)
+
+#-----------------------------------------------------------------------------
+@pytest.mark.parametrize('wsJobs', [None, 2], ids=['serial', 'wsJobs'])
+def testSectionStoreRemoved(monkeypatch, tmp_path, wsJobs):
+  monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+  
+  appObj = pseudify.AppObject.fromHtmlStream(
+    io.StringIO(SampleReports.report(nSubs=4, cycle=True)), wsJobs=wsJobs
+  )
+  
+  assert appObj.getSubroutine('Sub2').subflows[0].subflows[0].name == 'SF2'
+  assert [name for name in os.listdir(tmp_path) if name.endswith('.sections')] == []
+#end testSectionStoreRemoved(monkeypatch, tmp_path, wsJobs)
\ No newline at end of file
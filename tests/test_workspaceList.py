@@ -0,0 +1,104 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import pytest
+
+import pseudify
+import SampleReports
+
+##############################################################################
+#CONSTANTS
+##############################################################################
+#Workspace List row of Sub1 in SampleReports.report(...) and one that says
+#  something else, so it shows which row each workspace got
+SUB1_ROW = (
+  '<tr><td><strong>Sub1</strong></td>'
+  '<td><strong>Exception Workspaces: </strong>XH<br>'
+  '<strong>Called by: </strong>Main</td></tr>'
+)
+OTHER_SUB1_ROW = (
+  '<tr><td><strong>Sub1</strong></td>'
+  '<td><strong>Called by: </strong>Sub0</td></tr>'
+)
+
+#row for a workspace the report has no header for
+GHOST_ROW = (
+  '<tr><td><strong>Ghost</strong></td>'
+  '<td><strong>Called by: </strong>Main</td></tr>'
+)
+
+#keyword args of pseudify.parseFile(...) for each way of parsing a report
+PARSE_MODES = {
+  'whole': {},
+  'stream': {'stream': True},
+  'wsJobs': {'stream': True, 'wsJobs': 2},
+}
+
+##############################################################################
+#FUNCTIONS
+##############################################################################
+#-----------------------------------------------------------------------------
+#writes a sample report with row SUB1_ROW replaced by sub1Row, and returns its path
+def writeListedReport(dirPath, sub1Row):
+  reportPath = dirPath / 'listed.html'
+  reportPath.write_text(SampleReports.report().replace(SUB1_ROW, sub1Row, 1))
+  return str(reportPath)
+#end writeListedReport(dirPath, sub1Row)
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+@pytest.mark.parametrize('mode', PARSE_MODES)
+def testRowsMergedIntoWorkspaces(tmp_path, mode):
+  reportPath = writeListedReport(tmp_path, OTHER_SUB1_ROW)
+  
+  appObj = pseudify.parseFile(reportPath, **PARSE_MODES[mode])
+  
+  byName = {ws.name: ws for ws in appObj.subroutines}
+  assert set(byName) == {'Main', 'Sub0', 'Sub1', 'Sub2', 'XH'}
+  #loop thru workspaces with the same row
+  for wsName in ('Main', 'Sub0', 'Sub2', 'XH'):
+    assert byName[wsName].calledBy == ['Main']
+    assert byName[wsName].exceptionWorkspaces == ['XH']
+  #end loop thru workspaces with the same row
+  assert byName['Sub1'].calledBy == ['Sub0']
+  assert not byName['Sub1'].exceptionWorkspaces
+#end testRowsMergedIntoWorkspaces(tmp_path, mode)
+
+#-----------------------------------------------------------------------------
+#lazy proxies get their row without being parsed
+def testRowsMergedIntoLazyWorkspaces(tmp_path):
+  html = SampleReports.report().replace(SUB1_ROW, OTHER_SUB1_ROW, 1)
+  
+  appObj = pseudify.AppObject.fromHtml(html, lazy=True)
+  
+  sub1 = appObj.getSubroutine('Sub1')
+  assert sub1.calledBy == ['Sub0']
+  assert appObj.getSubroutine('Sub0').calledBy == ['Main']
+  #and keep it once parsed
+  assert sub1.steps
+  assert sub1.calledBy == ['Sub0']
+#end testRowsMergedIntoLazyWorkspaces(tmp_path)
+
+#-----------------------------------------------------------------------------
+#rows naming no parsed workspace are warned about on stderr, not dropped silently
+@pytest.mark.parametrize('mode', PARSE_MODES)
+def testUnmatchedRowWarns(tmp_path, capsys, mode):
+  reportPath = writeListedReport(tmp_path, SUB1_ROW + GHOST_ROW)
+  
+  appObj = pseudify.parseFile(reportPath, **PARSE_MODES[mode])
+  out, err = capsys.readouterr()
+  
+  assert 'Ghost' not in [ws.name for ws in appObj.subroutines]
+  assert '"Workspace List" table names workspaces with no header' in err
+  assert "['Ghost']" in err
+  assert 'Ghost' not in out
+#end testUnmatchedRowWarns(tmp_path, capsys, mode)
+
+#-----------------------------------------------------------------------------
+def testMatchedRowsDontWarn(reportPath, capsys):
+  pseudify.parseFile(reportPath)
+  
+  assert 'Workspace List' not in capsys.readouterr().err
+#end testMatchedRowsDontWarn(reportPath, capsys)
\ No newline at end of file
@@ -0,0 +1,72 @@
+##############################################################################
+#IMPORTS
+##############################################################################
+import pytest
+
+import pseudify
+import SampleReports
+from Edify.Analysis.XRef import XRef, ObjectUse, READ, WRITE, USE
+
+##############################################################################
+#CONSTANTS
+##############################################################################
+#every workspace and subflow of the sample report, in the order indexed
+#  subflows right after the 1st workspace invoking them
+FLOW_NAMES = ['Main', 'SF1', 'SF2', 'Sub0', 'Sub1', 'Sub2', 'XH']
+
+##############################################################################
+#FIXTURES
+##############################################################################
+#-----------------------------------------------------------------------------
+@pytest.fixture
+def xref():
+  return XRef(pseudify.AppObject.fromHtml(SampleReports.report(cycle=True)))
+#end xref()
+
+##############################################################################
+#TESTS
+##############################################################################
+#-----------------------------------------------------------------------------
+#step 2 of every flow assigns gOther to gCallerANI
+#  SF1 is invoked by Main, Sub0 and Sub2 but its steps are indexed once
+@pytest.mark.parametrize('obj', ['gCallerANI', 'g0'])
+def testWriters(xref, obj):
+  assert xref.writers(obj) == [ObjectUse(name, '2', WRITE) for name in FLOW_NAMES]
+#end testWriters(xref, obj)
+
+#-----------------------------------------------------------------------------
+def testReaders(xref):
+  assert xref.readers('gOther') == [ObjectUse(name, '2', READ) for name in FLOW_NAMES]
+  assert xref.writers('gOther') == []
+#end testReaders(xref)
+
+#-----------------------------------------------------------------------------
+#Main's step 4 calls Sub0 passing gCallerANI as p1
+def testCallParamsRead(xref):
+  assert xref.readers('gCallerANI') == [ObjectUse('Main', '4', READ)]
+#end testCallParamsRead(xref)
+
+#-----------------------------------------------------------------------------
+#"Used by" of gCallerANI names Main and Sub0
+def testUsedBy(xref):
+  assert xref.lookup('gCallerANI', USE) == [ObjectUse('Main', None, USE), ObjectUse('Sub0', None, USE)]
+  assert xref.usesOf('gCallerANI') == (
+    xref.writers('gCallerANI') + xref.readers('gCallerANI') + xref.lookup('g0', USE)
+  )
+#end testUsedBy(xref)
+
+#-----------------------------------------------------------------------------
+#each workspace has its own local object named lObj
+def testLocalObjectsShareName(xref):
+  assert xref.refsOf('lObj') == ['Main_l1', 'Sub0_l1', 'Sub1_l1', 'Sub2_l1', 'XH_l1']
+  assert xref.lookup('lObj', USE) == [
+    ObjectUse(name, None, USE) for name in ['Main', 'Sub0', 'Sub1', 'Sub2', 'XH']
+  ]
+  assert xref.lookup('Sub1_l1', USE) == [ObjectUse('Sub1', None, USE)]
+#end testLocalObjectsShareName(xref)
+
+#-----------------------------------------------------------------------------
+def testUnknownObject(xref):
+  assert xref.refsOf('nope') == ['nope']
+  assert xref.usesOf('nope') == []
+#end testUnknownObject(xref)
\ No newline at end of file